@@ -0,0 +1,27 @@
+"""Add scheduling priority to training_runs.
+
+Revision ID: 20251019_01
+Revises: 20250101_02
+Create Date: 2025-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20251019_01"
+down_revision = "20250101_02"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "training_runs",
+        sa.Column("priority", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("training_runs", "priority")
@@ -0,0 +1,56 @@
+"""Add fair-share queue ordering to training_runs.
+
+Revision ID: 20251019_02
+Revises: 20251019_01
+Create Date: 2025-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20251019_02"
+down_revision = "20251019_01"
+branch_labels = None
+depends_on = None
+
+WAITING = sa.text("status IN ('pending', 'queued')")
+
+
+def upgrade() -> None:
+    op.add_column(
+        "training_runs",
+        sa.Column("queue_seq", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+    # Place already waiting runs in per-owner rounds by submission time
+    op.execute(
+        """
+        UPDATE training_runs AS t
+        SET queue_seq = ranked.seq
+        FROM (
+            SELECT id, row_number() OVER (PARTITION BY owner_id ORDER BY created_at, id) AS seq
+            FROM training_runs
+            WHERE status IN ('pending', 'queued')
+        ) AS ranked
+        WHERE t.id = ranked.id
+        """
+    )
+    op.create_index(
+        "ix_training_runs_claim",
+        "training_runs",
+        ["queue_seq", sa.text("priority DESC"), "id"],
+        postgresql_where=WAITING,
+    )
+    op.create_index(
+        "ix_training_runs_owner_queue",
+        "training_runs",
+        ["owner_id", "queue_seq"],
+        postgresql_where=WAITING,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_training_runs_owner_queue", table_name="training_runs")
+    op.drop_index("ix_training_runs_claim", table_name="training_runs")
+    op.drop_column("training_runs", "queue_seq")
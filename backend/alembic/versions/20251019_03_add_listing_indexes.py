@@ -0,0 +1,43 @@
+"""Add indexes for run and dataset listing.
+
+Revision ID: 20251019_03
+Revises: 20251019_02
+Create Date: 2025-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20251019_03"
+down_revision = "20251019_02"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_datasets_owner_created",
+        "datasets",
+        ["owner_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.create_index(
+        "ix_training_runs_owner_created",
+        "training_runs",
+        ["owner_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    op.create_index(
+        "ix_training_runs_running_owner",
+        "training_runs",
+        ["owner_id"],
+        postgresql_where=sa.text("status = 'running'"),
+    )
+    op.create_index("ix_training_runs_dataset_id", "training_runs", ["dataset_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_training_runs_dataset_id", table_name="training_runs")
+    op.drop_index("ix_training_runs_running_owner", table_name="training_runs")
+    op.drop_index("ix_training_runs_owner_created", table_name="training_runs")
+    op.drop_index("ix_datasets_owner_created", table_name="datasets")
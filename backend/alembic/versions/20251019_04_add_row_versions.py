@@ -0,0 +1,29 @@
+"""Add row version counters to datasets and training_runs.
+
+Revision ID: 20251019_04
+Revises: 20251019_03
+Create Date: 2025-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20251019_04"
+down_revision = "20251019_03"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    for table in ("datasets", "training_runs"):
+        op.add_column(
+            table,
+            sa.Column("version", sa.BigInteger(), nullable=False, server_default="1"),
+        )
+
+
+def downgrade() -> None:
+    for table in ("training_runs", "datasets"):
+        op.drop_column(table, "version")
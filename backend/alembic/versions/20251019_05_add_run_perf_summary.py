@@ -0,0 +1,32 @@
+"""Add perf_summary to training_runs.
+
+Revision ID: 20251019_05
+Revises: 20251019_04
+Create Date: 2025-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "20251019_05"
+down_revision = "20251019_04"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "training_runs",
+        sa.Column(
+            "perf_summary",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=True,
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("training_runs", "perf_summary")
@@ -0,0 +1,37 @@
+"""Add profiling request and artifact path to training_runs.
+
+Revision ID: 20251019_06
+Revises: 20251019_05
+Create Date: 2025-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20251019_06"
+down_revision = "20251019_05"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "training_runs",
+        sa.Column(
+            "profile_requested",
+            sa.Boolean(),
+            nullable=False,
+            server_default=sa.false(),
+        ),
+    )
+    op.add_column(
+        "training_runs",
+        sa.Column("profile_path", sa.String(length=512), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("training_runs", "profile_path")
+    op.drop_column("training_runs", "profile_requested")
@@ -0,0 +1,131 @@
+"""Short-lived cache of authenticated principals.
+
+``get_current_user`` resolves the token subject here before falling back to a
+``users`` lookup. Entries live in a per-process LRU and, when
+``PRINCIPAL_CACHE_USE_REDIS`` is set, in Redis so that API processes share
+them. Any update or delete of a user drops its entry; the TTL bounds how long
+another process may still serve the old one.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Set, Tuple
+
+from sqlalchemy import event
+
+from ..config import settings
+from ..db import models
+from .schemas import UserRead
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "pulseml:principal:"
+
+
+class PrincipalCache:
+    """LRU of user principals keyed by token subject, optionally backed by Redis."""
+
+    def __init__(
+        self, ttl_seconds: float, max_size: int, redis_url: Optional[str] = None
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self.redis_url = redis_url
+        self._local: OrderedDict[str, Tuple[float, UserRead]] = OrderedDict()
+        self._redis: Any = None
+        self._pending: Set[asyncio.Task] = set()
+
+    def _client(self) -> Any:
+        if self._redis is None:
+            import redis.asyncio as redis
+
+            self._redis = redis.from_url(self.redis_url)
+        return self._redis
+
+    def _remember(self, key: str, principal: UserRead) -> None:
+        self._local[key] = (time.monotonic() + self.ttl_seconds, principal)
+        self._local.move_to_end(key)
+        while len(self._local) > self.max_size:
+            self._local.popitem(last=False)
+
+    async def get(self, subject: str | int) -> Optional[models.User]:
+        """Return a detached user for ``subject`` if one is cached."""
+
+        if self.ttl_seconds <= 0:
+            return None
+        key = str(subject)
+        entry = self._local.get(key)
+        if entry and entry[0] > time.monotonic():
+            self._local.move_to_end(key)
+            return models.User(**entry[1].model_dump())
+        self._local.pop(key, None)
+
+        if not self.redis_url:
+            return None
+        try:
+            raw = await self._client().get(KEY_PREFIX + key)
+        except Exception as exc:  # Redis is an optimisation, never a hard dependency
+            logger.warning(f"Principal cache read failed: {exc}")
+            return None
+        if raw is None:
+            return None
+        principal = UserRead.model_validate_json(raw)
+        self._remember(key, principal)
+        return models.User(**principal.model_dump())
+
+    async def set(self, user: models.User) -> None:
+        """Cache ``user`` under its id."""
+
+        if self.ttl_seconds <= 0:
+            return
+        key = str(user.id)
+        principal = UserRead.model_validate(user)
+        self._remember(key, principal)
+        if not self.redis_url:
+            return
+        try:
+            await self._client().set(
+                KEY_PREFIX + key, principal.model_dump_json(), ex=max(1, int(self.ttl_seconds))
+            )
+        except Exception as exc:
+            logger.warning(f"Principal cache write failed: {exc}")
+
+    def invalidate(self, subject: str | int) -> None:
+        """Drop ``subject`` locally and, in the background, from Redis."""
+
+        key = str(subject)
+        self._local.pop(key, None)
+        if not self.redis_url:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            import redis
+
+            redis.from_url(self.redis_url).delete(KEY_PREFIX + key)
+            return
+        task = loop.create_task(self._client().delete(KEY_PREFIX + key))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    def clear(self) -> None:
+        """Drop every locally cached principal."""
+
+        self._local.clear()
+
+
+principal_cache = PrincipalCache(
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    redis_url=settings.REDIS_URL if settings.PRINCIPAL_CACHE_USE_REDIS else None,
+)
+
+
+@event.listens_for(models.User, "after_update")
+@event.listens_for(models.User, "after_delete")
+def _invalidate_changed_user(mapper, connection, target: models.User) -> None:
+    principal_cache.invalidate(target.id)
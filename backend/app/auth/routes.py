@@ -1,7 +1,7 @@
 """Auth API routes."""
 
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..dependencies import get_current_user, get_db
 from ..db import models
@@ -14,24 +14,24 @@ router = APIRouter()
 @router.post("/register", response_model=schemas.UserRead, status_code=201)
 async def register_user(
     payload: schemas.UserCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> schemas.UserRead:
     """Register a new PulseML user."""
 
     service = AuthService(db)
-    user = service.register_user(email=payload.email, password=payload.password)
+    user = await service.register_user(email=payload.email, password=payload.password)
     return schemas.UserRead.model_validate(user)
 
 
 @router.post("/login", response_model=schemas.TokenPair)
 async def login(
     payload: schemas.UserLogin,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> schemas.TokenPair:
     """Authenticate a user and return tokens."""
 
     service = AuthService(db)
-    user = service.authenticate_user(payload.email, payload.password)
+    user = await service.authenticate_user(payload.email, payload.password)
     tokens = service.create_token_pair(user)
     return schemas.TokenPair(**tokens)
 
@@ -39,12 +39,12 @@ async def login(
 @router.post("/refresh", response_model=schemas.TokenPair)
 async def refresh_tokens(
     payload: schemas.TokenRefresh,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> schemas.TokenPair:
     """Issue a new access token pair."""
 
     service = AuthService(db)
-    tokens = service.refresh_access_token(payload.refresh_token)
+    tokens = await service.refresh_access_token(payload.refresh_token)
     return schemas.TokenPair(**tokens)
 
 
@@ -9,14 +9,14 @@ from typing import Optional
 from fastapi import HTTPException, status
 from jose import JWTError, jwt
 from pydantic import BaseModel, ConfigDict
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..config import settings
 from ..core.security import (
     create_access_token,
     create_refresh_token,
-    get_password_hash,
-    verify_password,
+    password_hasher,
 )
 from ..db import models
 
@@ -36,40 +36,41 @@ class TokenPayload(BaseModel):
 class AuthService:
     """Service containing user and token helpers."""
 
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: AsyncSession) -> None:
         self.db = db
 
-    def get_user_by_email(self, email: str) -> Optional[models.User]:
+    async def get_user_by_email(self, email: str) -> Optional[models.User]:
         """Return a user by email."""
 
-        return self.db.query(models.User).filter(models.User.email == email).first()
+        return await self.db.scalar(select(models.User).where(models.User.email == email))
 
-    def get_user(self, user_id: str | int) -> Optional[models.User]:
+    async def get_user(self, user_id: str | int) -> Optional[models.User]:
         """Return a user by primary key."""
 
-        return self.db.query(models.User).filter(models.User.id == int(user_id)).first()
+        return await self.db.get(models.User, int(user_id))
 
-    def register_user(self, email: str, password: str) -> models.User:
+    async def register_user(self, email: str, password: str) -> models.User:
         """Create a new user after validating uniqueness."""
 
-        if self.get_user_by_email(email):
+        if await self.get_user_by_email(email):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered",
             )
 
-        user = models.User(email=email, password_hash=get_password_hash(password))
+        password_hash = await password_hasher.hash(password)
+        user = models.User(email=email, password_hash=password_hash)
         self.db.add(user)
-        self.db.commit()
-        self.db.refresh(user)
+        await self.db.commit()
+        await self.db.refresh(user)
         logger.info("Registered new PulseML user %s", email)
         return user
 
-    def authenticate_user(self, email: str, password: str) -> models.User:
+    async def authenticate_user(self, email: str, password: str) -> models.User:
         """Validate user credentials."""
 
-        user = self.get_user_by_email(email)
-        if not user or not verify_password(password, user.password_hash):
+        user = await self.get_user_by_email(email)
+        if not user or not await password_hasher.verify(password, user.password_hash):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect email or password",
@@ -85,7 +86,7 @@ class AuthService:
             "refresh_token": create_refresh_token(subject),
         }
 
-    def refresh_access_token(self, refresh_token: str) -> dict[str, str]:
+    async def refresh_access_token(self, refresh_token: str) -> dict[str, str]:
         """Issue a new access token if the refresh token is valid."""
 
         payload = self.decode_token(refresh_token)
@@ -95,7 +96,7 @@ class AuthService:
                 detail="Invalid refresh token",
             )
 
-        user = self.get_user(payload.sub)
+        user = await self.get_user(payload.sub)
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
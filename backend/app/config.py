@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from functools import lru_cache
-from typing import List
+from typing import List, Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -15,15 +15,60 @@ class Settings(BaseSettings):
     APP_NAME: str = "PulseML Backend"
     API_V1_PREFIX: str = "/api"
     DATABASE_URL: str = "postgresql+psycopg2://postgres:postgres@db:5432/pulseml"
+    # Async URL for the API; derived from DATABASE_URL (asyncpg) when unset.
+    ASYNC_DATABASE_URL: str | None = None
+    # Connections per API process; keep size + overflow times the number of
+    # API processes below the server's max_connections.
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
     REDIS_URL: str = "redis://redis:6379/0"
     DATA_DIR: str = "/app/data"
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # Authenticated users are cached per token subject for this long (0 disables);
+    # with the Redis flag set, API processes share the cache through REDIS_URL.
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 30
+    PRINCIPAL_CACHE_MAX_SIZE: int = 10_000
+    PRINCIPAL_CACHE_USE_REDIS: bool = False
+    # bcrypt work factor, and the threads hashing passwords off the event loop
+    # (0 means half the CPUs, leaving the rest to request handling); logins
+    # beyond the threads plus the queue limit get 429 responses.
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_THREADS: int = 0
+    PASSWORD_HASH_QUEUE_LIMIT: int = 16
     BACKEND_CORS_ORIGINS: List[str] = Field(
         default_factory=lambda: ["http://localhost:3000"]
     )
+    # Compress response bodies of at least this size; zstd needs the optional
+    # zstandard package and falls back to gzip for clients without it.
+    RESPONSE_COMPRESSION: Literal["off", "gzip", "zstd"] = "gzip"
+    RESPONSE_COMPRESSION_MIN_BYTES: int = 4096
+    # Bodies of at least this size are compressed on a worker thread so they
+    # do not stall the event loop.
+    RESPONSE_COMPRESSION_THREAD_BYTES: int = 256 * 1024
+    # Prometheus metrics: the API serves them at /metrics, the worker on its
+    # own port (0 disables the worker endpoint).
+    METRICS_ENABLED: bool = True
+    WORKER_METRICS_PORT: int = 9101
+    # Count and time the statements of every API request; statements slower
+    # than this are logged with their route (0 disables the log).
+    QUERY_STATS_ENABLED: bool = True
+    SLOW_QUERY_MS: int = 500
+    # Datasets at least this large are trained out-of-core from memmaps.
+    STREAMING_DATASET_THRESHOLD_MB: int = 1024
+    # Best-model weights up to this size stay in memory for test evaluation.
+    BEST_MODEL_IN_MEMORY_MAX_MB: int = 512
+    # Capacity the worker packs concurrent runs into; 0 means detect from the host.
+    WORKER_MAX_MEMORY_MB: int = 0
+    WORKER_MAX_THREADS: int = 0
+    WORKER_MAX_CONCURRENT_RUNS: int = 4
+    # Waiting runs the scheduler considers per claim, and how long the oldest
+    # may wait before smaller runs stop being backfilled ahead of it.
+    SCHEDULER_WINDOW: int = 100
+    SCHEDULER_STARVATION_SECONDS: int = 3600
 
     model_config = SettingsConfigDict(
         env_file=".env",
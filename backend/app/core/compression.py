@@ -0,0 +1,133 @@
+"""Response compression for large API bodies.
+
+Bodies of at least ``minimum_size`` bytes are compressed with zstd when the
+client accepts it and the optional ``zstandard`` package is installed, and
+with gzip otherwise. The coding with the highest q-value wins and codings
+refused with ``q=0`` are never used. Small, streamed, binary and already
+encoded responses pass through untouched. Bodies of at least
+``threadpool_size`` bytes are compressed on a worker thread (zlib and zstd
+release the GIL) instead of on the event loop.
+"""
+
+from __future__ import annotations
+
+import functools
+import gzip
+import logging
+from typing import Callable, Dict, Optional
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+COMPRESSIBLE_TYPES = ("application/json", "text/")
+
+
+def _zstd_compressor(level: int) -> Optional[Callable[[bytes], bytes]]:
+    try:
+        import zstandard
+    except ImportError:
+        logger.warning("zstd response compression requested but zstandard is not installed")
+        return None
+
+    def compress(body: bytes) -> bytes:
+        # Compressor objects are not thread-safe; threaded bodies need their own
+        return zstandard.ZstdCompressor(level=level).compress(body)
+
+    return compress
+
+
+def _accepted_encodings(header: str) -> Dict[str, float]:
+    """Map each coding of an ``Accept-Encoding`` header to its q-value."""
+
+    accepted: Dict[str, float] = {}
+    for token in header.split(","):
+        coding, *params = (part.strip() for part in token.split(";"))
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[coding.lower()] = quality
+    return accepted
+
+
+class CompressionMiddleware:
+    """Compress complete responses above a size threshold."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 4096,
+        threadpool_size: int = 256 * 1024,
+        zstd: bool = False,
+        gzip_level: int = 6,
+        zstd_level: int = 3,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.threadpool_size = threadpool_size
+        self.gzip_level = gzip_level
+        self.zstd = _zstd_compressor(zstd_level) if zstd else None
+
+    def _encoding(self, scope: Scope) -> Optional[str]:
+        accepted = _accepted_encodings(Headers(scope=scope).get("accept-encoding", ""))
+        supported = ("zstd", "gzip") if self.zstd is not None else ("gzip",)
+        # Highest q wins; ties keep the order of ``supported``
+        qualities = {
+            encoding: accepted.get(encoding, accepted.get("*", 0.0)) for encoding in supported
+        }
+        best = max(supported, key=lambda encoding: qualities[encoding])
+        return best if qualities[best] > 0 else None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        encoding = self._encoding(scope) if scope["type"] == "http" else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message = {}
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if not start:
+                await send(message)
+                return
+
+            headers = MutableHeaders(raw=start["headers"])
+            body = message.get("body", b"")
+            if (
+                len(body) >= self.minimum_size
+                and not message.get("more_body", False)
+                and "content-encoding" not in headers
+                and headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+            ):
+                compress: Callable[[bytes], bytes]
+                if encoding == "zstd":
+                    compress = self.zstd  # type: ignore[assignment]
+                else:
+                    compress = functools.partial(gzip.compress, compresslevel=self.gzip_level)
+                if len(body) >= self.threadpool_size:
+                    body = await run_in_threadpool(compress, body)
+                else:
+                    body = compress(body)
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(body))
+                headers.add_vary_header("Accept-Encoding")
+                message = {"type": "http.response.body", "body": body}
+            # Streamed bodies go out uncompressed, chunk by chunk
+            await send(start)
+            start = {}
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
@@ -0,0 +1,41 @@
+"""Conditional GET helpers built on row version counters."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from fastapi import Response, status
+
+# Let browsers keep the body but revalidate it on every poll
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(kind: str, row_id: int, version: int) -> str:
+    """Return a strong ETag for version ``version`` of a row."""
+
+    return f'"{kind}-{row_id}-{version}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Return whether an ``If-None-Match`` header matches ``etag``."""
+
+    if not if_none_match:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def set_etag(response: Response, etag: str) -> None:
+    """Attach validator headers to a full response."""
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+
+def not_modified(etag: str) -> Response:
+    """Return an empty 304 response for ``etag``."""
+
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+    )
@@ -0,0 +1,236 @@
+"""Prometheus metrics for the API, the worker and the trainers.
+
+All metrics live in the default ``prometheus_client`` registry. The API
+serves it at ``/metrics`` and the worker on ``WORKER_METRICS_PORT``. Trainers
+running in a worker's child process forward their epoch samples to the
+parent through a queue (see ``forward_trainer_metrics``), so the worker's
+registry covers every run it launched.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import resource
+import sys
+import time
+from typing import Any, Callable, Iterable, Optional
+
+from prometheus_client import REGISTRY, Gauge, Histogram
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# Requests that match no route share one label value
+UNMATCHED_ROUTE = "unmatched"
+
+REQUEST_LATENCY = Histogram(
+    "pulseml_http_request_duration_seconds",
+    "API request latency by route name.",
+    ["method", "route", "status"],
+)
+REQUEST_QUERIES = Histogram(
+    "pulseml_http_request_db_queries",
+    "Database statements per API request by route name.",
+    ["route"],
+    buckets=(0, 1, 2, 3, 4, 5, 6, 8, 10, 15, 20, 30, 50, 100),
+)
+REQUEST_QUERY_SECONDS = Histogram(
+    "pulseml_http_request_db_seconds",
+    "Database time per API request by route name.",
+    ["route"],
+)
+CLAIM_LATENCY = Histogram(
+    "pulseml_worker_claim_duration_seconds",
+    "Time the worker spends selecting and claiming a waiting run.",
+)
+RUN_DURATION = Histogram(
+    "pulseml_run_duration_seconds",
+    "Wall time of training runs executed by the worker.",
+    ["outcome"],
+    buckets=(10, 30, 60, 120, 300, 600, 1200, 1800, 3600, 7200, 14400, 28800, 86400),
+)
+EPOCH_DURATION = Histogram(
+    "pulseml_trainer_epoch_duration_seconds",
+    "Training epoch wall time.",
+    ["model"],
+    buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600),
+)
+SAMPLES_PER_SECOND = Gauge(
+    "pulseml_trainer_samples_per_second",
+    "Training throughput of the latest epoch.",
+    ["model"],
+)
+DATA_WAIT_FRACTION = Gauge(
+    "pulseml_trainer_data_wait_fraction",
+    "Share of the latest epoch spent waiting for input batches.",
+    ["model"],
+)
+PEAK_RSS = Gauge(
+    "pulseml_trainer_peak_rss_bytes",
+    "Peak resident set size of the latest training process.",
+    ["model"],
+)
+
+
+class MetricsMiddleware:
+    """Record request latency labelled by the matched route's name."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # The router stores the matched route in the shared scope; its name
+            # stays unique where paths of included routers lack their prefix
+            route = scope.get("route")
+            REQUEST_LATENCY.labels(
+                method=scope["method"],
+                route=getattr(route, "name", UNMATCHED_ROUTE),
+                status=str(status_code),
+            ).observe(time.perf_counter() - started)
+
+
+class PoolCollector(Collector):
+    """Report connection pool usage of a SQLAlchemy engine at scrape time."""
+
+    def __init__(self, engine: Any, name: str) -> None:
+        self.engine = engine
+        self.name = name
+
+    def _family(self) -> GaugeMetricFamily:
+        return GaugeMetricFamily(
+            "pulseml_db_pool_connections",
+            "Database pool connections by state.",
+            labels=["engine", "state"],
+        )
+
+    def describe(self) -> Iterable[GaugeMetricFamily]:
+        yield self._family()
+
+    def collect(self) -> Iterable[GaugeMetricFamily]:
+        pool = self.engine.pool
+        family = self._family()
+        # Only queue pools track these; SQLite's static pools do not
+        if hasattr(pool, "checkedout"):
+            family.add_metric([self.name, "size"], pool.size())
+            family.add_metric([self.name, "checked_out"], pool.checkedout())
+            family.add_metric([self.name, "idle"], pool.checkedin())
+            # QueuePool counts overflow up from -size
+            family.add_metric([self.name, "overflow"], max(0, pool.overflow()))
+        yield family
+
+
+class QueueDepthCollector(Collector):
+    """Report training runs per status, counted when scraped."""
+
+    def __init__(self, count_by_status: Callable[[], Iterable[tuple[str, int]]]) -> None:
+        self.count_by_status = count_by_status
+
+    def _family(self) -> GaugeMetricFamily:
+        return GaugeMetricFamily(
+            "pulseml_training_runs",
+            "Training runs by status.",
+            labels=["status"],
+        )
+
+    def describe(self) -> Iterable[GaugeMetricFamily]:
+        # Keeps registration from running a query
+        yield self._family()
+
+    def collect(self) -> Iterable[GaugeMetricFamily]:
+        family = self._family()
+        try:
+            for status, count in self.count_by_status():
+                family.add_metric([status], count)
+        except Exception as e:
+            logger.warning(f"Could not count training runs for metrics: {e}")
+        yield family
+
+
+def peak_rss_bytes() -> int:
+    """Return the peak resident set size of this process."""
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+_forward_queue: Optional[Any] = None
+
+
+def forward_trainer_metrics(target: Any) -> None:
+    """Send trainer samples recorded in this process to ``target`` instead."""
+
+    global _forward_queue
+    _forward_queue = target
+
+
+def _apply_epoch(
+    model: str,
+    seconds: float,
+    samples_per_sec: float,
+    data_wait_fraction: float,
+    rss_bytes: int,
+) -> None:
+    EPOCH_DURATION.labels(model=model).observe(seconds)
+    SAMPLES_PER_SECOND.labels(model=model).set(samples_per_sec)
+    DATA_WAIT_FRACTION.labels(model=model).set(data_wait_fraction)
+    PEAK_RSS.labels(model=model).set(rss_bytes)
+
+
+def record_epoch(model: str, data_wait_s: float, compute_s: float, samples_per_sec: float) -> None:
+    """Record one finished training epoch of ``model``."""
+
+    seconds = data_wait_s + compute_s
+    sample = (
+        model,
+        seconds,
+        samples_per_sec,
+        data_wait_s / seconds if seconds > 0 else 0.0,
+        peak_rss_bytes(),
+    )
+    if _forward_queue is not None:
+        _forward_queue.put(sample)
+    else:
+        _apply_epoch(*sample)
+
+
+def drain_trainer_metrics(source: Any) -> None:
+    """Apply the samples child processes forwarded to ``source``."""
+
+    while True:
+        try:
+            sample = source.get_nowait()
+        except queue.Empty:
+            return
+        _apply_epoch(*sample)
+
+
+_registered: set[str] = set()
+
+
+def register_collector(key: str, collector: Collector) -> None:
+    """Register ``collector`` with the default registry once per ``key``."""
+
+    if key in _registered:
+        return
+    REGISTRY.register(collector)
+    _registered.add(key)
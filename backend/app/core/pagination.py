@@ -0,0 +1,54 @@
+"""Keyset pagination helpers for list endpoints."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import tuple_
+from sqlalchemy.sql.elements import ColumnElement
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """Return an opaque cursor pointing just after ``(created_at, row_id)``."""
+
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor produced by :func:`encode_cursor`."""
+
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, row_id = raw.split("|")
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        ) from None
+
+
+def before_cursor(
+    created_at: ColumnElement[Any], row_id: ColumnElement[Any], cursor: str
+) -> ColumnElement[bool]:
+    """Filter rows that come after ``cursor`` in newest-first order."""
+
+    return tuple_(created_at, row_id) < tuple_(*decode_cursor(cursor))
+
+
+def split_page(rows: Sequence[Any], limit: int) -> Tuple[List[Any], Optional[str]]:
+    """Split ``limit + 1`` fetched rows into a page and the next cursor."""
+
+    page = list(rows[:limit])
+    if len(rows) <= limit:
+        return page, None
+    last = page[-1]
+    return page, encode_cursor(last.created_at, last.id)
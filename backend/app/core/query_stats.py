@@ -0,0 +1,161 @@
+"""Per-request database query counts, timings and slow-query logging.
+
+``instrument_engine`` hooks a SQLAlchemy engine so every statement is counted
+and timed into the ``QueryStats`` of the enclosing request (or
+``count_queries`` block); statements slower than ``slow_query_ms`` are
+logged together with the request's method, path and route name.
+``QueryStatsMiddleware`` opens one ``QueryStats`` per API request.
+
+``assert_max_queries`` turns the counts into query budgets, for tests and
+``benchmarks.query_budgets``, so N+1 regressions fail loudly.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Optional
+
+from sqlalchemy import Engine, event
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+# Statements are truncated in logs and budget failures; parameters never appear
+MAX_STATEMENT_CHARS = 1000
+
+_current: contextvars.ContextVar[Optional["QueryStats"]] = contextvars.ContextVar(
+    "pulseml_query_stats", default=None
+)
+
+
+class QueryStats:
+    """Statements run while this object is current, including nested blocks."""
+
+    def __init__(self, scope: Optional[Scope] = None, keep_statements: bool = False) -> None:
+        self.scope = scope
+        self.count = 0
+        self.seconds = 0.0
+        self.statements: Optional[List[str]] = [] if keep_statements else None
+        self.parent = _current.get()
+
+    @property
+    def label(self) -> str:
+        """Describe the request these statements belong to."""
+        if self.scope is None:
+            return self.parent.label if self.parent is not None else "no request"
+        route = self.scope.get("route")
+        name = getattr(route, "name", metrics.UNMATCHED_ROUTE)
+        return f"{self.scope['method']} {self.scope['path']} [{name}]"
+
+    def add(self, statement: str, seconds: float) -> None:
+        stats: Optional[QueryStats] = self
+        while stats is not None:
+            stats.count += 1
+            stats.seconds += seconds
+            if stats.statements is not None:
+                stats.statements.append(statement)
+            stats = stats.parent
+
+
+def _before_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _handle_error(context: Any) -> None:
+    # Failed statements never reach after_cursor_execute
+    started = context.connection.info.get("query_started") if context.connection else None
+    if started:
+        started.pop()
+
+
+def instrument_engine(engine: Engine, name: str, slow_query_ms: int) -> None:
+    """Count and time statements of ``engine`` (the sync engine of async ones).
+
+    Statements slower than ``slow_query_ms`` are logged; 0 disables the log.
+    Instrumenting an engine again is a no-op.
+    """
+
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+
+    def after_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+        seconds = time.perf_counter() - conn.info["query_started"].pop()
+        stats = _current.get()
+        if stats is not None:
+            stats.add(statement, seconds)
+        if slow_query_ms and seconds * 1000 >= slow_query_ms:
+            label = stats.label if stats is not None else "no request"
+            logger.warning(
+                f"Slow {name} query ({seconds * 1000:.0f} ms) during {label}: "
+                f"{statement[:MAX_STATEMENT_CHARS]}"
+            )
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+class QueryStatsMiddleware:
+    """Collect the statements of each request and record them per route."""
+
+    def __init__(self, app: ASGIApp, record_metrics: bool = True) -> None:
+        self.app = app
+        self.record_metrics = record_metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(scope)
+        token = _current.set(stats)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current.reset(token)
+            route = getattr(scope.get("route"), "name", metrics.UNMATCHED_ROUTE)
+            if self.record_metrics:
+                metrics.REQUEST_QUERIES.labels(route=route).observe(stats.count)
+                metrics.REQUEST_QUERY_SECONDS.labels(route=route).observe(stats.seconds)
+            logger.debug(
+                f"{stats.label}: {stats.count} queries in {stats.seconds * 1000:.1f} ms"
+            )
+
+
+@contextmanager
+def count_queries(keep_statements: bool = False) -> Iterator[QueryStats]:
+    """Collect the statements run inside the block, requests included."""
+
+    stats = QueryStats(keep_statements=keep_statements)
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def assert_max_queries(budget: int, label: str = "block") -> Iterator[QueryStats]:
+    """Fail with the statements run if the block issues more than ``budget``.
+
+    Usage::
+
+        with assert_max_queries(3, "GET /training-runs/"):
+            response = await client.get("/api/training-runs/")
+    """
+
+    with count_queries(keep_statements=True) as stats:
+        yield stats
+    if stats.count > budget:
+        listing = "\n".join(
+            f"  {i}. {statement[:MAX_STATEMENT_CHARS]}"
+            for i, statement in enumerate(stats.statements or [], start=1)
+        )
+        raise AssertionError(
+            f"{label} issued {stats.count} queries, over its budget of {budget}:\n{listing}"
+        )
@@ -0,0 +1,38 @@
+"""Fast JSON responses for large payloads.
+
+Routes that return big bodies (run and dataset lists, previews, metrics)
+build their response here instead of letting FastAPI validate the return
+value a second time and encode it with the stdlib ``json`` module: lists are
+validated in one ``TypeAdapter`` call and bodies are rendered with orjson.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Type
+
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def list_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    """Return a cached adapter validating a list of ``schema``."""
+
+    return TypeAdapter(List[schema])  # type: ignore[valid-type]
+
+
+def list_response(
+    schema: Type[BaseModel], rows: Sequence[Any], headers: Optional[Dict[str, str]] = None
+) -> ORJSONResponse:
+    """Validate ORM rows or result rows as ``schema`` in bulk and render them."""
+
+    adapter = list_adapter(schema)
+    items = adapter.validate_python(rows, from_attributes=True)
+    return ORJSONResponse(adapter.dump_python(items), headers=headers)
+
+
+def model_response(model: BaseModel, headers: Optional[Dict[str, str]] = None) -> ORJSONResponse:
+    """Render an already validated model."""
+
+    return ORJSONResponse(model.model_dump(), headers=headers)
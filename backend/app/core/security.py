@@ -1,14 +1,22 @@
 """Security helpers for PulseML authentication."""
 
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict
+from typing import Any, Callable, Dict, TypeVar
 
+from fastapi import HTTPException, status
 from jose import jwt
 from passlib.context import CryptContext
 
 from ..config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+T = TypeVar("T")
+
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS
+)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -32,6 +40,52 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password_truncated)
 
 
+class PasswordHasher:
+    """Run bcrypt on a bounded thread pool so it never blocks the event loop.
+
+    Requests beyond ``threads + queue_limit`` in flight are rejected with 429
+    instead of queueing without bound.
+    """
+
+    def __init__(self, threads: int, queue_limit: int) -> None:
+        threads = threads or max(1, (os.cpu_count() or 2) // 2)
+        self.capacity = threads + queue_limit
+        self.in_flight = 0
+        self._executor = ThreadPoolExecutor(
+            max_workers=threads, thread_name_prefix="pulseml-bcrypt"
+        )
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        if self.in_flight >= self.capacity:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many authentication requests, retry shortly",
+                headers={"Retry-After": "1"},
+            )
+        self.in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, func, *args
+            )
+        finally:
+            self.in_flight -= 1
+
+    async def hash(self, password: str) -> str:
+        """Hash ``password`` off the event loop."""
+
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify ``plain_password`` off the event loop."""
+
+        return await self._run(verify_password, plain_password, hashed_password)
+
+
+password_hasher = PasswordHasher(
+    threads=settings.PASSWORD_HASH_THREADS, queue_limit=settings.PASSWORD_HASH_QUEUE_LIMIT
+)
+
+
 def _create_token(data: Dict[str, Any], expires_delta: timedelta) -> str:
     """Create a JWT token with the provided expiry."""
 
@@ -1,10 +1,13 @@
 """Dataset API routes."""
 
-from typing import List
+from typing import List, Literal, Optional, Union
 
-from fastapi import APIRouter, Depends, File, Form, UploadFile
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, File, Form, Header, Query, Response, UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..core.etag import etag_matches, make_etag, not_modified, set_etag
+from ..core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
+from ..core.responses import list_response, model_response
 from ..dependencies import get_current_user, get_db
 from ..db import models
 from . import schemas, service
@@ -22,7 +25,7 @@ async def upload_dataset(
     name: str = Form(...),
     description: str | None = Form(default=None),
     current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> schemas.DatasetUploadResponse:
     """Upload and analyze a CSV dataset."""
 
@@ -37,29 +40,59 @@ async def upload_dataset(
     return schemas.DatasetUploadResponse(dataset=dataset_read, file_path=dataset.file_path)
 
 
-@router.get("/", response_model=List[schemas.DatasetRead])
+@router.get(
+    "/",
+    response_model=Union[List[schemas.DatasetSummary], List[schemas.DatasetRead]],
+)
 async def list_datasets(
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    view: Literal["summary", "full"] = "summary",
     current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db),
-) -> List[schemas.DatasetRead]:
-    """List datasets for the authenticated user."""
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """List datasets for the authenticated user, newest first.
+
+    Pass the ``X-Next-Cursor`` response header back as ``cursor`` to fetch the
+    next page; ``view=full`` includes the column metadata.
+    """
 
     dataset_service = service.DatasetService(db)
-    datasets = dataset_service.list_datasets(current_user)
-    return [schemas.DatasetRead.model_validate(ds) for ds in datasets]
+    datasets, next_cursor = await dataset_service.list_datasets(
+        current_user, limit=limit, cursor=cursor, full=view == "full"
+    )
+    item_schema = schemas.DatasetRead if view == "full" else schemas.DatasetSummary
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+    return list_response(item_schema, datasets, headers=headers)
 
 
-@router.get("/{dataset_id}", response_model=schemas.DatasetPreview)
+@router.get(
+    "/{dataset_id}",
+    response_model=schemas.DatasetPreview,
+    responses={304: {"description": "Dataset unchanged since the given ETag"}},
+)
 async def get_dataset(
     dataset_id: int,
+    if_none_match: Optional[str] = Header(default=None),
     current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db),
-) -> schemas.DatasetPreview:
-    """Retrieve dataset metadata and preview."""
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """Retrieve dataset metadata and preview.
+
+    Answers 304 without reading the CSV when ``If-None-Match`` carries the
+    dataset's current ETag.
+    """
 
     dataset_service = service.DatasetService(db)
-    dataset = dataset_service.get_dataset(current_user, dataset_id)
-    return dataset_service.dataset_preview(dataset)
+    if if_none_match:
+        version = await dataset_service.get_dataset_version(current_user, dataset_id)
+        etag = make_etag("dataset", dataset_id, version)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+    dataset = await dataset_service.get_dataset(current_user, dataset_id)
+    response = model_response(dataset_service.dataset_preview(dataset))
+    set_etag(response, make_etag("dataset", dataset.id, dataset.version))
+    return response
 
 
 @router.put("/{dataset_id}/schema", response_model=schemas.DatasetRead)
@@ -67,13 +100,13 @@ async def update_dataset_schema(
     dataset_id: int,
     payload: schemas.DatasetSchemaUpdate,
     current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> schemas.DatasetRead:
     """Update dataset column roles."""
 
     dataset_service = service.DatasetService(db)
-    dataset = dataset_service.get_dataset(current_user, dataset_id)
-    updated = dataset_service.update_schema(dataset, payload)
+    dataset = await dataset_service.get_dataset(current_user, dataset_id)
+    updated = await dataset_service.update_schema(dataset, payload)
     return schemas.DatasetRead.model_validate(updated)
 
 
@@ -82,13 +115,13 @@ async def rename_dataset(
     dataset_id: int,
     payload: schemas.DatasetRename,
     current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> schemas.DatasetRead:
     """Rename a dataset and update its description."""
 
     dataset_service = service.DatasetService(db)
-    dataset = dataset_service.get_dataset(current_user, dataset_id)
-    updated = dataset_service.rename_dataset(dataset, payload)
+    dataset = await dataset_service.get_dataset(current_user, dataset_id)
+    updated = await dataset_service.rename_dataset(dataset, payload)
     return schemas.DatasetRead.model_validate(updated)
 
 
@@ -97,13 +130,13 @@ async def create_target_column(
     dataset_id: int,
     payload: schemas.CreateTargetColumnRequest,
     current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> schemas.DatasetRead:
     """Create a target column by copying values from a source column."""
 
     dataset_service = service.DatasetService(db)
-    dataset = dataset_service.get_dataset(current_user, dataset_id)
-    updated = dataset_service.create_target_column(
+    dataset = await dataset_service.get_dataset(current_user, dataset_id)
+    updated = await dataset_service.create_target_column(
         dataset, payload.source_column, payload.target_column_name
     )
     return schemas.DatasetRead.model_validate(updated)
@@ -113,10 +146,10 @@ async def create_target_column(
 async def delete_dataset(
     dataset_id: int,
     current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> None:
     """Delete a dataset and its associated file."""
 
     dataset_service = service.DatasetService(db)
-    dataset = dataset_service.get_dataset(current_user, dataset_id)
-    dataset_service.delete_dataset(dataset)
\ No newline at end of file
+    dataset = await dataset_service.get_dataset(current_user, dataset_id)
+    await dataset_service.delete_dataset(dataset)
\ No newline at end of file
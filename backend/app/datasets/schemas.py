@@ -39,6 +39,21 @@ class DatasetRead(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class DatasetSummary(BaseModel):
+    """Dataset list entry without the column metadata."""
+
+    id: int
+    owner_id: int
+    name: str
+    description: Optional[str] = None
+    type: str
+    n_rows: int | None = None
+    n_columns: int | None = None
+    created_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class DatasetPreview(BaseModel):
     """Dataset preview response."""
 
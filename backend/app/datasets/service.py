@@ -4,13 +4,16 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import List
+from typing import Any, Optional, Sequence, Tuple
 from uuid import uuid4
 
 import pandas as pd
 from fastapi import HTTPException, UploadFile, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import flag_modified
 
+from ..core.pagination import before_cursor, split_page
 from ..db import models
 
 from . import schemas, utils
@@ -21,7 +24,7 @@ logger = logging.getLogger(__name__)
 class DatasetService:
     """Encapsulates dataset persistence and analysis logic."""
 
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: AsyncSession) -> None:
         self.db = db
 
     async def upload_dataset(
@@ -43,8 +46,8 @@ class DatasetService:
             meta={"columns": [], "suggested_roles": {}},
         )
         self.db.add(dataset)
-        self.db.commit()
-        self.db.refresh(dataset)
+        await self.db.commit()
+        await self.db.refresh(dataset)
 
         dataset_dir = utils.dataset_storage_path(user.id, dataset.id)
         destination = dataset_dir / "raw.csv"
@@ -54,33 +57,59 @@ class DatasetService:
         dataset.file_path = str(destination)
         dataset.meta = meta
         self.db.add(dataset)
-        self.db.commit()
-        self.db.refresh(dataset)
+        await self.db.commit()
+        await self.db.refresh(dataset)
         logger.info(
             "Stored dataset %s for user %s at %s", dataset.id, user.id, dataset.file_path
         )
         return dataset
 
-    def list_datasets(self, user: models.User) -> List[models.Dataset]:
-        """Return datasets owned by the user."""
-
-        return (
-            self.db.query(models.Dataset)
-            .filter(models.Dataset.owner_id == user.id)
-            .order_by(models.Dataset.created_at.desc())
-            .all()
-        )
-
-    def get_dataset(self, user: models.User, dataset_id: int) -> models.Dataset:
+    async def list_datasets(
+        self,
+        user: models.User,
+        limit: int,
+        cursor: Optional[str] = None,
+        full: bool = False,
+    ) -> Tuple[Sequence[Any], Optional[str]]:
+        """Return a newest-first page of the user's datasets and the next cursor.
+
+        Unless ``full`` is set only summary columns are selected, with row and
+        column counts read out of ``meta`` in the database.
+        """
+
+        if full:
+            query = select(models.Dataset)
+        else:
+            query = select(
+                models.Dataset.id,
+                models.Dataset.owner_id,
+                models.Dataset.name,
+                models.Dataset.description,
+                models.Dataset.type,
+                models.Dataset.meta["n_rows"].as_integer().label("n_rows"),
+                models.Dataset.meta["n_columns"].as_integer().label("n_columns"),
+                models.Dataset.created_at,
+            )
+        query = query.where(models.Dataset.owner_id == user.id)
+        if cursor:
+            query = query.where(
+                before_cursor(models.Dataset.created_at, models.Dataset.id, cursor)
+            )
+        query = query.order_by(
+            models.Dataset.created_at.desc(), models.Dataset.id.desc()
+        ).limit(limit + 1)
+        result = await self.db.execute(query)
+        rows = result.scalars().all() if full else result.all()
+        return split_page(rows, limit)
+
+    async def get_dataset(self, user: models.User, dataset_id: int) -> models.Dataset:
         """Return a single dataset ensuring ownership."""
 
-        dataset = (
-            self.db.query(models.Dataset)
-            .filter(
+        dataset = await self.db.scalar(
+            select(models.Dataset).where(
                 models.Dataset.id == dataset_id,
                 models.Dataset.owner_id == user.id,
             )
-            .first()
         )
         if not dataset:
             raise HTTPException(
@@ -88,6 +117,21 @@ class DatasetService:
             )
         return dataset
 
+    async def get_dataset_version(self, user: models.User, dataset_id: int) -> int:
+        """Return the row version of a dataset owned by user without loading it."""
+
+        version = await self.db.scalar(
+            select(models.Dataset.version).where(
+                models.Dataset.id == dataset_id,
+                models.Dataset.owner_id == user.id,
+            )
+        )
+        if version is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Dataset not found"
+            )
+        return version
+
     def dataset_preview(self, dataset: models.Dataset) -> schemas.DatasetPreview:
         """Return metadata with sample rows."""
 
@@ -96,7 +140,7 @@ class DatasetService:
         dataset_read = schemas.DatasetRead.model_validate(dataset)
         return schemas.DatasetPreview(dataset=dataset_read, preview=data)
 
-    def update_schema(
+    async def update_schema(
         self, dataset: models.Dataset, payload: schemas.DatasetSchemaUpdate
     ) -> models.Dataset:
         """Update dataset column roles."""
@@ -117,12 +161,14 @@ class DatasetService:
         meta["suggested_roles"] = suggested_roles
 
         dataset.meta = meta
+        # meta was changed in place, which the ORM does not detect on its own
+        flag_modified(dataset, "meta")
         self.db.add(dataset)
-        self.db.commit()
-        self.db.refresh(dataset)
+        await self.db.commit()
+        await self.db.refresh(dataset)
         return dataset
 
-    def rename_dataset(
+    async def rename_dataset(
         self, dataset: models.Dataset, payload: schemas.DatasetRename
     ) -> models.Dataset:
         """Rename a dataset and optionally update its description."""
@@ -131,12 +177,12 @@ class DatasetService:
         if payload.description is not None:
             dataset.description = payload.description
         self.db.add(dataset)
-        self.db.commit()
-        self.db.refresh(dataset)
+        await self.db.commit()
+        await self.db.refresh(dataset)
         logger.info("Renamed dataset %s to %s", dataset.id, payload.name)
         return dataset
 
-    def create_target_column(
+    async def create_target_column(
         self, dataset: models.Dataset, source_column: str, target_column_name: str | None = None
     ) -> models.Dataset:
         """Create a target column by copying values from a source column."""
@@ -194,21 +240,21 @@ class DatasetService:
         dataset.meta = meta
         dataset.file_path = str(file_path)
         self.db.add(dataset)
-        self.db.commit()
-        self.db.refresh(dataset)
+        await self.db.commit()
+        await self.db.refresh(dataset)
 
         logger.info("Updated dataset %s metadata with new target column", dataset.id)
         return dataset
 
-    def delete_dataset(self, dataset: models.Dataset) -> None:
+    async def delete_dataset(self, dataset: models.Dataset) -> None:
         """Delete a dataset and its associated file."""
 
         dataset_id = dataset.id
         file_path = Path(dataset.file_path)
         
         # Delete from database first
-        self.db.delete(dataset)
-        self.db.commit()
+        await self.db.delete(dataset)
+        await self.db.commit()
         
         # Delete the file if it exists
         if file_path.exists():
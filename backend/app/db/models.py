@@ -6,19 +6,35 @@ from datetime import datetime
 from typing import Any, Dict, Optional
 
 from sqlalchemy import (
+    BigInteger,
+    Boolean,
     Enum,
     ForeignKey,
     Float,
+    Index,
     Integer,
     String,
     Text,
     func,
+    literal_column,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
 
+
+def row_version() -> Mapped[int]:
+    """Counter bumped by every UPDATE of the row; detail endpoints use it as ETag."""
+
+    return mapped_column(
+        BigInteger,
+        nullable=False,
+        default=1,
+        server_default="1",
+        onupdate=literal_column("version") + 1,
+    )
+
 TrainingStatus = Enum(
     "pending",
     "queued",
@@ -29,6 +45,9 @@ TrainingStatus = Enum(
     name="trainingstatus",
 )
 
+# Statuses of runs waiting to be claimed by a worker
+WAITING_STATUSES = ("pending", "queued")
+
 
 class User(Base):
     """Registered PulseML user."""
@@ -67,12 +86,18 @@ class Dataset(Base):
     created_at: Mapped[datetime] = mapped_column(
         default=func.now(), nullable=False, server_default=func.now()
     )
+    version: Mapped[int] = row_version()
 
     owner: Mapped["User"] = relationship(back_populates="datasets")
     training_runs: Mapped[list["TrainingRun"]] = relationship(
         back_populates="dataset", cascade="all,delete-orphan"
     )
 
+    __table_args__ = (
+        # Dataset listing, newest first
+        Index("ix_datasets_owner_created", "owner_id", created_at.desc(), id.desc()),
+    )
+
 
 class ModelTemplate(Base):
     """Model template definition stored in the database."""
@@ -109,6 +134,14 @@ class TrainingRun(Base):
         ForeignKey("model_templates.id"), nullable=False
     )
     status: Mapped[str] = mapped_column(TrainingStatus, nullable=False, default="pending")
+    priority: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    # Fair-share round: the n-th waiting run of an owner is claimed after the
+    # (n-1)-th waiting run of every other owner
+    queue_seq: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, default=0, server_default="0"
+    )
     hparams: Mapped[Dict[str, Any]] = mapped_column(
         JSONB, nullable=False, default=dict, server_default="{}"
     )
@@ -123,6 +156,16 @@ class TrainingRun(Base):
     metrics_summary: Mapped[Optional[Dict[str, Any]]] = mapped_column(
         JSONB, nullable=True
     )
+    # Phase wall times, throughput and resource use recorded by the trainer
+    perf_summary: Mapped[Optional[Dict[str, Any]]] = mapped_column(
+        JSONB, nullable=True
+    )
+    # Set to capture a torch.profiler window; the trainer clears it and
+    # records where the artifacts went
+    profile_requested: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=False, server_default="false"
+    )
+    profile_path: Mapped[Optional[str]] = mapped_column(String(512), nullable=True)
     device: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     current_epoch: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     total_epochs: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
@@ -132,6 +175,7 @@ class TrainingRun(Base):
     started_at: Mapped[Optional[datetime]] = mapped_column(nullable=True)
     finished_at: Mapped[Optional[datetime]] = mapped_column(nullable=True)
     error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    version: Mapped[int] = row_version()
 
     owner: Mapped["User"] = relationship(back_populates="training_runs")
     dataset: Mapped["Dataset"] = relationship(back_populates="training_runs")
@@ -139,3 +183,30 @@ class TrainingRun(Base):
         back_populates="training_runs"
     )
 
+    __table_args__ = (
+        # Claim order of waiting runs; partial so the index only holds the queue
+        Index(
+            "ix_training_runs_claim",
+            "queue_seq",
+            priority.desc(),
+            "id",
+            postgresql_where=status.in_(WAITING_STATUSES),
+        ),
+        Index(
+            "ix_training_runs_owner_queue",
+            "owner_id",
+            "queue_seq",
+            postgresql_where=status.in_(WAITING_STATUSES),
+        ),
+        # Run listing, newest first
+        Index("ix_training_runs_owner_created", "owner_id", created_at.desc(), id.desc()),
+        # Per-owner running counts used for fair share
+        Index(
+            "ix_training_runs_running_owner",
+            "owner_id",
+            postgresql_where=status == "running",
+        ),
+        # Runs of a dataset, looked up when the dataset is deleted
+        Index("ix_training_runs_dataset_id", "dataset_id"),
+    )
+
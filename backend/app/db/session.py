@@ -1,11 +1,20 @@
-"""Database session management."""
+"""Database session management.
+
+The API serves requests from async sessions on ``async_engine`` so database
+round-trips do not block the event loop. The worker, migrations and startup
+seeding keep using the synchronous ``engine``.
+"""
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from ..config import settings
 from .base import Base
 
+ASYNC_DRIVERS = {"postgresql": "postgresql+asyncpg", "sqlite": "sqlite+aiosqlite"}
+
 engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
 
 SessionLocal = sessionmaker(
@@ -16,6 +25,31 @@ SessionLocal = sessionmaker(
 )
 
 
+def get_async_database_url() -> str:
+    """Return the API database URL, swapping DATABASE_URL to an async driver."""
+
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+    url = make_url(settings.DATABASE_URL)
+    driver = ASYNC_DRIVERS.get(url.get_backend_name(), url.drivername)
+    return url.set(drivername=driver).render_as_string(hide_password=False)
+
+
+async_engine = create_async_engine(
+    get_async_database_url(),
+    pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+
 def get_engine():
     """Expose the configured engine for migrations."""
 
@@ -26,4 +60,3 @@ def init_db() -> None:
     """Create tables in development environments when needed."""
 
     Base.metadata.create_all(bind=engine)
-
@@ -1,34 +1,36 @@
 """Shared FastAPI dependencies for PulseML."""
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator
 from typing import Annotated
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from .auth.cache import principal_cache
 from .auth.service import AuthService, TokenPayload
-from .db.session import SessionLocal
+from .db.session import AsyncSessionLocal
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
 
-def get_db() -> Generator[Session, None, None]:
-    """Yield a database session for request lifecycle."""
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """Yield an async database session for request lifecycle."""
 
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_db)],
 ):
-    """Resolve the authenticated user from the Authorization header."""
+    """Resolve the authenticated user from the Authorization header.
+
+    Users are served from the principal cache when possible, so most requests
+    authenticate without querying ``users``.
+    """
 
     auth_service = AuthService(db)
     try:
@@ -39,12 +41,16 @@ async def get_current_user(
             detail="Invalid token",
         ) from exc
 
-    user = auth_service.get_user(payload.sub)
+    user = await principal_cache.get(payload.sub)
+    if user is not None:
+        return user
+
+    user = await auth_service.get_user(payload.sub)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
         )
 
+    await principal_cache.set(user)
     return user
-
@@ -3,12 +3,16 @@
 import logging
 from pathlib import Path
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
 from .api.router import api_router
 from .config import settings
-from .db.session import SessionLocal
+from .core import metrics, query_stats
+from .core.compression import CompressionMiddleware
+from .core.pagination import NEXT_CURSOR_HEADER
+from .db.session import SessionLocal, async_engine
 from .models_registry.registry import seed_default_templates
 
 logger = logging.getLogger("pulseml.app")
@@ -28,7 +32,30 @@ def create_application() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER, "ETag"],
     )
+    if settings.RESPONSE_COMPRESSION != "off":
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.RESPONSE_COMPRESSION_MIN_BYTES,
+            threadpool_size=settings.RESPONSE_COMPRESSION_THREAD_BYTES,
+            zstd=settings.RESPONSE_COMPRESSION == "zstd",
+        )
+    if settings.QUERY_STATS_ENABLED:
+        query_stats.instrument_engine(async_engine.sync_engine, "api", settings.SLOW_QUERY_MS)
+        app.add_middleware(
+            query_stats.QueryStatsMiddleware, record_metrics=settings.METRICS_ENABLED
+        )
+    if settings.METRICS_ENABLED:
+        # Added last so request timings include compression
+        app.add_middleware(metrics.MetricsMiddleware)
+        metrics.register_collector("api_pool", metrics.PoolCollector(async_engine, "api"))
+
+        @app.get("/metrics", include_in_schema=False)
+        def prometheus_metrics() -> Response:
+            """Expose Prometheus metrics for this API process."""
+
+            return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
 
     @app.on_event("startup")
     async def startup_event() -> None:
@@ -39,6 +66,12 @@ def create_application() -> FastAPI:
             seed_default_templates(session)
         logger.info("PulseML application startup complete")
 
+    @app.on_event("shutdown")
+    async def shutdown_event() -> None:
+        """Close pooled database connections."""
+
+        await async_engine.dispose()
+
     @app.get("/health", tags=["health"])
     async def health_check() -> dict[str, str]:
         """Simple health check endpoint."""
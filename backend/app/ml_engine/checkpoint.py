@@ -0,0 +1,279 @@
+"""Asynchronous checkpoint writing for the ML engine."""
+
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import torch
+
+logger = logging.getLogger(__name__)
+
+
+def snapshot_to_cpu(obj: Any) -> Any:
+    """Return a copy of ``obj`` with every tensor detached and copied to CPU."""
+
+    if isinstance(obj, torch.Tensor):
+        return obj.detach().to("cpu", copy=True)
+    if isinstance(obj, dict):
+        return {key: snapshot_to_cpu(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(snapshot_to_cpu(value) for value in obj)
+    return obj
+
+
+def atomic_save(payload: Dict[str, Any], path: Path) -> None:
+    """Serialize ``payload`` next to ``path`` and atomically rename it into place."""
+
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    torch.save(payload, tmp_path)
+    os.replace(tmp_path, path)
+
+
+@dataclass
+class _Job:
+    epoch: int
+    val_loss: float
+    payload: Dict[str, Any]
+    is_best: bool
+
+
+@dataclass
+class _Written:
+    epoch: int
+    val_loss: float
+    path: Path
+
+
+@dataclass
+class CheckpointStats:
+    """Counters describing checkpoint activity for a run."""
+
+    submitted: int = 0
+    written: int = 0
+    superseded: int = 0
+    write_seconds: float = 0.0
+
+
+class CheckpointManager:
+    """Snapshot model state to CPU and persist it on a background thread.
+
+    ``best_model.pt`` always holds the best checkpoint seen so far. When
+    ``keep_top_k > 1`` or ``keep_last_n > 0`` per-epoch checkpoints are also
+    written and pruned so that only the ``keep_top_k`` lowest-loss and the
+    ``keep_last_n`` most recent ones remain on disk.
+
+    Only the newest pending snapshot of each kind is written: a snapshot that is
+    superseded before the writer reaches it is dropped. Files are written to a
+    temporary name and renamed, so readers never observe partial checkpoints.
+
+    With ``retain_best_in_memory`` the CPU snapshot of the best model weights is
+    kept after writing, so callers can restore the best model without reading
+    it back from disk.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        best_name: str = "best_model.pt",
+        keep_top_k: int = 1,
+        keep_last_n: int = 0,
+        retain_best_in_memory: bool = True,
+    ) -> None:
+        self.directory = directory
+        self.retain_best_in_memory = retain_best_in_memory
+        self.best_path = directory / best_name
+        self.keep_top_k = max(1, keep_top_k)
+        self.keep_last_n = max(0, keep_last_n)
+        self.best_val_loss = float("inf")
+        self.stats = CheckpointStats()
+
+        self._retain_history = self.keep_top_k > 1 or self.keep_last_n > 0
+        self._best_state: Optional[Dict[str, torch.Tensor]] = None
+        self._written: List[_Written] = []
+        self._pending_best: Optional[_Job] = None
+        self._pending_history: Optional[_Job] = None
+        self._busy = False
+        self._closed = False
+        self._error: Optional[BaseException] = None
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(
+            target=self._writer, name="pulseml-checkpoint", daemon=True
+        )
+        self._thread.start()
+
+    def _history_path(self, epoch: int) -> Path:
+        return self.directory / f"checkpoint-epoch-{epoch:04d}.pt"
+
+    def _qualifies_for_history(self, val_loss: float) -> bool:
+        if not self._retain_history:
+            return False
+        if self.keep_last_n > 0:
+            return True
+        with self._cond:
+            losses = sorted(w.val_loss for w in self._written)
+        return len(losses) < self.keep_top_k or val_loss < losses[self.keep_top_k - 1]
+
+    def update(
+        self,
+        epoch: int,
+        val_loss: float,
+        model: torch.nn.Module,
+        optimizer: Optional[torch.optim.Optimizer] = None,
+        extra: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Record the end of an epoch; returns whether it is the new best.
+
+        A CPU snapshot is taken only when the epoch needs to be persisted.
+        """
+
+        self._raise_pending_error()
+        is_best = val_loss < self.best_val_loss
+        if is_best:
+            self.best_val_loss = val_loss
+        if not is_best and not self._qualifies_for_history(val_loss):
+            return is_best
+
+        payload: Dict[str, Any] = {
+            "epoch": epoch,
+            "model_state_dict": snapshot_to_cpu(model.state_dict()),
+            "val_loss": val_loss,
+        }
+        if optimizer is not None:
+            payload["optimizer_state_dict"] = snapshot_to_cpu(optimizer.state_dict())
+        if extra:
+            payload.update(extra)
+        job = _Job(epoch=epoch, val_loss=val_loss, payload=payload, is_best=is_best)
+        if is_best and self.retain_best_in_memory:
+            # Shares tensors with the pending write; no extra copy is made
+            self._best_state = payload["model_state_dict"]
+
+        with self._cond:
+            self.stats.submitted += 1
+            if is_best:
+                if self._pending_best is not None:
+                    self.stats.superseded += 1
+                self._pending_best = job
+            else:
+                if self._pending_history is not None:
+                    self.stats.superseded += 1
+                self._pending_history = job
+            self._cond.notify_all()
+        return is_best
+
+    def best_model_state(self) -> Optional[Dict[str, torch.Tensor]]:
+        """Return the in-memory CPU copy of the best weights, if retained."""
+
+        return self._best_state
+
+    def _writer(self) -> None:
+        while True:
+            with self._cond:
+                while (
+                    self._pending_best is None
+                    and self._pending_history is None
+                    and not self._closed
+                ):
+                    self._cond.wait()
+                job = self._pending_best or self._pending_history
+                if job is None:
+                    return
+                if job is self._pending_best:
+                    self._pending_best = None
+                else:
+                    self._pending_history = None
+                self._busy = True
+            try:
+                self._write(job)
+            except BaseException as exc:  # noqa: BLE001 - surfaced via flush()
+                logger.error("Checkpoint write for epoch %s failed: %s", job.epoch, exc)
+                with self._cond:
+                    self._error = exc
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+    def _write(self, job: _Job) -> None:
+        started = time.perf_counter()
+        if self._retain_history:
+            history_path = self._history_path(job.epoch)
+            atomic_save(job.payload, history_path)
+            if job.is_best:
+                self._link_best(history_path)
+            with self._cond:
+                self._written.append(_Written(job.epoch, job.val_loss, history_path))
+                stale = self._prune()
+            for written in stale:
+                written.path.unlink(missing_ok=True)
+        else:
+            atomic_save(job.payload, self.best_path)
+        elapsed = time.perf_counter() - started
+        with self._cond:
+            self.stats.written += 1
+            self.stats.write_seconds += elapsed
+        logger.debug("Wrote checkpoint for epoch %s in %.3fs", job.epoch, elapsed)
+
+    def _link_best(self, source: Path) -> None:
+        tmp_path = self.best_path.with_name(f".{self.best_path.name}.tmp")
+        tmp_path.unlink(missing_ok=True)
+        try:
+            os.link(source, tmp_path)
+        except OSError:
+            shutil.copyfile(source, tmp_path)
+        os.replace(tmp_path, self.best_path)
+
+    def _prune(self) -> List[_Written]:
+        """Forget checkpoints outside the retention policy and return them.
+
+        Called with ``_cond`` held so ``_qualifies_for_history`` never sees a
+        partly pruned list.
+        """
+        by_loss = sorted(self._written, key=lambda w: w.val_loss)[: self.keep_top_k]
+        by_epoch = sorted(self._written, key=lambda w: w.epoch)
+        recent = by_epoch[-self.keep_last_n :] if self.keep_last_n else []
+        keep = {w.epoch for w in (*by_loss, *recent)}
+        stale = [w for w in self._written if w.epoch not in keep]
+        self._written = [w for w in self._written if w.epoch in keep]
+        return stale
+
+    def _raise_pending_error(self) -> None:
+        with self._cond:
+            error, self._error = self._error, None
+        if error is not None:
+            raise RuntimeError("Checkpoint write failed") from error
+
+    def flush(self) -> None:
+        """Block until all pending snapshots are on disk."""
+
+        with self._cond:
+            while self._pending_best or self._pending_history or self._busy:
+                self._cond.wait()
+        self._raise_pending_error()
+
+    def close(self) -> None:
+        """Flush outstanding writes and stop the writer thread."""
+
+        try:
+            self.flush()
+        finally:
+            with self._cond:
+                self._closed = True
+                self._cond.notify_all()
+            self._thread.join()
+
+    def abort(self) -> None:
+        """Drop pending snapshots and stop the writer thread without raising."""
+
+        with self._cond:
+            self._pending_best = None
+            self._pending_history = None
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
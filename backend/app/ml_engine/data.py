@@ -0,0 +1,336 @@
+"""Data loading and preprocessing helpers for the ML engine."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import torch
+from torch.utils.data import IterableDataset, get_worker_info
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_ROWS = 100_000
+# Rows parsed to resolve column names and dtypes before the real load
+DEFAULT_SAMPLE_ROWS = 1_000
+DEFAULT_SHUFFLE_BUFFER = 10_000
+DEFAULT_BLOCK_ROWS = 65_536
+
+
+@dataclass
+class ScalerStats:
+    """Standardization statistics equivalent to a fitted ``StandardScaler``."""
+
+    mean: np.ndarray
+    var: np.ndarray
+    n_samples: int
+
+    @property
+    def scale(self) -> np.ndarray:
+        """Return the per-column standard deviation, with zeros mapped to 1."""
+
+        scale = np.sqrt(self.var)
+        scale[scale < 10 * np.finfo(scale.dtype).eps] = 1.0
+        return scale
+
+    def transform_(self, values: np.ndarray) -> np.ndarray:
+        """Standardize ``values`` in place and return them."""
+
+        values -= self.mean.astype(values.dtype)
+        values /= self.scale.astype(values.dtype)
+        return values
+
+    def inverse_transform(self, values: np.ndarray) -> np.ndarray:
+        """Return ``values`` mapped back to the original scale."""
+
+        return values * self.scale + self.mean
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable representation."""
+
+        return {
+            "mean": self.mean.tolist(),
+            "var": self.var.tolist(),
+            "n_samples": int(self.n_samples),
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> "ScalerStats":
+        """Rebuild statistics produced by :meth:`to_dict`."""
+
+        return cls(
+            mean=np.asarray(payload["mean"], dtype=np.float64),
+            var=np.asarray(payload["var"], dtype=np.float64),
+            n_samples=int(payload["n_samples"]),
+        )
+
+
+class RunningMoments:
+    """Chunk-wise mean/variance accumulator (Chan et al. parallel update)."""
+
+    def __init__(self, n_columns: int) -> None:
+        self.count = 0
+        self.mean = np.zeros(n_columns, dtype=np.float64)
+        self.m2 = np.zeros(n_columns, dtype=np.float64)
+
+    def update(self, chunk: np.ndarray) -> None:
+        """Fold a 2-D ``(rows, columns)`` chunk into the running moments."""
+
+        n_b = chunk.shape[0]
+        if n_b == 0:
+            return
+        mean_b = chunk.mean(axis=0, dtype=np.float64)
+        m2_b = np.square(chunk - mean_b).sum(axis=0)
+
+        n_a = self.count
+        total = n_a + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * (n_b / total)
+        self.m2 += m2_b + np.square(delta) * (n_a * n_b / total)
+        self.count = total
+
+    def to_scaler(self) -> ScalerStats:
+        """Return the accumulated statistics as a scaler."""
+
+        if self.count == 0:
+            raise ValueError("Cannot fit scaler statistics on an empty dataset")
+        return ScalerStats(
+            mean=self.mean.copy(), var=self.m2 / self.count, n_samples=self.count
+        )
+
+
+def ffill_inplace(block: np.ndarray, carry: np.ndarray) -> None:
+    """Forward-fill NaNs in a 2-D block column-wise, continuing from ``carry``.
+
+    ``carry`` holds the last valid value per column from previous blocks and is
+    updated to the last value of this block on return.
+    """
+
+    if block.shape[0] == 0:
+        return
+    mask = np.isnan(block)
+    for j in np.flatnonzero(mask.any(axis=0)):
+        column = block[:, j]
+        idx = np.where(mask[:, j], 0, np.arange(column.shape[0]))
+        np.maximum.accumulate(idx, out=idx)
+        filled = column[idx]
+        filled[np.isnan(filled)] = carry[j]
+        block[:, j] = filled
+    carry[:] = block[-1]
+
+
+def fill_missing_inplace(values: np.ndarray, columns: Sequence[str]) -> None:
+    """Forward- then back-fill NaNs column-wise, like ``DataFrame.ffill().bfill()``.
+
+    Raises ``ValueError`` naming the column from ``columns`` that is all NaN,
+    as ``materialize_memmap`` does.
+    """
+
+    block = values.reshape(values.shape[0], -1)
+    carry = np.full(block.shape[1], np.nan, dtype=block.dtype)
+    ffill_inplace(block, carry)
+    # Only leading NaNs survive a forward fill; back-fill them from the first value.
+    for j in np.flatnonzero(np.isnan(block[:1]).any(axis=0)):
+        valid = np.flatnonzero(~np.isnan(block[:, j]))
+        if not valid.size:
+            raise ValueError(f"Column '{columns[j]}' contains no values")
+        block[: valid[0], j] = block[valid[0], j]
+
+
+def read_float32_columns(
+    path: Path, feature_cols: Sequence[str], target_col: str
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Read only the requested CSV columns as float32 feature/target arrays.
+
+    The CSV parser produces float32 directly; each column is then copied once
+    into a C-contiguous ``(n_rows, n_features)`` array, so peak memory stays
+    around twice the final array size.
+    """
+
+    columns: List[str] = [*feature_cols, target_col]
+    df = pd.read_csv(
+        path, usecols=columns, dtype={col: np.float32 for col in columns}
+    )
+    features = np.empty((len(df), len(feature_cols)), dtype=np.float32)
+    for j, col in enumerate(feature_cols):
+        features[:, j] = df[col].to_numpy()
+    targets = df[target_col].to_numpy(dtype=np.float32, copy=True)
+    del df
+    return features, targets
+
+
+def count_rows(path: Path, column: str, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> int:
+    """Count data rows in a CSV by streaming a single column."""
+
+    return sum(
+        len(chunk)
+        for chunk in pd.read_csv(path, usecols=[column], chunksize=chunk_rows)
+    )
+
+
+def materialize_memmap(
+    path: Path,
+    feature_cols: Sequence[str],
+    target_col: str,
+    out_dir: Path,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Stream a CSV into float32 ``.npy`` memmaps with ffill/bfill applied.
+
+    Returns ``(features, targets)`` memmaps of shape ``(n_rows, n_features)``
+    and ``(n_rows,)``. Peak memory is bounded by ``chunk_rows``.
+    """
+
+    columns: List[str] = [*feature_cols, target_col]
+    n_features = len(feature_cols)
+    n_rows = count_rows(path, target_col, chunk_rows)
+    if n_rows == 0:
+        raise ValueError("Dataset contains no rows")
+
+    features = np.lib.format.open_memmap(
+        out_dir / "features.npy", mode="w+", dtype=np.float32, shape=(n_rows, n_features)
+    )
+    targets = np.lib.format.open_memmap(
+        out_dir / "targets.npy", mode="w+", dtype=np.float32, shape=(n_rows,)
+    )
+
+    carry = np.full(len(columns), np.nan, dtype=np.float32)
+    leading = np.zeros(len(columns), dtype=np.int64)
+    offset = 0
+    reader = pd.read_csv(
+        path,
+        usecols=columns,
+        dtype={col: np.float32 for col in columns},
+        chunksize=chunk_rows,
+    )
+    for chunk in reader:
+        block = chunk[columns].to_numpy(dtype=np.float32)
+        # Rows before the first valid value are back-filled once it is known.
+        still_leading = np.isnan(carry)
+        if still_leading.any():
+            valid = ~np.isnan(block[:, still_leading])
+            first = np.where(valid.any(axis=0), valid.argmax(axis=0), block.shape[0])
+            leading[still_leading] += first
+        ffill_inplace(block, carry)
+        end = offset + block.shape[0]
+        features[offset:end] = block[:, :n_features]
+        targets[offset:end] = block[:, n_features]
+        offset = end
+
+    if offset != n_rows:
+        raise ValueError(f"Dataset changed while streaming: expected {n_rows} rows, read {offset}")
+
+    first_valid = np.full(len(columns), np.nan, dtype=np.float32)
+    for j, n_leading in enumerate(leading):
+        if n_leading >= n_rows:
+            raise ValueError(f"Column '{columns[j]}' contains no values")
+        source = features[:, j] if j < n_features else targets
+        first_valid[j] = source[n_leading]
+        if n_leading:
+            source[:n_leading] = first_valid[j]
+
+    features.flush()
+    targets.flush()
+    logger.info(
+        "Materialized %d rows x %d features to %s", n_rows, n_features, out_dir
+    )
+    return features, targets
+
+
+def fit_scalers_chunked(
+    features: np.ndarray,
+    targets: np.ndarray,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+) -> Tuple[ScalerStats, ScalerStats]:
+    """Fit feature and target scalers over row chunks of (memmapped) arrays.
+
+    The result matches ``StandardScaler.fit`` on the same rows; pass only the
+    training prefix so validation and test statistics do not leak in.
+    """
+
+    feature_moments = RunningMoments(features.shape[1])
+    target_moments = RunningMoments(1)
+    for start in range(0, features.shape[0], chunk_rows):
+        stop = start + chunk_rows
+        feature_moments.update(np.asarray(features[start:stop]))
+        target_moments.update(np.asarray(targets[start:stop]).reshape(-1, 1))
+    return feature_moments.to_scaler(), target_moments.to_scaler()
+
+
+def scale_chunked(
+    values: np.ndarray, scaler: ScalerStats, chunk_rows: int = DEFAULT_CHUNK_ROWS
+) -> None:
+    """Standardize a (memmapped) array in place, one row chunk at a time."""
+
+    flat = values.ndim == 1
+    for start in range(0, values.shape[0], chunk_rows):
+        chunk = values[start : start + chunk_rows]
+        scaler.transform_(chunk.reshape(-1, 1) if flat else chunk)
+    if isinstance(values, np.memmap):
+        values.flush()
+
+
+class ShuffleBufferWindowDataset(IterableDataset):
+    """Stream sliding windows from a (memmapped) series through a shuffle buffer.
+
+    Windows are read in contiguous blocks (visited in random order) so access to
+    the backing file stays sequential, then mixed through a bounded buffer.
+    Windows never extend past the end of the arrays they were built from, so
+    each split keeps its own sequence boundaries.
+    """
+
+    def __init__(
+        self,
+        features: np.ndarray,
+        targets: np.ndarray,
+        sequence_length: int = 10,
+        buffer_size: int = DEFAULT_SHUFFLE_BUFFER,
+        block_rows: int = DEFAULT_BLOCK_ROWS,
+        seed: Optional[int] = None,
+    ):
+        self.features = features
+        self.targets = targets
+        self.sequence_length = sequence_length
+        self.buffer_size = max(1, buffer_size)
+        self.block_rows = max(1, block_rows)
+        self.seed = seed
+        self._epoch = 0
+
+    def __len__(self) -> int:
+        return max(0, len(self.features) - self.sequence_length + 1)
+
+    def __iter__(self) -> Iterator[Tuple[torch.Tensor, torch.Tensor]]:
+        seq_len = self.sequence_length
+        seed = None if self.seed is None else self.seed + self._epoch
+        self._epoch += 1
+        rng = np.random.default_rng(seed)
+
+        blocks = np.arange(0, len(self), self.block_rows)
+        rng.shuffle(blocks)
+        worker = get_worker_info()
+        if worker is not None:
+            blocks = blocks[worker.id :: worker.num_workers]
+
+        buffer: List[Tuple[torch.Tensor, torch.Tensor]] = []
+        for start in blocks:
+            stop = min(start + self.block_rows, len(self))
+            x_block = np.asarray(self.features[start : stop + seq_len - 1])
+            y_block = np.asarray(self.targets[start + seq_len - 1 : stop + seq_len - 1])
+            for i in rng.permutation(stop - start):
+                item = (
+                    torch.from_numpy(np.ascontiguousarray(x_block[i : i + seq_len].T)),
+                    torch.from_numpy(y_block[i : i + 1].copy()),
+                )
+                if len(buffer) < self.buffer_size:
+                    buffer.append(item)
+                    continue
+                j = rng.integers(self.buffer_size)
+                yield buffer[j]
+                buffer[j] = item
+
+        rng.shuffle(buffer)
+        yield from buffer
@@ -0,0 +1,202 @@
+"""LSTM trainer implementation for PulseML."""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import math
+from typing import Dict, Iterator, Optional, Tuple
+
+import numpy as np
+import torch
+import torch.nn as nn
+import torch.optim as optim
+
+from .prefetch import PrefetchLoader
+from .timeseries_trainer import TimeSeriesTrainer
+
+logger = logging.getLogger(__name__)
+
+LSTMState = Tuple[torch.Tensor, torch.Tensor]
+
+
+class LSTMForecaster(nn.Module):
+    """Stacked LSTM that forecasts the target from a feature window."""
+
+    def __init__(
+        self,
+        input_size: int,
+        hidden_size: int,
+        num_layers: int,
+        output_size: int,
+        dropout: float = 0.0,
+    ):
+        super().__init__()
+        # nn.LSTM runs the fused oneDNN kernel on CPU and cuDNN on GPU
+        self.lstm = nn.LSTM(
+            input_size,
+            hidden_size,
+            num_layers,
+            batch_first=True,
+            dropout=dropout if num_layers > 1 else 0.0,
+        )
+        self.linear = nn.Linear(hidden_size, output_size)
+
+    def forward_steps(
+        self, x: torch.Tensor, state: Optional[LSTMState] = None
+    ) -> Tuple[torch.Tensor, LSTMState]:
+        """Predict at every step of ``x`` (batch, steps, features)."""
+        out, state = self.lstm(x, state)
+        return self.linear(out), state
+
+    def forward(
+        self, x: torch.Tensor, state: Optional[LSTMState] = None
+    ) -> torch.Tensor:
+        """Forward pass."""
+        # x shape: (batch, features, sequence_length), as produced for the TCN
+        out, _ = self.lstm(x.transpose(1, 2), state)
+        # Take the last time step
+        return self.linear(out[:, -1])
+
+
+class StatefulSegments:
+    """Iterate a series as ``n_streams`` parallel streams in consecutive segments.
+
+    The training split is cut into ``n_streams`` contiguous streams; each batch
+    holds the next ``segment_length`` steps of every stream as
+    ``(features (streams, steps, n_features), targets (streams, steps, 1))``, so
+    hidden state can be carried from one batch to the next.
+    """
+
+    def __init__(
+        self,
+        features: np.ndarray,
+        targets: np.ndarray,
+        n_streams: int,
+        segment_length: int,
+    ):
+        self.n_streams = max(1, min(n_streams, len(features)))
+        self.stream_length = len(features) // self.n_streams
+        n_rows = self.n_streams * self.stream_length
+        self.features = features[:n_rows].reshape(self.n_streams, self.stream_length, -1)
+        self.targets = targets[:n_rows].reshape(self.n_streams, self.stream_length, 1)
+        self.segment_length = max(1, segment_length)
+
+    def __len__(self) -> int:
+        return math.ceil(self.stream_length / self.segment_length)
+
+    def __iter__(self) -> Iterator[Tuple[torch.Tensor, torch.Tensor]]:
+        for start in range(0, self.stream_length, self.segment_length):
+            stop = start + self.segment_length
+            yield (
+                torch.from_numpy(np.ascontiguousarray(self.features[:, start:stop])),
+                torch.from_numpy(np.ascontiguousarray(self.targets[:, start:stop])),
+            )
+
+
+class LSTMTrainer(TimeSeriesTrainer):
+    """LSTM trainer implementation.
+
+    Besides plain windowed training it supports:
+
+    * ``bf16``: run the training forward pass under bfloat16 autocast.
+    * ``tbptt_steps``: truncated BPTT; only the last ``tbptt_steps`` steps of
+      each window are back-propagated, earlier steps just warm up the state.
+    * ``stateful``: train on parallel contiguous streams, carrying (detached)
+      hidden state across batches, with segments of ``tbptt_steps`` (or
+      ``sequence_length``) steps and a loss at every step.
+    """
+
+    model_name = "LSTM"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.bf16 = bool(self.hparams.get("bf16", False))
+        self.tbptt_steps = int(self.hparams.get("tbptt_steps", 0) or 0)
+        self.stateful = bool(self.hparams.get("stateful", False))
+        self._state: Optional[LSTMState] = None
+
+    def _build_model(self, input_size: int) -> LSTMForecaster:
+        """Build LSTM model from hyperparameters."""
+        hidden_size = self.hparams.get("hidden_size", 128)
+        num_layers = self.hparams.get("num_layers", 2)
+        dropout = self.hparams.get("dropout", 0.2)
+        output_size = self.hparams.get("output_size", 1)
+
+        model = LSTMForecaster(
+            input_size=input_size,
+            hidden_size=hidden_size,
+            num_layers=num_layers,
+            output_size=output_size,
+            dropout=dropout,
+        ).to(self.device)
+        model.lstm.flatten_parameters()
+
+        logger.info(
+            f"Built LSTM model: {num_layers} layers, hidden_size={hidden_size}, "
+            f"bf16={self.bf16}, tbptt_steps={self.tbptt_steps}, stateful={self.stateful}"
+        )
+        return model
+
+    def _build_train_loader(
+        self, X_train: np.ndarray, y_train: np.ndarray, streaming: bool, batch_size: int
+    ) -> PrefetchLoader:
+        """Return the training loader; stateful runs iterate parallel streams."""
+        if not self.stateful:
+            return super()._build_train_loader(X_train, y_train, streaming, batch_size)
+        segments = StatefulSegments(
+            X_train,
+            y_train,
+            n_streams=batch_size,
+            segment_length=self.tbptt_steps or self.sequence_length,
+        )
+        return PrefetchLoader(segments, self.device)
+
+    def _autocast(self) -> contextlib.AbstractContextManager:
+        if not self.bf16:
+            return contextlib.nullcontext()
+        return torch.autocast(
+            device_type=torch.device(self.device).type, dtype=torch.bfloat16
+        )
+
+    def _forward_truncated(self, model: LSTMForecaster, x: torch.Tensor) -> torch.Tensor:
+        """Forward a window, back-propagating through its last ``tbptt_steps`` only."""
+        steps = x.shape[-1]
+        if not self.tbptt_steps or self.tbptt_steps >= steps:
+            return model(x)
+        split = steps - self.tbptt_steps
+        with torch.no_grad():
+            _, state = model.lstm(x[:, :, :split].transpose(1, 2))
+        return model(x[:, :, split:], state)
+
+    def _train_step(
+        self,
+        model: nn.Module,
+        batch_features: torch.Tensor,
+        batch_targets: torch.Tensor,
+        optimizer: optim.Optimizer,
+        criterion: nn.Module,
+    ) -> torch.Tensor:
+        """Run one optimization step and return the (device) loss."""
+        optimizer.zero_grad()
+        with self._autocast():
+            if self.stateful:
+                outputs, state = model.forward_steps(batch_features, self._state)
+                self._state = (state[0].detach(), state[1].detach())
+            else:
+                outputs = self._forward_truncated(model, batch_features)
+        loss = criterion(outputs.float(), batch_targets)
+        loss.backward()
+        optimizer.step()
+        return loss.detach()
+
+    def _train_epoch(
+        self,
+        model: nn.Module,
+        train_loader: PrefetchLoader,
+        optimizer: optim.Optimizer,
+        criterion: nn.Module,
+    ) -> Tuple[float, Dict[str, float]]:
+        """Train for one epoch, starting stateful streams from a zero state."""
+        self._state = None
+        return super()._train_epoch(model, train_loader, optimizer, criterion)
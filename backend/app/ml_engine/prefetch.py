@@ -0,0 +1,107 @@
+"""Background batch prefetching for the ML engine."""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from typing import Any, Iterable, Iterator, Sequence
+
+import torch
+
+_DONE = object()
+
+
+class _ProducerError:
+    """Wraps an exception raised on the producer thread."""
+
+    def __init__(self, exc: BaseException) -> None:
+        self.exc = exc
+
+
+class PrefetchLoader:
+    """Prepare upcoming batches on a background thread while the model computes.
+
+    Batches are pulled from ``loader`` on a worker thread, pinned when the
+    target device is CUDA, and copied with ``non_blocking=True`` (on a side
+    stream for CUDA), so host-side data preparation and host-to-device copies
+    overlap with compute on the current batch.
+
+    After each pass ``data_wait_s`` holds the time the consumer spent blocked
+    waiting for data and ``steps`` the number of batches handed out.
+    """
+
+    def __init__(self, loader: Iterable[Sequence[torch.Tensor]], device: str, depth: int = 2):
+        self.loader = loader
+        self.device = torch.device(device)
+        self.depth = max(1, depth)
+        self.use_cuda = self.device.type == "cuda"
+        self._stream = torch.cuda.Stream(device=self.device) if self.use_cuda else None
+        self.data_wait_s = 0.0
+        self.steps = 0
+
+    def __len__(self) -> int:
+        return len(self.loader)  # type: ignore[arg-type]
+
+    def _produce(self, out: "queue.Queue[Any]", stop: threading.Event) -> None:
+        try:
+            for batch in self.loader:
+                if self.use_cuda:
+                    batch = [tensor.pin_memory() for tensor in batch]
+                while not stop.is_set():
+                    try:
+                        out.put(batch, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+                if stop.is_set():
+                    return
+            out.put(_DONE)
+        except BaseException as exc:  # noqa: BLE001 - re-raised on the consumer
+            out.put(_ProducerError(exc))
+
+    def _to_device(self, batch: Sequence[torch.Tensor]) -> list[torch.Tensor]:
+        if self._stream is None:
+            return [tensor.to(self.device, non_blocking=True) for tensor in batch]
+        with torch.cuda.stream(self._stream):
+            return [tensor.to(self.device, non_blocking=True) for tensor in batch]
+
+    def _next(self, source: "queue.Queue[Any]") -> Any:
+        started = time.perf_counter()
+        item = source.get()
+        self.data_wait_s += time.perf_counter() - started
+        if isinstance(item, _ProducerError):
+            raise item.exc
+        if item is _DONE:
+            return None
+        return self._to_device(item)
+
+    def __iter__(self) -> Iterator[list[torch.Tensor]]:
+        self.data_wait_s = 0.0
+        self.steps = 0
+        source: "queue.Queue[Any]" = queue.Queue(maxsize=self.depth)
+        stop = threading.Event()
+        producer = threading.Thread(
+            target=self._produce, args=(source, stop), name="pulseml-prefetch", daemon=True
+        )
+        producer.start()
+        try:
+            upcoming = self._next(source)
+            while upcoming is not None:
+                batch = upcoming
+                if self._stream is not None:
+                    current = torch.cuda.current_stream(self.device)
+                    current.wait_stream(self._stream)
+                    for tensor in batch:
+                        tensor.record_stream(current)
+                # Issue the next copy before handing out the current batch.
+                upcoming = self._next(source)
+                self.steps += 1
+                yield batch
+        finally:
+            stop.set()
+            while producer.is_alive():
+                try:
+                    source.get_nowait()
+                except queue.Empty:
+                    producer.join(timeout=0.1)
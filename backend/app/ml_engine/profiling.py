@@ -0,0 +1,132 @@
+"""On-demand ``torch.profiler`` capture of training steps.
+
+A run is profiled when created with ``profile: true`` or when profiling is
+requested while it trains. The trainer then records a bounded window of
+steps and writes the artifacts below into the run's ``profile`` directory.
+Runs that never request profiling do not create a profiler at all.
+
+torch is imported lazily so the API can use the artifact names.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List
+
+logger = logging.getLogger(__name__)
+
+# Artifact name -> file name in the profile directory
+PROFILE_ARTIFACTS = {
+    "trace": "trace.json",
+    "top_ops": "top_ops.json",
+    "top_ops_table": "top_ops.txt",
+}
+DEFAULT_WAIT_STEPS = 1
+DEFAULT_WARMUP_STEPS = 2
+DEFAULT_ACTIVE_STEPS = 5
+TOP_OPS = 30
+STACK_DEPTH = 5
+
+
+class StepProfiler:
+    """Profile ``wait + warmup + active`` training steps, then stop.
+
+    Captures CPU (and CUDA) ops with input shapes, memory and Python stacks.
+    Call ``step()`` after every training step; ``done`` turns true once the
+    artifacts are written.
+    """
+
+    def __init__(
+        self,
+        out_dir: Path,
+        device: str,
+        wait: int = DEFAULT_WAIT_STEPS,
+        warmup: int = DEFAULT_WARMUP_STEPS,
+        active: int = DEFAULT_ACTIVE_STEPS,
+    ) -> None:
+        import torch.profiler as tp
+
+        self.out_dir = out_dir
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        self.use_cuda = device.startswith("cuda")
+        self.done = False
+        activities = [tp.ProfilerActivity.CPU]
+        if self.use_cuda:
+            activities.append(tp.ProfilerActivity.CUDA)
+        self._profiler = tp.profile(
+            activities=activities,
+            schedule=tp.schedule(wait=wait, warmup=warmup, active=max(1, active), repeat=1),
+            on_trace_ready=self._export,
+            record_shapes=True,
+            profile_memory=True,
+            with_stack=True,
+            experimental_config=_stack_config(),
+        )
+        self._profiler.start()
+
+    def step(self) -> None:
+        """Advance the profiler schedule by one training step."""
+        self._profiler.step()
+        if self.done:
+            self._profiler.stop()
+
+    def close(self) -> None:
+        """Stop a capture that did not reach the end of its window."""
+        if not self.done:
+            self._profiler.stop()
+            logger.warning("Training ended before the profiling window completed")
+
+    def _export(self, profiler: Any) -> None:
+        sort_by = "self_cuda_time_total" if self.use_cuda else "self_cpu_time_total"
+        profiler.export_chrome_trace(str(self.out_dir / PROFILE_ARTIFACTS["trace"]))
+        table = profiler.key_averages(group_by_stack_n=STACK_DEPTH).table(
+            sort_by=sort_by, row_limit=TOP_OPS
+        )
+        (self.out_dir / PROFILE_ARTIFACTS["top_ops_table"]).write_text(table)
+        (self.out_dir / PROFILE_ARTIFACTS["top_ops"]).write_text(
+            json.dumps(_top_ops(profiler, self.use_cuda), indent=2)
+        )
+        self.done = True
+        logger.info(f"Wrote profile of {self.out_dir.parent.name} to {self.out_dir}")
+
+
+def _stack_config() -> Any:
+    """Return the profiler config that keeps Python stacks on op events."""
+    from torch._C._profiler import _ExperimentalConfig
+
+    try:
+        return _ExperimentalConfig(verbose=True)
+    except TypeError:
+        # Older torch records stacks without it
+        return None
+
+
+def _device_attr(event: Any, name: str) -> Any:
+    # torch 2.4 renamed the cuda_* event attributes to device_*
+    return getattr(event, name, None) or getattr(event, name.replace("device", "cuda"), 0)
+
+
+def _top_ops(profiler: Any, use_cuda: bool) -> List[Dict[str, Any]]:
+    """Return the most expensive ops grouped by call stack."""
+    events = sorted(
+        profiler.key_averages(group_by_stack_n=STACK_DEPTH),
+        key=lambda event: _device_attr(event, "self_device_time_total")
+        if use_cuda
+        else event.self_cpu_time_total,
+        reverse=True,
+    )
+    return [
+        {
+            "name": event.key,
+            "calls": event.count,
+            "self_cpu_time_us": event.self_cpu_time_total,
+            "cpu_time_total_us": event.cpu_time_total,
+            "self_device_time_us": _device_attr(event, "self_device_time_total"),
+            "self_cpu_memory_bytes": event.self_cpu_memory_usage,
+            "self_device_memory_bytes": _device_attr(event, "self_device_memory_usage"),
+            "stack": list(event.stack),
+        }
+        for event in events[:TOP_OPS]
+    ]
@@ -0,0 +1,234 @@
+"""Trainer plugin registry for the ML engine.
+
+Trainers are registered by model template name as :class:`TrainerSpec`
+entries. A spec only names the trainer class (``"module:Class"``), which is
+imported on first use, so the worker does not load torch or any trainer
+module until a run actually needs it.
+
+Built-in trainers come from the ``trainer`` field of the model templates in
+:mod:`app.models_registry.registry`. Third-party packages can add trainers by
+exposing a :class:`TrainerSpec` under the ``pulseml.trainers`` entry point
+group.
+
+Each spec also declares the resources a run needs. Estimates are computed
+from hyperparameters and dataset metadata without importing torch and are
+deliberately conservative; the worker uses them to decide how many runs fit
+on the machine at once, and the scheduler uses the compute cost to backfill
+short runs.
+"""
+
+from __future__ import annotations
+
+import importlib
+import logging
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib.metadata import entry_points
+from typing import Any, Callable, Dict, Mapping, Optional, Type
+
+from ..config import settings
+from ..models_registry.registry import get_templates
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "pulseml.trainers"
+
+# Resident memory of a worker process after importing torch and the app
+BASE_PROCESS_MB = 512
+# Copies of the dataset held while preprocessing (raw, scaled, tensors)
+DATA_COPIES = 3
+# Memory used by the shuffle buffer and chunked reads of a streamed dataset
+STREAMING_DATA_MB = 256
+# Weights, gradients and two Adam moments
+PARAMETER_COPIES = 4
+FLOAT_BYTES = 4
+MB = 1024 * 1024
+# Forward plus backward pass relative to a forward pass
+TRAIN_FLOPS_FACTOR = 3
+
+
+@dataclass(frozen=True)
+class ResourceEstimate:
+    """Resources a training run is expected to use."""
+
+    memory_mb: int
+    threads: int
+    # Approximate training compute in GFLOPs
+    cost: float = 0.0
+
+
+ResourceEstimator = Callable[[Mapping[str, Any], Mapping[str, Any]], ResourceEstimate]
+
+
+def _data_mb(hparams: Mapping[str, Any], dataset_meta: Mapping[str, Any]) -> float:
+    n_rows = int(dataset_meta.get("n_rows") or 0)
+    n_columns = int(dataset_meta.get("n_columns") or 1)
+    raw_mb = n_rows * n_columns * FLOAT_BYTES / MB
+    if hparams.get("streaming") or raw_mb >= settings.STREAMING_DATASET_THRESHOLD_MB:
+        return STREAMING_DATA_MB
+    return raw_mb * DATA_COPIES
+
+
+def _estimate(
+    hparams: Mapping[str, Any],
+    dataset_meta: Mapping[str, Any],
+    parameters: float,
+    activation_floats: float,
+    threads: int,
+    flops_per_sample: float = 0.0,
+) -> ResourceEstimate:
+    memory_mb = (
+        BASE_PROCESS_MB
+        + _data_mb(hparams, dataset_meta)
+        + parameters * PARAMETER_COPIES * FLOAT_BYTES / MB
+        + activation_floats * FLOAT_BYTES / MB
+    )
+    n_rows = int(dataset_meta.get("n_rows") or 0)
+    epochs = int(hparams.get("epochs", 50))
+    cost = TRAIN_FLOPS_FACTOR * flops_per_sample * n_rows * epochs / 1e9
+    return ResourceEstimate(
+        memory_mb=int(math.ceil(memory_mb)),
+        threads=int(hparams.get("num_threads", threads)),
+        cost=cost,
+    )
+
+
+def _n_features(dataset_meta: Mapping[str, Any]) -> int:
+    return max(1, int(dataset_meta.get("n_columns") or 2) - 1)
+
+
+def estimate_tcn(hparams: Mapping[str, Any], dataset_meta: Mapping[str, Any]) -> ResourceEstimate:
+    """Estimate resources for a TCN run."""
+
+    levels = int(hparams.get("levels", 4))
+    kernel_size = int(hparams.get("kernel_size", 3))
+    batch_size = int(hparams.get("batch_size", 64))
+    sequence_length = int(hparams.get("sequence_length", 10))
+    channels = [min(32 * (2**i), 256) for i in range(levels)]
+
+    parameters = 0.0
+    in_channels = _n_features(dataset_meta)
+    for out_channels in channels:
+        parameters += kernel_size * out_channels * (in_channels + out_channels)
+        if in_channels != out_channels:
+            parameters += in_channels * out_channels
+        in_channels = out_channels
+    # Two padded convolutions, chomp, activation and dropout outputs per block
+    activations = 8 * batch_size * sum(
+        c * (sequence_length + (kernel_size - 1) * 2**i) for i, c in enumerate(channels)
+    )
+    flops = 2 * parameters * sequence_length
+    return _estimate(
+        hparams, dataset_meta, parameters, activations, threads=2, flops_per_sample=flops
+    )
+
+
+def estimate_lstm(hparams: Mapping[str, Any], dataset_meta: Mapping[str, Any]) -> ResourceEstimate:
+    """Estimate resources for an LSTM run."""
+
+    hidden_size = int(hparams.get("hidden_size", 128))
+    num_layers = int(hparams.get("num_layers", 2))
+    batch_size = int(hparams.get("batch_size", 64))
+    sequence_length = int(hparams.get("sequence_length", 10))
+
+    parameters = 0.0
+    in_features = _n_features(dataset_meta)
+    for _ in range(num_layers):
+        parameters += 4 * hidden_size * (in_features + hidden_size + 2)
+        in_features = hidden_size
+    # Four gates plus cell and hidden state saved for every step
+    activations = 6 * batch_size * sequence_length * hidden_size * num_layers
+    flops = 2 * parameters * sequence_length
+    return _estimate(
+        hparams, dataset_meta, parameters, activations, threads=2, flops_per_sample=flops
+    )
+
+
+def estimate_transformer(
+    hparams: Mapping[str, Any], dataset_meta: Mapping[str, Any]
+) -> ResourceEstimate:
+    """Estimate resources for a Transformer run."""
+
+    d_model = int(hparams.get("d_model", 256))
+    num_heads = int(hparams.get("num_heads", 4))
+    num_layers = int(hparams.get("num_layers", 4))
+    batch_size = int(hparams.get("batch_size", 64))
+    sequence_length = int(hparams.get("sequence_length", 10))
+    tokens = max(1, sequence_length // max(1, int(hparams.get("patch_size", 1))))
+
+    parameters = num_layers * 12 * d_model * d_model + tokens * d_model
+    # Projections, MLP and norms per layer, plus the attention matrix in case
+    # the math kernel is selected instead of a fused one
+    activations = num_layers * batch_size * tokens * (16 * d_model + num_heads * tokens)
+    flops = 2 * parameters * tokens + 4 * num_layers * tokens * tokens * d_model
+    return _estimate(
+        hparams, dataset_meta, parameters, activations, threads=4, flops_per_sample=flops
+    )
+
+
+def _default_estimator(
+    hparams: Mapping[str, Any], dataset_meta: Mapping[str, Any]
+) -> ResourceEstimate:
+    return _estimate(hparams, dataset_meta, parameters=0, activation_floats=0, threads=1)
+
+
+BUILTIN_ESTIMATORS: Dict[str, ResourceEstimator] = {
+    "TCN": estimate_tcn,
+    "LSTM": estimate_lstm,
+    "Transformer": estimate_transformer,
+}
+
+
+@dataclass(frozen=True)
+class TrainerSpec:
+    """Registry entry describing how to load and size a trainer."""
+
+    name: str
+    trainer: str
+    estimate_resources: ResourceEstimator = _default_estimator
+
+    def load(self) -> Type[Any]:
+        """Import and return the trainer class."""
+
+        module_name, _, attribute = self.trainer.partition(":")
+        module = importlib.import_module(module_name)
+        return getattr(module, attribute)
+
+
+def _entry_point_specs() -> Dict[str, TrainerSpec]:
+    specs: Dict[str, TrainerSpec] = {}
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        try:
+            spec = entry_point.load()
+        except Exception as exc:  # noqa: BLE001 - a broken plugin must not stop the worker
+            logger.error(f"Failed to load trainer plugin {entry_point.name}: {exc}")
+            continue
+        if not isinstance(spec, TrainerSpec):
+            logger.error(f"Trainer plugin {entry_point.name} is not a TrainerSpec")
+            continue
+        specs[spec.name] = spec
+    return specs
+
+
+@lru_cache(1)
+def get_trainer_specs() -> Dict[str, TrainerSpec]:
+    """Return all registered trainer specs keyed by model template name."""
+
+    specs = {
+        template.name: TrainerSpec(
+            name=template.name,
+            trainer=template.trainer,
+            estimate_resources=BUILTIN_ESTIMATORS.get(template.name, _default_estimator),
+        )
+        for template in get_templates()
+        if template.trainer
+    }
+    specs.update(_entry_point_specs())
+    return specs
+
+
+def get_trainer_spec(name: str) -> Optional[TrainerSpec]:
+    """Return the spec registered for a model template, if any."""
+
+    return get_trainer_specs().get(name)
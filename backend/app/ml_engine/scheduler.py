@@ -0,0 +1,121 @@
+"""Resource-aware scheduling of waiting training runs.
+
+Waiting runs are claimed in fair-share rounds: each run carries a
+``queue_seq`` assigned at submission so that a user's n-th waiting run comes
+after every other user's (n-1)-th one, and a user's own waiting runs hold
+their rounds in priority order. :func:`waiting_runs` reads the queue
+in ``(queue_seq, priority DESC, id)`` order, which the
+``ix_training_runs_claim`` partial index serves directly.
+
+The worker hands the scheduler a window of those runs together with their
+resource estimates. Runs are ordered by fair share first (owners with fewer
+running runs go first, then earlier rounds), then by priority and then by
+age. The head of that order is admitted when it fits the worker's remaining
+capacity; otherwise the shortest run that does fit is backfilled, unless the
+head has been waiting longer than the starvation limit, in which case
+capacity is held for it.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Sequence
+
+from sqlalchemy.orm import Query, Session
+
+from ..config import settings
+from ..db import models
+from .registry import ResourceEstimate
+
+logger = logging.getLogger(__name__)
+
+
+def waiting_runs(db: Session, limit: int) -> Query:
+    """Return a locking query for the first ``limit`` waiting runs in claim order."""
+
+    return (
+        db.query(models.TrainingRun)
+        .filter(models.TrainingRun.status.in_(models.WAITING_STATUSES))
+        .order_by(
+            models.TrainingRun.queue_seq.asc(),
+            models.TrainingRun.priority.desc(),
+            models.TrainingRun.id.asc(),
+        )
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+
+
+@dataclass
+class Candidate:
+    """A waiting run and its estimated resource needs."""
+
+    run: models.TrainingRun
+    resources: ResourceEstimate
+
+
+def _waited_seconds(run: models.TrainingRun, now: datetime) -> float:
+    created_at = run.created_at
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    return (now - created_at).total_seconds()
+
+
+class RunScheduler:
+    """Pick the next run to admit from a window of waiting runs."""
+
+    def __init__(self, starvation_seconds: Optional[float] = None) -> None:
+        self.starvation_seconds = (
+            settings.SCHEDULER_STARVATION_SECONDS
+            if starvation_seconds is None
+            else starvation_seconds
+        )
+
+    def order(
+        self, candidates: Sequence[Candidate], running_per_owner: Dict[int, int]
+    ) -> List[Candidate]:
+        """Return candidates in fair-share, round, priority, then age order."""
+
+        return sorted(
+            candidates,
+            key=lambda c: (
+                running_per_owner.get(c.run.owner_id, 0),
+                c.run.queue_seq,
+                -c.run.priority,
+                c.run.id,
+            ),
+        )
+
+    def select(
+        self,
+        candidates: Sequence[Candidate],
+        running_per_owner: Dict[int, int],
+        fits: Callable[[ResourceEstimate], bool],
+        now: Optional[datetime] = None,
+    ) -> Optional[Candidate]:
+        """Return the candidate to admit now, or None to keep waiting."""
+
+        if not candidates:
+            return None
+        ordered = self.order(candidates, running_per_owner)
+        head = ordered[0]
+        if fits(head.resources):
+            return head
+
+        now = now or datetime.now(timezone.utc)
+        if _waited_seconds(head.run, now) >= self.starvation_seconds:
+            # Hold capacity so the head is not starved by a stream of small runs
+            logger.info(f"Reserving capacity for starving training run {head.run.id}")
+            return None
+
+        backfill = [c for c in ordered[1:] if fits(c.resources)]
+        if not backfill:
+            return None
+        chosen = min(backfill, key=lambda c: c.resources.cost)
+        logger.info(
+            f"Backfilling training run {chosen.run.id} while run {head.run.id} "
+            f"waits for {head.resources.memory_mb} MB"
+        )
+        return chosen
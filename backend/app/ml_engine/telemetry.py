@@ -0,0 +1,100 @@
+"""Per-run performance telemetry for the ML engine."""
+
+from __future__ import annotations
+
+import os
+import platform
+import socket
+import time
+from typing import Any, Dict, List, Optional
+
+import torch
+import torch.nn as nn
+
+from ..core.metrics import peak_rss_bytes
+
+PHASES = ("load", "preprocess", "train", "eval")
+
+
+class RunTelemetry:
+    """Collect phase wall times, epoch timings and resource use of one run.
+
+    ``summary()`` returns the JSON stored in ``TrainingRun.perf_summary``;
+    per-epoch rows go to the training log instead, so the summary stays small
+    enough to list across runs.
+    """
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self._phase: Optional[str] = None
+        self._phase_started = self.started
+        self.epoch_seconds: List[float] = []
+        self.train_windows = 0
+        self.train_seconds = 0.0
+        self.data_wait_seconds = 0.0
+        self.param_count: Optional[int] = None
+
+    def enter(self, name: Optional[str]) -> None:
+        """End the current phase and start timing phase ``name`` (None stops)."""
+        now = time.perf_counter()
+        if self._phase is not None:
+            self.phases[self._phase] = (
+                self.phases.get(self._phase, 0.0) + now - self._phase_started
+            )
+        self._phase = name
+        self._phase_started = now
+
+    def record_model(self, model: nn.Module) -> None:
+        """Remember the parameter count of ``model``."""
+        self.param_count = sum(p.numel() for p in model.parameters())
+
+    def record_epoch(self, timing: Dict[str, float], val_seconds: float) -> None:
+        """Add one epoch's ``_train_epoch`` timing and its validation time."""
+        train_seconds = timing["data_wait_s"] + timing["compute_s"]
+        self.epoch_seconds.append(train_seconds + val_seconds)
+        self.train_windows += int(timing["windows"])
+        self.train_seconds += train_seconds
+        self.data_wait_seconds += timing["data_wait_s"]
+
+    def summary(self, device: str) -> Dict[str, Any]:
+        """Return the telemetry collected so far as JSON-serializable data."""
+        self.enter(None)
+        epochs = self.epoch_seconds
+        summary: Dict[str, Any] = {
+            "phases": {
+                f"{name}_s": round(self.phases[name], 4) for name in PHASES if name in self.phases
+            },
+            "total_s": round(time.perf_counter() - self.started, 4),
+            "epochs": len(epochs),
+            "epoch_s": {
+                "first": round(epochs[0], 4),
+                "mean": round(sum(epochs) / len(epochs), 4),
+                "min": round(min(epochs), 4),
+                "max": round(max(epochs), 4),
+            }
+            if epochs
+            else None,
+            "windows_per_sec": round(self.train_windows / self.train_seconds, 2)
+            if self.train_seconds > 0
+            else None,
+            "data_wait_fraction": round(self.data_wait_seconds / self.train_seconds, 4)
+            if self.train_seconds > 0
+            else None,
+            "param_count": self.param_count,
+            "peak_rss_mb": round(peak_rss_bytes() / (1024 * 1024), 1),
+            "threads": torch.get_num_threads(),
+            "interop_threads": torch.get_num_interop_threads(),
+            "host": {
+                "hostname": socket.gethostname(),
+                "cpu_count": os.cpu_count(),
+                "platform": platform.platform(),
+                "python": platform.python_version(),
+                "torch": torch.__version__,
+            },
+        }
+        if device.startswith("cuda") and torch.cuda.is_available():
+            summary["peak_device_memory_mb"] = round(
+                torch.cuda.max_memory_allocated(device) / (1024 * 1024), 1
+            )
+        return summary
@@ -0,0 +1,742 @@
+"""Shared training pipeline for windowed time-series models."""
+
+from __future__ import annotations
+
+import csv
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import torch
+import torch.nn as nn
+import torch.optim as optim
+from torch.utils.data import DataLoader, Dataset as TorchDataset
+
+from ..config import settings
+from ..core import metrics
+from .base_trainer import BaseTrainer
+from .checkpoint import CheckpointManager
+from .data import (
+    DEFAULT_BLOCK_ROWS,
+    DEFAULT_CHUNK_ROWS,
+    DEFAULT_SAMPLE_ROWS,
+    DEFAULT_SHUFFLE_BUFFER,
+    ScalerStats,
+    ShuffleBufferWindowDataset,
+    fill_missing_inplace,
+    fit_scalers_chunked,
+    materialize_memmap,
+    read_float32_columns,
+    scale_chunked,
+)
+from .prefetch import PrefetchLoader
+from .profiling import DEFAULT_ACTIVE_STEPS, StepProfiler
+from .telemetry import RunTelemetry
+
+logger = logging.getLogger(__name__)
+
+
+class TimeSeriesDataset(TorchDataset):
+    """PyTorch dataset for time series data."""
+
+    def __init__(
+        self,
+        features: np.ndarray,
+        targets: np.ndarray,
+        sequence_length: int = 10,
+    ):
+        self.features = features
+        self.targets = targets
+        self.sequence_length = sequence_length
+
+    def __len__(self) -> int:
+        return len(self.features) - self.sequence_length + 1
+
+    def __getitem__(self, idx: int) -> Tuple[torch.Tensor, torch.Tensor]:
+        end_idx = idx + self.sequence_length
+        x = self.features[idx:end_idx]
+        y = self.targets[end_idx - 1]
+        return torch.FloatTensor(x.T), torch.FloatTensor([y])
+
+
+class TimeSeriesTrainer(BaseTrainer):
+    """Base trainer for models that forecast a target from sliding windows.
+
+    Subclasses provide ``_build_model``; data loading, scaling, the training
+    loop, checkpointing and test evaluation are shared.
+    """
+
+    model_name = "time series"
+
+    def __init__(
+        self,
+        dataset: Dict[str, Any],
+        hparams: Dict[str, Any],
+        work_dir: Path,
+        device: str,
+        run_id: int,
+        db_session: Any,
+    ):
+        super().__init__(dataset, hparams, work_dir, device)
+        self.run_id = run_id
+        self.db_session = db_session
+        self.sequence_length = hparams.get("sequence_length", 10)
+        self.train_ratio = hparams.get("train_ratio", 0.7)
+        self.val_ratio = hparams.get("val_ratio", 0.15)
+        # test_ratio = 1 - train_ratio - val_ratio
+        self.scalers_path = work_dir / "scalers.json"
+        self.telemetry = RunTelemetry()
+        # Set only while a requested profile is being captured
+        self._profiler: Optional[StepProfiler] = None
+
+    def _use_streaming(self, dataset_path: Path) -> bool:
+        """Return whether the dataset should be trained out-of-core."""
+        if "streaming" in self.hparams:
+            return bool(self.hparams["streaming"])
+        threshold = settings.STREAMING_DATASET_THRESHOLD_MB * 1024 * 1024
+        return dataset_path.stat().st_size >= threshold
+
+    def _dataset_path(self) -> Path:
+        """Resolve the dataset file on disk."""
+        dataset_path = Path(self.dataset["file_path"])
+        # If path doesn't exist, try resolving relative to DATA_DIR
+        if not dataset_path.exists():
+            dataset_path = Path(settings.DATA_DIR) / dataset_path
+        if not dataset_path.exists():
+            raise FileNotFoundError(f"Dataset file not found: {self.dataset['file_path']}")
+        return dataset_path
+
+    def _resolve_columns(self, df: pd.DataFrame) -> Tuple[List[str], str]:
+        """Return the numeric feature columns and the target column for ``df``."""
+        meta = self.dataset.get("meta", {})
+        columns = meta.get("columns", [])
+
+        # Identify feature, target, and timestamp columns
+        feature_cols = [
+            col["name"]
+            for col in columns
+            if col.get("role") == "feature"
+            and col["name"] in df.columns
+            and col.get("role") != "timestamp"  # Exclude timestamps
+        ]
+        target_cols = [
+            col["name"]
+            for col in columns
+            if col.get("role") == "target" and col["name"] in df.columns
+        ]
+
+        if not feature_cols:
+            available_roles = {col.get("role", "feature") for col in columns}
+            raise ValueError(
+                f"No feature columns found in dataset. "
+                f"Available column roles: {available_roles}. "
+                f"Please set at least one column role to 'feature' in the dataset schema."
+            )
+        if not target_cols:
+            available_roles = {col.get("role", "feature") for col in columns}
+            raise ValueError(
+                f"No target columns found in dataset. "
+                f"Available column roles: {available_roles}. "
+                f"Please set at least one column role to 'target' in the dataset schema. "
+                f"You can do this in the dataset detail page."
+            )
+
+        # Use first target column if multiple
+        target_col = target_cols[0]
+
+        # Filter out non-numeric columns from features
+        numeric_feature_cols = []
+        for col in feature_cols:
+            if pd.api.types.is_numeric_dtype(df[col]):
+                numeric_feature_cols.append(col)
+            else:
+                logger.warning(
+                    f"Skipping non-numeric feature column '{col}' (dtype: {df[col].dtype})"
+                )
+
+        if not numeric_feature_cols:
+            raise ValueError(
+                "No numeric feature columns found. All feature columns must be numeric (int64, float64)."
+            )
+
+        # Ensure target is numeric
+        if not pd.api.types.is_numeric_dtype(df[target_col]):
+            raise ValueError(
+                f"Target column '{target_col}' must be numeric (int64, float64), got {df[target_col].dtype}"
+            )
+
+        return numeric_feature_cols, target_col
+
+    def _read_sample(self, dataset_path: Path) -> pd.DataFrame:
+        """Read the first rows of the feature and target columns for ``_resolve_columns``."""
+        wanted = {
+            col["name"]
+            for col in self.dataset.get("meta", {}).get("columns", [])
+            if col.get("role") in ("feature", "target")
+        }
+        return pd.read_csv(
+            dataset_path, nrows=DEFAULT_SAMPLE_ROWS, usecols=lambda name: name in wanted
+        )
+
+    def _split_sizes(self, n_total: int) -> Tuple[int, int]:
+        """Return the number of train and validation rows."""
+        return int(n_total * self.train_ratio), int(n_total * self.val_ratio)
+
+    def _split(
+        self, X: np.ndarray, y: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Split arrays chronologically into train/val/test slices."""
+        n_train, n_val = self._split_sizes(len(X))
+
+        X_train = X[:n_train]
+        y_train = y[:n_train]
+        X_val = X[n_train : n_train + n_val]
+        y_val = y[n_train : n_train + n_val]
+        X_test = X[n_train + n_val :]
+        y_test = y[n_train + n_val :]
+
+        logger.info(
+            f"Data split: train={len(X_train)}, val={len(X_val)}, test={len(X_test)}"
+        )
+        return X_train, y_train, X_val, y_val, X_test, y_test
+
+    def _load_scalers(
+        self, feature_cols: List[str], target_col: str
+    ) -> Optional[Tuple[ScalerStats, ScalerStats]]:
+        """Return scalers stored with this run, if they match the columns."""
+        if not self.scalers_path.exists():
+            return None
+        payload = json.loads(self.scalers_path.read_text())
+        if payload.get("feature_columns") != feature_cols or payload.get("target_column") != target_col:
+            logger.warning(
+                f"Ignoring stored scalers for run {self.run_id}: dataset columns changed"
+            )
+            return None
+        logger.info(f"Reusing stored scalers from {self.scalers_path}")
+        return (
+            ScalerStats.from_dict(payload["feature"]),
+            ScalerStats.from_dict(payload["target"]),
+        )
+
+    def _standardize(
+        self,
+        X: np.ndarray,
+        y: np.ndarray,
+        feature_cols: List[str],
+        target_col: str,
+        chunk_rows: int,
+    ) -> Tuple[ScalerStats, ScalerStats]:
+        """Standardize ``X``/``y`` in place with statistics of the training split.
+
+        Statistics are fitted in one chunked pass over the training prefix only
+        and stored with the run, so resumed runs and inference reuse them.
+        """
+        scalers = self._load_scalers(feature_cols, target_col)
+        if scalers is None:
+            n_train, _ = self._split_sizes(len(X))
+            scalers = fit_scalers_chunked(X[:n_train], y[:n_train], chunk_rows)
+            self.scalers_path.write_text(
+                json.dumps(
+                    {
+                        "feature_columns": feature_cols,
+                        "target_column": target_col,
+                        "feature": scalers[0].to_dict(),
+                        "target": scalers[1].to_dict(),
+                    }
+                )
+            )
+        feature_scaler, target_scaler = scalers
+        scale_chunked(X, feature_scaler, chunk_rows)
+        scale_chunked(y, target_scaler, chunk_rows)
+        return feature_scaler, target_scaler
+
+    def _load_data_streaming(self, dataset_path: Path) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, ScalerStats, ScalerStats]:
+        """Load data out-of-core into float32 memmaps in the work directory.
+
+        Scaler statistics are fitted in a chunked pass and the memmaps are
+        standardized in place, so memory stays bounded by the chunk size.
+        """
+        chunk_rows = int(self.hparams.get("stream_chunk_rows", DEFAULT_CHUNK_ROWS))
+        self.telemetry.enter("load")
+        sample = self._read_sample(dataset_path)
+        feature_cols, target_col = self._resolve_columns(sample)
+        del sample
+
+        X, y = materialize_memmap(
+            dataset_path, feature_cols, target_col, self.work_dir, chunk_rows
+        )
+        self.telemetry.enter("preprocess")
+        feature_scaler, target_scaler = self._standardize(
+            X, y, feature_cols, target_col, chunk_rows
+        )
+
+        return (*self._split(X, y), feature_scaler, target_scaler)
+
+    def _load_data(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, ScalerStats, ScalerStats]:
+        """Load and preprocess data from dataset.
+
+        Only the needed columns are parsed, directly as float32. Missing values
+        are filled and the arrays standardized in place, and the returned
+        splits are views of the same buffers.
+        """
+        dataset_path = self._dataset_path()
+        self.telemetry.enter("load")
+        sample = self._read_sample(dataset_path)
+        feature_cols, target_col = self._resolve_columns(sample)
+        del sample
+
+        X, y = read_float32_columns(dataset_path, feature_cols, target_col)
+        self.telemetry.enter("preprocess")
+
+        # Handle missing values (equivalent to ffill().bfill())
+        fill_missing_inplace(X, feature_cols)
+        fill_missing_inplace(y, [target_col])
+
+        # Normalize features and target in place
+        feature_scaler, target_scaler = self._standardize(
+            X, y, feature_cols, target_col, DEFAULT_CHUNK_ROWS
+        )
+
+        return (
+            *self._split(X, y),
+            feature_scaler,
+            target_scaler,
+        )
+
+    def _build_model(self, input_size: int) -> nn.Module:
+        """Build the model for ``input_size`` features."""
+        raise NotImplementedError
+
+    def _eval_batch_size(self, batch_size: int) -> int:
+        """Return the batch size of the validation and test loaders."""
+        # Inference needs no activations for backward, so it can batch wider
+        return self.hparams.get("eval_batch_size", batch_size * 4)
+
+    def _build_train_loader(
+        self, X_train: np.ndarray, y_train: np.ndarray, streaming: bool, batch_size: int
+    ) -> PrefetchLoader:
+        """Return the prefetching loader that feeds training batches."""
+        if streaming:
+            train_dataset = ShuffleBufferWindowDataset(
+                X_train,
+                y_train,
+                sequence_length=self.sequence_length,
+                buffer_size=self.hparams.get("shuffle_buffer_size", DEFAULT_SHUFFLE_BUFFER),
+                block_rows=self.hparams.get("stream_block_rows", DEFAULT_BLOCK_ROWS),
+            )
+        else:
+            train_dataset = TimeSeriesDataset(
+                X_train, y_train, sequence_length=self.sequence_length
+            )
+        return PrefetchLoader(
+            DataLoader(train_dataset, batch_size=batch_size, shuffle=not streaming),
+            self.device,
+        )
+
+    def _train_step(
+        self,
+        model: nn.Module,
+        batch_features: torch.Tensor,
+        batch_targets: torch.Tensor,
+        optimizer: optim.Optimizer,
+        criterion: nn.Module,
+    ) -> torch.Tensor:
+        """Run one optimization step and return the (device) loss."""
+        optimizer.zero_grad()
+        outputs = model(batch_features)
+        loss = criterion(outputs, batch_targets)
+        loss.backward()
+        optimizer.step()
+        return loss.detach()
+
+    def _train_epoch(
+        self,
+        model: nn.Module,
+        train_loader: PrefetchLoader,
+        optimizer: optim.Optimizer,
+        criterion: nn.Module,
+    ) -> Tuple[float, Dict[str, float]]:
+        """Train for one epoch.
+
+        Returns the mean batch loss and a timing breakdown of the epoch into
+        time spent waiting for data and the remaining (compute) time, plus
+        training throughput in samples (target values) and windows per second.
+        """
+        model.train()
+        total_loss = torch.zeros((), device=self.device)
+        n_samples = 0
+        n_windows = 0
+        profiler = self._profiler
+        started = time.perf_counter()
+
+        for batch_features, batch_targets in train_loader:
+            # Accumulate on-device; the host only syncs once per epoch
+            total_loss += self._train_step(
+                model, batch_features, batch_targets, optimizer, criterion
+            )
+            # One target value per predicted step
+            n_samples += batch_targets.numel()
+            n_windows += batch_targets.shape[0]
+            if profiler is not None and not profiler.done:
+                profiler.step()
+
+        n_batches = train_loader.steps
+        mean_loss = total_loss.item() / n_batches if n_batches > 0 else 0.0
+        elapsed = time.perf_counter() - started
+        timing = {
+            "data_wait_s": train_loader.data_wait_s,
+            "compute_s": max(0.0, elapsed - train_loader.data_wait_s),
+            "steps": n_batches,
+            "samples": n_samples,
+            "samples_per_sec": n_samples / elapsed if elapsed > 0 else 0.0,
+            "windows": n_windows,
+            "windows_per_sec": n_windows / elapsed if elapsed > 0 else 0.0,
+        }
+        return mean_loss, timing
+
+    def _validate(
+        self, model: nn.Module, val_loader: PrefetchLoader, criterion: nn.Module
+    ) -> float:
+        """Validate model."""
+        model.eval()
+        total_loss = torch.zeros((), device=self.device)
+        n_samples = 0
+
+        with torch.no_grad():
+            for batch_features, batch_targets in val_loader:
+                outputs = model(batch_features)
+                loss = criterion(outputs, batch_targets)
+
+                # Weight by batch size so the result is independent of eval_batch_size
+                total_loss += loss * batch_targets.shape[0]
+                n_samples += batch_targets.shape[0]
+
+        return total_loss.item() / n_samples if n_samples > 0 else 0.0
+
+    def _evaluate_test(
+        self,
+        model: nn.Module,
+        test_loader: PrefetchLoader,
+        target_scaler: ScalerStats,
+    ) -> Dict[str, float]:
+        """Evaluate on test set and return metrics.
+
+        Batch outputs are written into one preallocated tensor, then inverse
+        scaling and RMSE/MAE/MAPE are computed in a single vectorized pass.
+        """
+        model.eval()
+        n_samples = len(test_loader.loader.dataset)
+        predictions: Optional[torch.Tensor] = None
+        targets = torch.empty((n_samples, 1), device=self.device)
+        offset = 0
+
+        with torch.no_grad():
+            for batch_features, batch_targets in test_loader:
+                outputs = model(batch_features)
+                if predictions is None:
+                    predictions = torch.empty(
+                        (n_samples, outputs.shape[1]), device=self.device
+                    )
+                end = offset + outputs.shape[0]
+                predictions[offset:end] = outputs
+                targets[offset:end] = batch_targets
+                offset = end
+
+        if predictions is None:
+            predictions = torch.empty((0, 1), device=self.device)
+
+        # Inverse transform and metrics in float64 on the host
+        preds = predictions.cpu().double().numpy()
+        actual = targets.cpu().double().numpy()
+        scale = target_scaler.scale
+        preds *= scale
+        preds += target_scaler.mean
+        actual *= scale
+        actual += target_scaler.mean
+
+        errors = preds - actual
+        mse = np.mean(np.square(errors))
+        rmse = np.sqrt(mse)
+        mae = np.mean(np.abs(errors))
+        mape = np.mean(np.abs(errors / (actual + 1e-8))) * 100
+
+        return {
+            "test_rmse": float(rmse),
+            "test_mse": float(mse),
+            "test_mae": float(mae),
+            "test_mape": float(mape),
+        }
+
+    def run(self) -> None:
+        """Execute the training routine."""
+        logger.info(f"Starting {self.model_name} training for run {self.run_id}")
+        checkpoints: Optional[CheckpointManager] = None
+
+        try:
+            # Load data
+            dataset_path = self._dataset_path()
+            streaming = self._use_streaming(dataset_path)
+            (
+                X_train,
+                y_train,
+                X_val,
+                y_val,
+                X_test,
+                y_test,
+                feature_scaler,
+                target_scaler,
+            ) = (
+                self._load_data_streaming(dataset_path)
+                if streaming
+                else self._load_data()
+            )
+
+            input_size = X_train.shape[1]
+
+            # Create datasets
+            val_dataset = TimeSeriesDataset(
+                X_val, y_val, sequence_length=self.sequence_length
+            )
+            test_dataset = TimeSeriesDataset(
+                X_test, y_test, sequence_length=self.sequence_length
+            )
+
+            batch_size = self.hparams.get("batch_size", 64)
+            train_loader = self._build_train_loader(
+                X_train, y_train, streaming, batch_size
+            )
+            eval_batch_size = self._eval_batch_size(batch_size)
+            val_loader = PrefetchLoader(
+                DataLoader(val_dataset, batch_size=eval_batch_size, shuffle=False),
+                self.device,
+            )
+            test_loader = PrefetchLoader(
+                DataLoader(test_dataset, batch_size=eval_batch_size, shuffle=False),
+                self.device,
+            )
+
+            # Build model
+            self.telemetry.enter("train")
+            model = self._build_model(input_size)
+            self.telemetry.record_model(model)
+
+            # Setup training
+            learning_rate = self.hparams.get("learning_rate", 0.001)
+            optimizer = optim.Adam(model.parameters(), lr=learning_rate)
+            criterion = nn.MSELoss()
+
+            # Training loop
+            epochs = self.hparams.get("epochs", 50)
+            best_val_loss = float("inf")
+            # Keep the best weights in memory unless the model is too large
+            model_bytes = sum(
+                t.numel() * t.element_size() for t in model.state_dict().values()
+            )
+            in_memory_limit = self.hparams.get(
+                "best_model_in_memory_max_mb", settings.BEST_MODEL_IN_MEMORY_MAX_MB
+            )
+            checkpoints = CheckpointManager(
+                self.work_dir,
+                keep_top_k=self.hparams.get("checkpoint_keep_top_k", 1),
+                keep_last_n=self.hparams.get("checkpoint_keep_last_n", 0),
+                retain_best_in_memory=model_bytes <= in_memory_limit * 1024 * 1024,
+            )
+            best_model_path = checkpoints.best_path
+            logs_path = self.work_dir / "training_log.csv"
+
+            # Initialize CSV log
+            with open(logs_path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(
+                    [
+                        "epoch",
+                        "train_loss",
+                        "val_loss",
+                        "lr",
+                        "data_wait_s",
+                        "compute_s",
+                        "samples_per_sec",
+                        "val_s",
+                        "windows_per_sec",
+                    ]
+                )
+
+            # Get run object for updating progress
+            from ..db import models
+            run = (
+                self.db_session.query(models.TrainingRun)
+                .filter(models.TrainingRun.id == self.run_id)
+                .first()
+            )
+            if run:
+                run.device = self.device
+                run.total_epochs = epochs
+                self.db_session.commit()
+
+            logger.info(f"Training for {epochs} epochs on {self.device}")
+            train_samples = 0
+            train_seconds = 0.0
+
+            for epoch in range(epochs):
+                # Profiling is requested at creation or toggled through the API
+                if self._profiler is None and run and run.profile_requested:
+                    self._profiler = StepProfiler(
+                        self.work_dir / "profile",
+                        self.device,
+                        active=self.hparams.get("profile_steps", DEFAULT_ACTIVE_STEPS),
+                    )
+                    logger.info(f"Profiling training steps of run {self.run_id}")
+                train_loss, timing = self._train_epoch(
+                    model, train_loader, optimizer, criterion
+                )
+                train_samples += timing["samples"]
+                train_seconds += timing["data_wait_s"] + timing["compute_s"]
+                metrics.record_epoch(
+                    self.model_name,
+                    timing["data_wait_s"],
+                    timing["compute_s"],
+                    timing["samples_per_sec"],
+                )
+                val_started = time.perf_counter()
+                val_loss = self._validate(model, val_loader, criterion)
+                val_seconds = time.perf_counter() - val_started
+                self.telemetry.record_epoch(timing, val_seconds)
+
+                # Learning rate (current)
+                current_lr = optimizer.param_groups[0]["lr"]
+
+                # Log to CSV
+                with open(logs_path, "a", newline="") as f:
+                    writer = csv.writer(f)
+                    writer.writerow(
+                        [
+                            epoch + 1,
+                            train_loss,
+                            val_loss,
+                            current_lr,
+                            timing["data_wait_s"],
+                            timing["compute_s"],
+                            timing["samples_per_sec"],
+                            val_seconds,
+                            timing["windows_per_sec"],
+                        ]
+                    )
+
+                # Snapshot best/retained checkpoints; written in the background
+                if checkpoints.update(
+                    epoch + 1,
+                    val_loss,
+                    model,
+                    optimizer,
+                    extra={
+                        "scalers": {
+                            "feature": feature_scaler.to_dict(),
+                            "target": target_scaler.to_dict(),
+                        },
+                    },
+                ):
+                    best_val_loss = val_loss
+
+                # Update current epoch in database every epoch
+                if run:
+                    run.current_epoch = epoch + 1
+                    if self._profiler is not None and self._profiler.done:
+                        run.profile_requested = False
+                        run.profile_path = str(self._profiler.out_dir)
+                        self._profiler = None
+                    self.db_session.commit()
+
+                if (epoch + 1) % 10 == 0:
+                    logger.info(
+                        f"Epoch {epoch + 1}/{epochs}: train_loss={train_loss:.4f}, "
+                        f"val_loss={val_loss:.4f}, lr={current_lr:.6f}, "
+                        f"data_wait={timing['data_wait_s']:.2f}s, "
+                        f"compute={timing['compute_s']:.2f}s, "
+                        f"samples/sec={timing['samples_per_sec']:.0f}"
+                    )
+
+            # Restore the best weights and evaluate on test set. The on-disk
+            # checkpoint is only read back when the model was too large to keep.
+            self.telemetry.enter("eval")
+            best_state = checkpoints.best_model_state()
+            if best_state is None:
+                checkpoints.flush()
+                checkpoint = torch.load(best_model_path, map_location=self.device)
+                best_state = checkpoint["model_state_dict"]
+            model.load_state_dict(best_state)
+            test_metrics = self._evaluate_test(model, test_loader, target_scaler)
+            self.telemetry.enter(None)
+            test_metrics["train_samples_per_sec"] = (
+                train_samples / train_seconds if train_seconds > 0 else 0.0
+            )
+
+            # Make sure the final checkpoint is durable before reporting success
+            checkpoints.close()
+            logger.info(
+                f"Checkpoints: {checkpoints.stats.written} written, "
+                f"{checkpoints.stats.superseded} superseded, "
+                f"{checkpoints.stats.write_seconds:.2f}s in background writes"
+            )
+
+            logger.info(f"Test metrics: {test_metrics}")
+
+            # Update database
+            from ..db import models
+            from datetime import datetime, timezone
+
+            run = (
+                self.db_session.query(models.TrainingRun)
+                .filter(models.TrainingRun.id == self.run_id)
+                .first()
+            )
+
+            if run:
+                run.status = "completed"
+                run.best_metric_name = "val_loss"
+                run.best_metric_value = float(best_val_loss)
+                run.model_checkpoint_path = str(best_model_path)
+                run.logs_path = str(logs_path)
+                run.metrics_summary = test_metrics
+                run.perf_summary = self.telemetry.summary(self.device)
+                run.device = self.device
+                run.current_epoch = epochs
+                run.total_epochs = epochs
+                run.finished_at = datetime.now(timezone.utc)
+                self.db_session.commit()
+                logger.info(f"Updated training run {self.run_id} in database")
+
+        except Exception as e:
+            logger.error(f"Training failed for run {self.run_id}: {e}", exc_info=True)
+            # Update database with error
+            from ..db import models
+            from datetime import datetime, timezone
+
+            run = (
+                self.db_session.query(models.TrainingRun)
+                .filter(models.TrainingRun.id == self.run_id)
+                .first()
+            )
+            if run:
+                run.status = "failed"
+                run.error_message = str(e)
+                run.finished_at = datetime.now(timezone.utc)
+                # Keep whatever was measured before the failure
+                run.perf_summary = self.telemetry.summary(self.device)
+                self.db_session.commit()
+            raise
+        finally:
+            if self._profiler is not None:
+                self._profiler.close()
+                self._profiler = None
+            if checkpoints is not None:
+                checkpoints.abort()
+            self._remove_stream_files()
+
+    def _remove_stream_files(self) -> None:
+        """Delete the memmapped arrays written by the streaming path."""
+        for name in ("features.npy", "targets.npy"):
+            (self.work_dir / name).unlink(missing_ok=True)
@@ -0,0 +1,194 @@
+"""Transformer trainer implementation for PulseML."""
+
+from __future__ import annotations
+
+import logging
+
+import numpy as np
+import torch
+import torch.nn as nn
+import torch.nn.functional as F
+
+from .prefetch import PrefetchLoader
+from .timeseries_trainer import TimeSeriesTrainer
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_TOKENS_PER_BATCH = 65_536
+
+
+class CausalSelfAttention(nn.Module):
+    """Multi-head causal self-attention on ``scaled_dot_product_attention``.
+
+    Causality is requested with ``is_causal=True`` instead of a materialized
+    mask, which lets PyTorch dispatch to the flash / memory-efficient kernels.
+    """
+
+    def __init__(self, d_model: int, num_heads: int, dropout: float = 0.0):
+        super().__init__()
+        self.num_heads = num_heads
+        self.qkv = nn.Linear(d_model, 3 * d_model)
+        self.proj = nn.Linear(d_model, d_model)
+        self.dropout = dropout
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        """Forward pass."""
+        batch, steps, d_model = x.shape
+        q, k, v = (
+            self.qkv(x)
+            .view(batch, steps, 3, self.num_heads, d_model // self.num_heads)
+            .permute(2, 0, 3, 1, 4)
+        )
+        y = F.scaled_dot_product_attention(
+            q,
+            k,
+            v,
+            dropout_p=self.dropout if self.training else 0.0,
+            is_causal=True,
+        )
+        return self.proj(y.transpose(1, 2).reshape(batch, steps, d_model))
+
+
+class TransformerBlock(nn.Module):
+    """Pre-norm transformer block."""
+
+    def __init__(self, d_model: int, num_heads: int, dropout: float = 0.1):
+        super().__init__()
+        self.norm1 = nn.LayerNorm(d_model)
+        self.attn = CausalSelfAttention(d_model, num_heads, dropout)
+        self.norm2 = nn.LayerNorm(d_model)
+        self.mlp = nn.Sequential(
+            nn.Linear(d_model, 4 * d_model),
+            nn.GELU(),
+            nn.Linear(4 * d_model, d_model),
+        )
+        self.dropout = nn.Dropout(dropout)
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        """Forward pass."""
+        x = x + self.dropout(self.attn(self.norm1(x)))
+        return x + self.dropout(self.mlp(self.norm2(x)))
+
+
+class TimeSeriesTransformer(nn.Module):
+    """Causal transformer encoder for time series forecasting.
+
+    The input window is split into non-overlapping patches of ``patch_size``
+    steps, each embedded as one token, which divides the attended sequence
+    length by ``patch_size``.
+    """
+
+    def __init__(
+        self,
+        input_size: int,
+        output_size: int,
+        sequence_length: int,
+        d_model: int = 256,
+        num_heads: int = 4,
+        num_layers: int = 4,
+        dropout: float = 0.1,
+        patch_size: int = 1,
+    ):
+        super().__init__()
+        self.patch_size = patch_size
+        self.embed = nn.Conv1d(input_size, d_model, kernel_size=patch_size, stride=patch_size)
+        self.position = nn.Parameter(
+            torch.zeros(1, sequence_length // patch_size, d_model)
+        )
+        self.blocks = nn.ModuleList(
+            TransformerBlock(d_model, num_heads, dropout) for _ in range(num_layers)
+        )
+        self.norm = nn.LayerNorm(d_model)
+        self.linear = nn.Linear(d_model, output_size)
+        nn.init.normal_(self.position, std=0.02)
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        """Forward pass."""
+        # x shape: (batch, features, sequence_length)
+        remainder = x.shape[-1] % self.patch_size
+        if remainder:
+            # Drop the oldest steps so the last patch ends at the last step
+            x = x[:, :, remainder:]
+        tokens = self.embed(x).transpose(1, 2)
+        h = tokens + self.position[:, -tokens.shape[1] :]
+        for block in self.blocks:
+            h = block(h)
+        # The last token attends to the whole window
+        return self.linear(self.norm(h[:, -1]))
+
+
+class TransformerTrainer(TimeSeriesTrainer):
+    """Transformer trainer implementation.
+
+    Batches are sized by sequence length: training, validation and test
+    batches are capped so that ``batch * tokens`` stays within
+    ``max_tokens_per_batch``.
+    """
+
+    model_name = "Transformer"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.patch_size = self.hparams.get("patch_size", 1)
+        if (
+            not isinstance(self.patch_size, int)
+            or not 1 <= self.patch_size <= self.sequence_length
+        ):
+            raise ValueError(
+                f"patch_size must be between 1 and sequence_length ({self.sequence_length})"
+            )
+        self.max_tokens = self.hparams.get("max_tokens_per_batch", DEFAULT_MAX_TOKENS_PER_BATCH)
+
+    def _tokens_per_window(self) -> int:
+        return self.sequence_length // self.patch_size
+
+    def _cap_batch_size(self, batch_size: int, kind: str) -> int:
+        capped = max(1, min(batch_size, self.max_tokens // self._tokens_per_window()))
+        if capped < batch_size:
+            logger.info(
+                f"Reducing {kind} batch size from {batch_size} to {capped} "
+                f"to stay within {self.max_tokens} tokens per batch"
+            )
+        return capped
+
+    def _build_model(self, input_size: int) -> TimeSeriesTransformer:
+        """Build Transformer model from hyperparameters."""
+        d_model = self.hparams.get("d_model", 256)
+        num_heads = self.hparams.get("num_heads", 4)
+        num_layers = self.hparams.get("num_layers", 4)
+        dropout = self.hparams.get("dropout", 0.1)
+        output_size = self.hparams.get("output_size", 1)
+
+        if d_model % num_heads:
+            raise ValueError(
+                f"d_model ({d_model}) must be divisible by num_heads ({num_heads})"
+            )
+
+        model = TimeSeriesTransformer(
+            input_size=input_size,
+            output_size=output_size,
+            sequence_length=self.sequence_length,
+            d_model=d_model,
+            num_heads=num_heads,
+            num_layers=num_layers,
+            dropout=dropout,
+            patch_size=self.patch_size,
+        ).to(self.device)
+
+        logger.info(
+            f"Built Transformer model: {num_layers} layers, d_model={d_model}, "
+            f"heads={num_heads}, tokens={self._tokens_per_window()}"
+        )
+        return model
+
+    def _build_train_loader(
+        self, X_train: np.ndarray, y_train: np.ndarray, streaming: bool, batch_size: int
+    ) -> PrefetchLoader:
+        """Return the training loader with a sequence-length-aware batch size."""
+        return super()._build_train_loader(
+            X_train, y_train, streaming, self._cap_batch_size(batch_size, "training")
+        )
+
+    def _eval_batch_size(self, batch_size: int) -> int:
+        """Return the evaluation batch size, capped like the training batch."""
+        return self._cap_batch_size(super()._eval_batch_size(batch_size), "evaluation")
@@ -5,14 +5,14 @@ from __future__ import annotations
 import logging
 from pathlib import Path
 
-import torch
-
 logger = logging.getLogger(__name__)
 
 
 def get_available_device() -> str:
     """Return the device string to be used for training."""
 
+    import torch
+
     if torch.cuda.is_available():
         return "cuda"
     return "cpu"
@@ -3,21 +3,47 @@
 from __future__ import annotations
 
 import logging
+import multiprocessing
+import os
 import time
+from dataclasses import dataclass
+from multiprocessing.process import BaseProcess
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
-from sqlalchemy import or_
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from ..config import settings
+from ..core import metrics, query_stats
 from ..db import models
-from ..db.session import SessionLocal
-from .tcn_trainer import TCNTrainer
+from ..db.session import SessionLocal, engine
+from .registry import ResourceEstimate, get_trainer_spec
+from .scheduler import Candidate, RunScheduler, waiting_runs
 from .utils import get_available_device, prepare_work_dir
 
 logger = logging.getLogger(__name__)
 
+# Share of physical memory the worker packs runs into when not configured
+HOST_MEMORY_FRACTION = 0.8
+
+
+def _host_capacity() -> ResourceEstimate:
+    memory_mb = settings.WORKER_MAX_MEMORY_MB
+    if memory_mb <= 0:
+        total = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+        memory_mb = int(total / (1024 * 1024) * HOST_MEMORY_FRACTION)
+    threads = settings.WORKER_MAX_THREADS or os.cpu_count() or 1
+    return ResourceEstimate(memory_mb=memory_mb, threads=threads)
+
+
+@dataclass
+class _ActiveRun:
+    run_id: int
+    process: BaseProcess
+    resources: ResourceEstimate
+    started: float
+
 
 class TrainingWorker:
     """Worker that polls for and executes training runs."""
@@ -26,41 +52,127 @@ class TrainingWorker:
         self,
         poll_interval: float = 5.0,
         work_base_dir: Optional[Path] = None,
+        capacity: Optional[ResourceEstimate] = None,
+        max_concurrent_runs: Optional[int] = None,
     ):
         self.poll_interval = poll_interval
         self.work_base_dir = work_base_dir or Path(settings.DATA_DIR) / "training_runs"
         self.work_base_dir.mkdir(parents=True, exist_ok=True)
+        self.capacity = capacity or _host_capacity()
+        self.max_concurrent_runs = max(
+            1, max_concurrent_runs or settings.WORKER_MAX_CONCURRENT_RUNS
+        )
+        self.scheduler = RunScheduler()
         self.running = False
+        self._active: Dict[int, _ActiveRun] = {}
+        self._mp = multiprocessing.get_context("spawn")
+        # Created on first launch; children forward trainer metrics through it
+        self._metrics_queue: Optional[multiprocessing.Queue] = None
+
+    def _available(self) -> ResourceEstimate:
+        """Return the capacity not taken by active runs."""
+        return ResourceEstimate(
+            memory_mb=self.capacity.memory_mb
+            - sum(active.resources.memory_mb for active in self._active.values()),
+            threads=self.capacity.threads
+            - sum(active.resources.threads for active in self._active.values()),
+        )
 
-    def _claim_run(self, db: Session) -> Optional[models.TrainingRun]:
-        """Safely claim a pending or queued run using database-level locking."""
+    def _fits(self, resources: ResourceEstimate) -> bool:
+        """Return whether a run with ``resources`` can start now."""
+        if not self._active:
+            # Always admit a run on an idle worker, even if it exceeds capacity
+            return True
+        if len(self._active) >= self.max_concurrent_runs:
+            return False
+        available = self._available()
+        return (
+            resources.memory_mb <= available.memory_mb
+            and resources.threads <= available.threads
+        )
+
+    def _estimate_run(
+        self,
+        run: models.TrainingRun,
+        model_template: Optional[models.ModelTemplate],
+        dataset: Optional[models.Dataset],
+    ) -> ResourceEstimate:
+        """Estimate the resources ``run`` needs from its trainer spec."""
+        spec = get_trainer_spec(model_template.name) if model_template else None
+        if spec is None or dataset is None:
+            # Execution fails fast for these runs; let them through cheaply
+            return ResourceEstimate(memory_mb=0, threads=1)
+        hparams = dict(model_template.default_hparams)
+        hparams.update(run.hparams)
+        return spec.estimate_resources(hparams, dataset.meta or {})
+
+    @metrics.CLAIM_LATENCY.time()
+    def _claim_run(
+        self, db: Session
+    ) -> Optional[Tuple[models.TrainingRun, ResourceEstimate]]:
+        """Safely claim a pending or queued run using database-level locking.
+
+        The first waiting runs in claim order are locked and the scheduler
+        picks the one to admit against the worker's remaining capacity.
+        """
         # Use SELECT FOR UPDATE SKIP LOCKED to handle concurrency
         # This ensures only one worker can claim a run at a time
-        run = (
-            db.query(models.TrainingRun)
-            .filter(
-                or_(
-                    models.TrainingRun.status == "pending",
-                    models.TrainingRun.status == "queued",
-                )
+        waiting = waiting_runs(db, settings.SCHEDULER_WINDOW).all()
+        if not waiting:
+            return None
+
+        # Load datasets and templates in one query each while the window is
+        # locked; the session only holds weak references, so keep them here
+        dataset_ids = {run.dataset_id for run in waiting}
+        datasets = {
+            dataset.id: dataset
+            for dataset in db.query(models.Dataset).filter(
+                models.Dataset.id.in_(dataset_ids)
+            )
+        }
+        template_ids = {run.model_template_id for run in waiting}
+        templates = {
+            template.id: template
+            for template in db.query(models.ModelTemplate).filter(
+                models.ModelTemplate.id.in_(template_ids)
             )
-            .order_by(models.TrainingRun.created_at.asc())
-            .with_for_update(skip_locked=True)
-            .first()
+        }
+        candidates = [
+            Candidate(
+                run,
+                self._estimate_run(
+                    run, templates.get(run.model_template_id), datasets.get(run.dataset_id)
+                ),
+            )
+            for run in waiting
+        ]
+        running_per_owner = dict(
+            db.query(models.TrainingRun.owner_id, func.count())
+            .filter(models.TrainingRun.status == "running")
+            .group_by(models.TrainingRun.owner_id)
+            .all()
         )
 
-        if run:
-            # Update status to running atomically
-            from datetime import datetime, timezone
+        chosen = self.scheduler.select(candidates, running_per_owner, self._fits)
+        if chosen is None:
+            # Release the row locks; the runs stay queued for a later poll
+            db.rollback()
+            return None
 
-            run.status = "running"
-            run.started_at = datetime.now(timezone.utc)
-            db.commit()
-            db.refresh(run)
-            logger.info(f"Claimed training run {run.id}")
-            return run
+        # Update status to running atomically
+        from datetime import datetime, timezone
 
-        return None
+        run, resources = chosen.run, chosen.resources
+        run.status = "running"
+        run.started_at = datetime.now(timezone.utc)
+        db.commit()
+        db.refresh(run)
+        logger.info(
+            f"Claimed training run {run.id} "
+            f"(estimated {resources.memory_mb} MB, {resources.threads} threads, "
+            f"{resources.cost:.1f} GFLOPs)"
+        )
+        return run, resources
 
     def _execute_run(self, run: models.TrainingRun, db: Session) -> None:
         """Execute a training run."""
@@ -106,19 +218,20 @@ class TrainingWorker:
                 "meta": dataset.meta,
             }
 
-            # Create and run trainer
-            if model_template.name == "TCN":
-                trainer = TCNTrainer(
-                    dataset=dataset_dict,
-                    hparams=hparams,
-                    work_dir=work_dir,
-                    device=device,
-                    run_id=run.id,
-                    db_session=db,
-                )
-                trainer.run()
-            else:
+            # Create and run trainer; the trainer module is imported on first use
+            spec = get_trainer_spec(model_template.name)
+            if spec is None:
                 raise ValueError(f"Unsupported model template: {model_template.name}")
+            trainer_cls = spec.load()
+            trainer = trainer_cls(
+                dataset=dataset_dict,
+                hparams=hparams,
+                work_dir=work_dir,
+                device=device,
+                run_id=run.id,
+                db_session=db,
+            )
+            trainer.run()
 
             logger.info(f"Successfully completed training run {run.id}")
 
@@ -134,30 +247,112 @@ class TrainingWorker:
             raise
 
     def run_once(self) -> bool:
-        """Execute one training run if available. Returns True if a run was processed."""
+        """Execute one training run in this process if available.
+
+        Returns True if a run was processed.
+        """
         db = SessionLocal()
+        started: Optional[float] = None
         try:
-            run = self._claim_run(db)
-            if run:
-                self._execute_run(run, db)
+            claimed = self._claim_run(db)
+            if claimed:
+                started = time.monotonic()
+                self._execute_run(claimed[0], db)
+                metrics.RUN_DURATION.labels(outcome="succeeded").observe(
+                    time.monotonic() - started
+                )
                 return True
             return False
         except Exception as e:
+            if started is not None:
+                metrics.RUN_DURATION.labels(outcome="failed").observe(
+                    time.monotonic() - started
+                )
             logger.error(f"Error in worker run_once: {e}", exc_info=True)
             return False
         finally:
             db.close()
 
+    def _launch(self, run: models.TrainingRun, resources: ResourceEstimate) -> None:
+        """Execute a claimed run in a child process."""
+        if self._metrics_queue is None:
+            self._metrics_queue = self._mp.Queue()
+        process = self._mp.Process(
+            target=_execute_in_process,
+            args=(run.id, self.work_base_dir, resources.threads, self._metrics_queue),
+            name=f"pulseml-run-{run.id}",
+        )
+        process.start()
+        self._active[run.id] = _ActiveRun(run.id, process, resources, time.monotonic())
+
+    def _drain_metrics(self) -> None:
+        """Apply trainer metrics forwarded by child processes."""
+        if self._metrics_queue is not None:
+            metrics.drain_trainer_metrics(self._metrics_queue)
+
+    def _reap(self) -> None:
+        """Forget finished child processes and fail runs whose process died."""
+        self._drain_metrics()
+        for run_id, active in list(self._active.items()):
+            if active.process.is_alive():
+                continue
+            active.process.join()
+            del self._active[run_id]
+            metrics.RUN_DURATION.labels(
+                outcome="succeeded" if active.process.exitcode == 0 else "failed"
+            ).observe(time.monotonic() - active.started)
+            if active.process.exitcode != 0:
+                self._mark_crashed(run_id, active.process.exitcode)
+
+    def _mark_crashed(self, run_id: int, exitcode: Optional[int]) -> None:
+        """Fail a run whose process exited without recording a final status."""
+        db = SessionLocal()
+        try:
+            run = db.get(models.TrainingRun, run_id)
+            if run and run.status == "running":
+                from datetime import datetime, timezone
+
+                run.status = "failed"
+                run.error_message = f"Training process exited with code {exitcode}"
+                run.finished_at = datetime.now(timezone.utc)
+                db.commit()
+                logger.error(f"Training run {run_id} process exited with code {exitcode}")
+        finally:
+            db.close()
+
+    def fill_capacity(self) -> int:
+        """Claim and launch runs until the next one does not fit.
+
+        Returns the number of runs launched.
+        """
+        launched = 0
+        db = SessionLocal()
+        try:
+            while len(self._active) < self.max_concurrent_runs:
+                claimed = self._claim_run(db)
+                if not claimed:
+                    break
+                self._launch(*claimed)
+                launched += 1
+        except Exception as e:
+            logger.error(f"Error claiming training runs: {e}", exc_info=True)
+        finally:
+            db.close()
+        return launched
+
     def start(self) -> None:
         """Start the worker loop."""
         self.running = True
-        logger.info("Training worker started")
+        logger.info(
+            f"Training worker started (capacity {self.capacity.memory_mb} MB, "
+            f"{self.capacity.threads} threads, {self.max_concurrent_runs} runs)"
+        )
 
         while self.running:
             try:
-                processed = self.run_once()
-                if not processed:
-                    # No runs available, sleep before next poll
+                self._reap()
+                if not self.fill_capacity():
+                    # Nothing new fits, sleep before next poll
                     time.sleep(self.poll_interval)
             except KeyboardInterrupt:
                 logger.info("Worker interrupted by user")
@@ -166,12 +361,71 @@ class TrainingWorker:
                 logger.error(f"Unexpected error in worker loop: {e}", exc_info=True)
                 time.sleep(self.poll_interval)
 
+        for active in self._active.values():
+            logger.info(f"Waiting for training run {active.run_id} to finish")
+            # Keep draining so a child never blocks flushing its metrics
+            while active.process.is_alive():
+                self._drain_metrics()
+                active.process.join(self.poll_interval)
+        self._reap()
+
     def stop(self) -> None:
         """Stop the worker loop."""
         logger.info("Stopping training worker")
         self.running = False
 
 
+def _execute_in_process(
+    run_id: int,
+    work_base_dir: Path,
+    threads: int,
+    metrics_queue: Optional[multiprocessing.Queue] = None,
+) -> None:
+    """Child process entry point executing a single claimed run."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    if metrics_queue is not None:
+        metrics.forward_trainer_metrics(metrics_queue)
+    if settings.QUERY_STATS_ENABLED:
+        query_stats.instrument_engine(engine, "worker", settings.SLOW_QUERY_MS)
+    import torch
+
+    torch.set_num_threads(max(1, threads))
+
+    worker = TrainingWorker(work_base_dir=work_base_dir)
+    db = SessionLocal()
+    try:
+        run = db.get(models.TrainingRun, run_id)
+        if run is None:
+            raise ValueError(f"Training run {run_id} not found")
+        worker._execute_run(run, db)
+    except Exception:
+        # Already logged and recorded on the run by _execute_run
+        raise SystemExit(1)
+    finally:
+        db.close()
+
+
+def _runs_by_status() -> list[tuple[str, int]]:
+    """Count training runs per status for the queue depth gauge."""
+    with SessionLocal() as db:
+        return db.query(models.TrainingRun.status, func.count()).group_by(
+            models.TrainingRun.status
+        ).all()
+
+
+def start_metrics_server(port: int) -> None:
+    """Serve the worker's metrics registry on ``port``."""
+    from prometheus_client import start_http_server
+
+    metrics.register_collector("worker_pool", metrics.PoolCollector(engine, "worker"))
+    metrics.register_collector("run_queue", metrics.QueueDepthCollector(_runs_by_status))
+    start_http_server(port)
+    logger.info(f"Serving worker metrics on port {port}")
+
+
 def main() -> None:
     """Entry point for the worker process."""
     logging.basicConfig(
@@ -179,6 +433,10 @@ def main() -> None:
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
 
+    if settings.METRICS_ENABLED and settings.WORKER_METRICS_PORT:
+        start_metrics_server(settings.WORKER_METRICS_PORT)
+    if settings.QUERY_STATS_ENABLED:
+        query_stats.instrument_engine(engine, "worker", settings.SLOW_QUERY_MS)
     worker = TrainingWorker()
     try:
         worker.start()
@@ -34,6 +34,8 @@ class ModelTemplateDef:
     task_type: str
     default_hparams: Dict[str, object]
     hyperparam_schema: List[HyperParamFieldDef] = field(default_factory=list)
+    # Trainer class as "module:Class"; templates without one cannot be trained yet
+    trainer: str | None = None
 
 
 MODEL_TEMPLATES: List[ModelTemplateDef] = [
@@ -41,6 +43,7 @@ MODEL_TEMPLATES: List[ModelTemplateDef] = [
         id=1,
         name="TCN",
         task_type="time_series_forecasting",
+        trainer="app.ml_engine.tcn_trainer:TCNTrainer",
         default_hparams={
             "input_channels": 1,
             "output_size": 1,
@@ -112,6 +115,7 @@ MODEL_TEMPLATES: List[ModelTemplateDef] = [
         id=2,
         name="LSTM",
         task_type="sequence_modeling",
+        trainer="app.ml_engine.lstm_trainer:LSTMTrainer",
         default_hparams={
             "hidden_size": 128,
             "num_layers": 2,
@@ -119,6 +123,9 @@ MODEL_TEMPLATES: List[ModelTemplateDef] = [
             "learning_rate": 0.001,
             "batch_size": 64,
             "epochs": 30,
+            "tbptt_steps": 0,
+            "stateful": False,
+            "bf16": False,
         },
         hyperparam_schema=[
             HyperParamFieldDef(
@@ -175,6 +182,15 @@ MODEL_TEMPLATES: List[ModelTemplateDef] = [
                 max=500,
                 info="Complete passes through the training data. LSTMs typically need fewer epochs than CNNs due to their sequential processing. Use early stopping to prevent overfitting. Monitor validation metrics to find optimal epoch count.",
             ),
+            HyperParamFieldDef(
+                key="tbptt_steps",
+                label="Truncated BPTT Steps",
+                type="int",
+                default=0,
+                min=0,
+                max=1000,
+                info="Number of trailing time steps that gradients are propagated through. Earlier steps of each window only warm up the hidden state, which cuts memory and time on long sequences. Set to 0 to back-propagate through the whole window.",
+            ),
         ],
     ),
     ModelTemplateDef(
@@ -230,12 +246,17 @@ MODEL_TEMPLATES: List[ModelTemplateDef] = [
         id=4,
         name="Transformer",
         task_type="sequence_modeling",
+        trainer="app.ml_engine.transformer_trainer:TransformerTrainer",
         default_hparams={
             "d_model": 256,
             "num_heads": 4,
             "num_layers": 4,
             "dropout": 0.1,
             "learning_rate": 0.0001,
+            "sequence_length": 32,
+            "patch_size": 1,
+            "batch_size": 64,
+            "epochs": 30,
         },
         hyperparam_schema=[
             HyperParamFieldDef(
@@ -283,6 +304,24 @@ MODEL_TEMPLATES: List[ModelTemplateDef] = [
                 max=1e-2,
                 info="Initial learning rate for optimization. Transformers are sensitive to learning rate and typically use lower values (0.0001-0.001). Strongly recommended to use a warmup schedule (gradual increase) followed by decay for stable training and better convergence.",
             ),
+            HyperParamFieldDef(
+                key="sequence_length",
+                label="Sequence Length",
+                type="int",
+                default=32,
+                min=2,
+                max=4096,
+                info="Number of past time steps in each input window. Attention cost grows with the number of tokens, so long windows are best combined with patching.",
+            ),
+            HyperParamFieldDef(
+                key="patch_size",
+                label="Patch Size",
+                type="int",
+                default=1,
+                min=1,
+                max=64,
+                info="Number of consecutive time steps embedded as one token. Patching divides the attended sequence length by this factor, cutting attention time and memory on long windows. Use 1 to attend over every time step.",
+            ),
         ],
     ),
 ]
@@ -1,10 +1,14 @@
 """Training run API routes."""
 
-from typing import List
+from typing import List, Literal, Optional, Union
 
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import FileResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..core.etag import etag_matches, make_etag, not_modified, set_etag
+from ..core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER
+from ..core.responses import list_response, model_response
 from ..dependencies import get_current_user, get_db
 from ..db import models
 from . import schemas, service
@@ -16,63 +20,166 @@ router = APIRouter()
 async def create_training_run(
     payload: schemas.TrainingRunCreate,
     current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> schemas.TrainingRunRead:
     """Create a training run placeholder."""
 
     training_service = service.TrainingService(db)
-    run = training_service.create_run(current_user, payload)
+    run = await training_service.create_run(current_user, payload)
     return schemas.TrainingRunRead.model_validate(run)
 
 
-@router.get("/", response_model=List[schemas.TrainingRunRead])
+@router.get(
+    "/",
+    response_model=Union[List[schemas.TrainingRunSummary], List[schemas.TrainingRunRead]],
+)
 async def list_training_runs(
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    view: Literal["summary", "full"] = "summary",
     current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db),
-) -> List[schemas.TrainingRunRead]:
-    """List training runs for a user."""
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """List training runs for a user, newest first.
+
+    Pass the ``X-Next-Cursor`` response header back as ``cursor`` to fetch the
+    next page; ``view=full`` includes hyperparameters and metrics.
+    """
 
     training_service = service.TrainingService(db)
-    runs = training_service.list_runs(current_user)
-    return [schemas.TrainingRunRead.model_validate(run) for run in runs]
+    runs, next_cursor = await training_service.list_runs(
+        current_user, limit=limit, cursor=cursor, full=view == "full"
+    )
+    item_schema = schemas.TrainingRunRead if view == "full" else schemas.TrainingRunSummary
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+    return list_response(item_schema, runs, headers=headers)
+
+
+@router.get("/performance", response_model=List[schemas.TrainingRunPerformance])
+async def list_training_performance(
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    model_template_id: Optional[int] = None,
+    current_user: models.User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """List performance telemetry of a user's runs, newest first.
 
+    Each entry pairs the run's ``perf_summary`` with its hyperparameters,
+    device and host so runs can be compared; paginate as for the run list.
+    """
 
-@router.get("/{run_id}", response_model=schemas.TrainingRunRead)
+    training_service = service.TrainingService(db)
+    runs, next_cursor = await training_service.list_performance(
+        current_user, limit=limit, cursor=cursor, model_template_id=model_template_id
+    )
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+    return list_response(schemas.TrainingRunPerformance, runs, headers=headers)
+
+
+@router.get(
+    "/{run_id}",
+    response_model=schemas.TrainingRunRead,
+    responses={304: {"description": "Run unchanged since the given ETag"}},
+)
 async def get_training_run(
     run_id: int,
+    if_none_match: Optional[str] = Header(default=None),
     current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db),
-) -> schemas.TrainingRunRead:
-    """Retrieve a specific training run."""
+    db: AsyncSession = Depends(get_db),
+) -> Response:
+    """Retrieve a specific training run.
+
+    Answers 304 from the row version alone when ``If-None-Match`` carries the
+    run's current ETag.
+    """
 
     training_service = service.TrainingService(db)
-    run = training_service.get_run(current_user, run_id)
-    return schemas.TrainingRunRead.model_validate(run)
+    if if_none_match:
+        version = await training_service.get_run_version(current_user, run_id)
+        etag = make_etag("run", run_id, version)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+    run = await training_service.get_run(current_user, run_id)
+    response = model_response(schemas.TrainingRunRead.model_validate(run))
+    set_etag(response, make_etag("run", run.id, run.version))
+    return response
 
 
 @router.get("/{run_id}/metrics", response_model=schemas.TrainingRunMetrics)
 async def get_training_metrics(
     run_id: int,
     current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db),
-) -> schemas.TrainingRunMetrics:
+    db: AsyncSession = Depends(get_db),
+) -> Response:
     """Return placeholder metrics for a run."""
 
     training_service = service.TrainingService(db)
-    run = training_service.get_run(current_user, run_id)
-    return training_service.get_metrics(run)
+    run = await training_service.get_run(current_user, run_id)
+    return model_response(training_service.get_metrics(run))
+
+
+@router.get("/{run_id}/profile", response_model=schemas.ProfileStatus)
+async def get_training_profile(
+    run_id: int,
+    current_user: models.User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> schemas.ProfileStatus:
+    """Return whether a profile is requested and which artifacts exist."""
+
+    training_service = service.TrainingService(db)
+    run = await training_service.get_run(current_user, run_id)
+    return training_service.profile_status(run)
+
+
+@router.post("/{run_id}/profile", response_model=schemas.ProfileStatus)
+async def set_training_profile(
+    run_id: int,
+    payload: schemas.ProfileRequest,
+    current_user: models.User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> schemas.ProfileStatus:
+    """Turn profiling of a waiting or running run on or off.
+
+    A running run starts capturing at its next epoch; a finished capture
+    replaces the previous artifacts.
+    """
+
+    training_service = service.TrainingService(db)
+    run = await training_service.get_run(current_user, run_id)
+    run = await training_service.set_profiling(run, payload.enabled)
+    return training_service.profile_status(run)
+
+
+@router.get("/{run_id}/profile/{artifact}", response_class=FileResponse)
+async def download_training_profile(
+    run_id: int,
+    artifact: Literal["trace", "top_ops", "top_ops_table"],
+    current_user: models.User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+) -> FileResponse:
+    """Download a profile artifact: the Chrome trace or the top-ops table."""
+
+    training_service = service.TrainingService(db)
+    run = await training_service.get_run(current_user, run_id)
+    path = training_service.profile_artifacts(run).get(artifact)
+    if path is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Profile artifact not found"
+        )
+    return FileResponse(path, filename=f"run-{run.id}-{path.name}")
 
 
 @router.post("/{run_id}/stop", response_model=schemas.TrainingRunRead)
 async def stop_training_run(
     run_id: int,
     current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> schemas.TrainingRunRead:
     """Stop a running training job."""
 
     training_service = service.TrainingService(db)
-    run = training_service.get_run(current_user, run_id)
-    stopped = training_service.stop_run(run)
+    run = await training_service.get_run(current_user, run_id)
+    stopped = await training_service.stop_run(run)
     return schemas.TrainingRunRead.model_validate(stopped)
 
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class TrainingRunCreate(BaseModel):
@@ -12,6 +12,10 @@ class TrainingRunCreate(BaseModel):
     dataset_id: int
     model_template_id: int
     hparams: Dict[str, Any]
+    # Higher priorities are scheduled first among a user's waiting runs
+    priority: int = Field(default=0, ge=-10, le=10)
+    # Capture a torch.profiler window of training steps
+    profile: bool = False
 
 
 class TrainingRunRead(BaseModel):
@@ -22,12 +26,15 @@ class TrainingRunRead(BaseModel):
     dataset_id: int
     model_template_id: int
     status: str
+    priority: int = 0
     hparams: Dict[str, Any]
     best_metric_name: Optional[str] = None
     best_metric_value: Optional[float] = None
     model_checkpoint_path: Optional[str] = None
     logs_path: Optional[str] = None
     metrics_summary: Optional[Dict[str, Any]] = None
+    perf_summary: Optional[Dict[str, Any]] = None
+    profile_requested: bool = False
     device: Optional[str] = None
     current_epoch: Optional[int] = None
     total_epochs: Optional[int] = None
@@ -39,6 +46,59 @@ class TrainingRunRead(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class TrainingRunSummary(BaseModel):
+    """Training run list entry without hyperparameters and metrics."""
+
+    id: int
+    owner_id: int
+    dataset_id: int
+    model_template_id: int
+    status: str
+    priority: int = 0
+    best_metric_name: Optional[str] = None
+    best_metric_value: Optional[float] = None
+    device: Optional[str] = None
+    current_epoch: Optional[int] = None
+    total_epochs: Optional[int] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error_message: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class TrainingRunPerformance(BaseModel):
+    """Performance telemetry of a finished run with the settings it ran with."""
+
+    id: int
+    dataset_id: int
+    model_template_id: int
+    status: str
+    hparams: Dict[str, Any]
+    device: Optional[str] = None
+    metrics_summary: Optional[Dict[str, Any]] = None
+    perf_summary: Optional[Dict[str, Any]] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ProfileRequest(BaseModel):
+    """Payload turning profiling of a run on or off."""
+
+    enabled: bool = True
+
+
+class ProfileStatus(BaseModel):
+    """Profiling state of a run and the artifacts available for download."""
+
+    run_id: int
+    requested: bool
+    artifacts: List[str]
+
+
 class TrainingRunMetrics(BaseModel):
     """Placeholder training metrics response."""
 
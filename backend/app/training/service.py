@@ -3,55 +3,97 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import List
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
 
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..core.pagination import before_cursor, split_page
 from ..db import models
+from ..ml_engine.profiling import PROFILE_ARTIFACTS
 from . import schemas
 
+# First key of the advisory lock taken per owner while assigning a round
+QUEUE_LOCK_KEY = 1
+
 
 class TrainingService:
     """Manage training run persistence operations."""
 
-    def __init__(self, db: Session) -> None:
+    def __init__(self, db: AsyncSession) -> None:
         self.db = db
 
-    def _get_dataset(self, user: models.User, dataset_id: int) -> models.Dataset:
-        dataset = (
-            self.db.query(models.Dataset)
-            .filter(
+    async def _get_dataset(self, user: models.User, dataset_id: int) -> models.Dataset:
+        dataset = await self.db.scalar(
+            select(models.Dataset).where(
                 models.Dataset.id == dataset_id,
                 models.Dataset.owner_id == user.id,
             )
-            .first()
         )
         if not dataset:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Dataset not found")
         return dataset
 
-    def _get_model_template(self, template_id: int) -> models.ModelTemplate:
-        template = (
-            self.db.query(models.ModelTemplate)
-            .filter(models.ModelTemplate.id == template_id)
-            .first()
-        )
+    async def _get_model_template(self, template_id: int) -> models.ModelTemplate:
+        template = await self.db.get(models.ModelTemplate, template_id)
         if not template:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="Model template not found"
             )
         return template
 
-    def create_run(
+    async def _next_queue_seq(self, user: models.User, priority: int = 0) -> int:
+        """Return the fair-share round for a new run of ``user``.
+
+        A user's waiting runs hold one round each, in priority order. A new
+        run takes the round of the user's first waiting run with a lower
+        priority, moving that run and the later ones back a round; otherwise
+        it goes one round after their last waiting run. A user with nothing
+        waiting joins the round currently being served.
+
+        Holds a per-user advisory lock until the transaction ends, so
+        concurrent submissions of one user get distinct rounds.
+        """
+
+        await self.db.execute(select(func.pg_advisory_xact_lock(QUEUE_LOCK_KEY, user.id)))
+        waiting = models.TrainingRun.status.in_(models.WAITING_STATUSES)
+        owner_queue = (models.TrainingRun.owner_id == user.id, waiting)
+        owner_last, first_lower = (
+            await self.db.execute(
+                select(
+                    func.max(models.TrainingRun.queue_seq),
+                    func.min(models.TrainingRun.queue_seq).filter(
+                        models.TrainingRun.priority < priority
+                    ),
+                ).where(*owner_queue)
+            )
+        ).one()
+        if first_lower is not None:
+            await self.db.execute(
+                update(models.TrainingRun)
+                .where(*owner_queue, models.TrainingRun.queue_seq >= first_lower)
+                .values(queue_seq=models.TrainingRun.queue_seq + 1)
+                .execution_options(synchronize_session=False)
+            )
+            return first_lower
+        if owner_last is not None:
+            return owner_last + 1
+        current = await self.db.scalar(
+            select(func.min(models.TrainingRun.queue_seq)).where(waiting)
+        )
+        return current or 0
+
+    async def create_run(
         self,
         user: models.User,
         payload: schemas.TrainingRunCreate,
     ) -> models.TrainingRun:
         """Create a training run placeholder."""
 
-        dataset = self._get_dataset(user, payload.dataset_id)
-        template = self._get_model_template(payload.model_template_id)
+        dataset = await self._get_dataset(user, payload.dataset_id)
+        template = await self._get_model_template(payload.model_template_id)
 
         # Validate dataset has required column roles
         meta = dataset.meta or {}
@@ -89,33 +131,87 @@ class TrainingService:
             dataset_id=dataset.id,
             model_template_id=template.id,
             status="pending",
+            priority=payload.priority,
+            queue_seq=await self._next_queue_seq(user, payload.priority),
             hparams=payload.hparams,
+            profile_requested=payload.profile,
         )
         self.db.add(run)
-        self.db.commit()
-        self.db.refresh(run)
+        await self.db.commit()
+        await self.db.refresh(run)
         return run
 
-    def list_runs(self, user: models.User) -> List[models.TrainingRun]:
-        """List runs for a user."""
+    async def list_runs(
+        self,
+        user: models.User,
+        limit: int,
+        cursor: Optional[str] = None,
+        full: bool = False,
+    ) -> Tuple[Sequence[Any], Optional[str]]:
+        """Return a newest-first page of the user's runs and the next cursor.
 
-        return (
-            self.db.query(models.TrainingRun)
-            .filter(models.TrainingRun.owner_id == user.id)
-            .order_by(models.TrainingRun.created_at.desc())
-            .all()
+        Unless ``full`` is set the JSONB columns are not selected.
+        """
+
+        if full:
+            query = select(models.TrainingRun)
+        else:
+            query = select(
+                *(
+                    getattr(models.TrainingRun, field)
+                    for field in schemas.TrainingRunSummary.model_fields
+                )
+            )
+        query = query.where(models.TrainingRun.owner_id == user.id)
+        if cursor:
+            query = query.where(
+                before_cursor(models.TrainingRun.created_at, models.TrainingRun.id, cursor)
+            )
+        query = query.order_by(
+            models.TrainingRun.created_at.desc(), models.TrainingRun.id.desc()
+        ).limit(limit + 1)
+        result = await self.db.execute(query)
+        rows = result.scalars().all() if full else result.all()
+        return split_page(rows, limit)
+
+    async def list_performance(
+        self,
+        user: models.User,
+        limit: int,
+        cursor: Optional[str] = None,
+        model_template_id: Optional[int] = None,
+    ) -> Tuple[Sequence[Any], Optional[str]]:
+        """Return a newest-first page of the user's runs that recorded telemetry."""
+
+        query = select(
+            *(
+                getattr(models.TrainingRun, field)
+                for field in schemas.TrainingRunPerformance.model_fields
+            )
+        ).where(
+            models.TrainingRun.owner_id == user.id,
+            models.TrainingRun.perf_summary.is_not(None),
         )
+        if model_template_id is not None:
+            query = query.where(models.TrainingRun.model_template_id == model_template_id)
+        if cursor:
+            query = query.where(
+                before_cursor(models.TrainingRun.created_at, models.TrainingRun.id, cursor)
+            )
+        query = query.order_by(
+            models.TrainingRun.created_at.desc(), models.TrainingRun.id.desc()
+        ).limit(limit + 1)
+        rows = (await self.db.execute(query)).all()
+        return split_page(rows, limit)
 
-    def get_run(self, user: models.User, run_id: int) -> models.TrainingRun:
+    async def get_run(self, user: models.User, run_id: int) -> models.TrainingRun:
         """Return a single run if owned by user."""
 
-        run = (
-            self.db.query(models.TrainingRun)
-            .filter(
+        run = await self.db.scalar(
+            select(models.TrainingRun).where(
                 models.TrainingRun.id == run_id,
                 models.TrainingRun.owner_id == user.id,
             )
-            .first()
         )
         if not run:
             raise HTTPException(
@@ -123,6 +219,21 @@ class TrainingService:
             )
         return run
 
+    async def get_run_version(self, user: models.User, run_id: int) -> int:
+        """Return the row version of a run owned by user without loading it."""
+
+        version = await self.db.scalar(
+            select(models.TrainingRun.version).where(
+                models.TrainingRun.id == run_id,
+                models.TrainingRun.owner_id == user.id,
+            )
+        )
+        if version is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Training run not found"
+            )
+        return version
+
     def get_metrics(self, run: models.TrainingRun) -> schemas.TrainingRunMetrics:
         """Return training metrics from log file."""
 
@@ -138,12 +249,23 @@ class TrainingService:
                     with open(logs_path, "r") as f:
                         reader = csv.DictReader(f)
                         for row in reader:
-                            metrics.append({
+                            entry = {
                                 "epoch": int(row.get("epoch", 0)),
                                 "train_loss": float(row.get("train_loss", 0.0)),
                                 "val_loss": float(row.get("val_loss", 0.0)),
                                 "lr": float(row.get("lr", 0.0)),
-                            })
+                            }
+                            # Timing columns are absent from older logs
+                            for key in (
+                                "data_wait_s",
+                                "compute_s",
+                                "samples_per_sec",
+                                "val_s",
+                                "windows_per_sec",
+                            ):
+                                if row.get(key):
+                                    entry[key] = float(row[key])
+                            metrics.append(entry)
                 except Exception as e:
                     # If file exists but can't be read, return empty metrics
                     # Log error but don't fail the request
@@ -153,13 +275,53 @@ class TrainingService:
 
         return schemas.TrainingRunMetrics(run_id=run.id, metrics=metrics)
 
-    def stop_run(self, run: models.TrainingRun) -> models.TrainingRun:
+    async def set_profiling(
+        self, run: models.TrainingRun, enabled: bool
+    ) -> models.TrainingRun:
+        """Request (or cancel) a profile capture for a waiting or running run.
+
+        The trainer picks the request up at its next epoch.
+        """
+
+        if run.status not in (*models.WAITING_STATUSES, "running"):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Training run is no longer active",
+            )
+        run.profile_requested = enabled
+        await self.db.commit()
+        await self.db.refresh(run)
+        return run
+
+    def profile_artifacts(self, run: models.TrainingRun) -> Dict[str, Path]:
+        """Return the profile artifacts written for a run, by artifact name."""
+
+        if not run.profile_path:
+            return {}
+        profile_dir = Path(run.profile_path)
+        return {
+            name: profile_dir / filename
+            for name, filename in PROFILE_ARTIFACTS.items()
+            if (profile_dir / filename).is_file()
+        }
+
+    def profile_status(self, run: models.TrainingRun) -> schemas.ProfileStatus:
+        """Return the profiling state of a run."""
+
+        return schemas.ProfileStatus(
+            run_id=run.id,
+            requested=run.profile_requested,
+            artifacts=list(self.profile_artifacts(run)),
+        )
+
+    async def stop_run(self, run: models.TrainingRun) -> models.TrainingRun:
         """Mark a run as stopped."""
 
         run.status = "stopped"
-        run.finished_at = datetime.now(timezone.utc)
+        # Naive UTC: asyncpg rejects aware datetimes for TIMESTAMP columns
+        run.finished_at = datetime.now(timezone.utc).replace(tzinfo=None)
         self.db.add(run)
-        self.db.commit()
-        self.db.refresh(run)
+        await self.db.commit()
+        await self.db.refresh(run)
         return run
 
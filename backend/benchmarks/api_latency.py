@@ -0,0 +1,166 @@
+"""Measure ``GET /training-runs`` latency under many concurrent clients.
+
+Registers a throwaway user against a running API at ``--url``, uploads a small
+dataset and submits ``--runs`` training runs (stopped straight away so a
+worker leaves them alone). Then ``--clients`` concurrent clients list the
+user's runs ``--requests`` times each, and the script prints p50/p99 latency
+and throughput as JSON.
+
+The script talks HTTP, so it can compare builds. Start the API from each
+commit against the same database and point the script at each one.
+
+The seeded user, dataset and runs are written to the database of the API
+under test, so run it against a scratch database, never a shared one.
+``--database-url`` must name that database: afterwards the script deletes the
+dataset (with its runs and file) over HTTP and then the user row, which has
+no endpoint.
+
+Usage (from ``backend/``)::
+
+    createdb pulseml_bench
+    DATABASE_URL=postgresql+psycopg2://postgres@localhost/pulseml_bench \
+        uvicorn app.main:app --port 8000 &
+    python -m benchmarks.api_latency --url http://localhost:8000 --clients 200 \
+        --database-url postgresql+psycopg2://postgres@localhost/pulseml_bench
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from typing import List
+from uuid import uuid4
+
+import httpx
+from sqlalchemy import create_engine, text
+
+CSV = "timestamp,feature,target\n" + "".join(f"{i},{i * 0.5},{i % 7}\n" for i in range(64))
+
+
+async def seed(client: httpx.AsyncClient, runs: int) -> str:
+    """Create a user with ``runs`` stopped runs and return its access token."""
+
+    credentials = {"email": f"bench-{uuid4().hex[:12]}@example.com", "password": "bench-password"}
+    (await client.post("/api/auth/register", json=credentials)).raise_for_status()
+    login = await client.post("/api/auth/login", json=credentials)
+    login.raise_for_status()
+    client.headers["Authorization"] = f"Bearer {login.json()['access_token']}"
+
+    upload = await client.post(
+        "/api/datasets/upload",
+        files={"file": ("bench.csv", CSV, "text/csv")},
+        data={"name": "api-latency"},
+    )
+    upload.raise_for_status()
+    dataset_id = upload.json()["dataset"]["id"]
+    roles = [{"name": "feature", "role": "feature"}, {"name": "target", "role": "target"}]
+    (
+        await client.put(f"/api/datasets/{dataset_id}/schema", json={"columns": roles})
+    ).raise_for_status()
+
+    templates = await client.get("/api/models/templates")
+    templates.raise_for_status()
+    template = templates.json()[0]
+    for _ in range(runs):
+        created = await client.post(
+            "/api/training-runs/",
+            json={
+                "dataset_id": dataset_id,
+                "model_template_id": template["id"],
+                "hparams": template["default_hparams"],
+            },
+        )
+        created.raise_for_status()
+        (await client.post(f"/api/training-runs/{created.json()['id']}/stop")).raise_for_status()
+    return client.headers["Authorization"]
+
+
+async def cleanup(client: httpx.AsyncClient, database_url: str) -> None:
+    """Delete the user ``seed`` logged ``client`` in as, with everything it owns."""
+
+    me = await client.get("/api/auth/me")
+    me.raise_for_status()
+    # seed uploads a single dataset, so one page holds them all
+    datasets = await client.get("/api/datasets/")
+    datasets.raise_for_status()
+    for dataset in datasets.json():
+        (await client.delete(f"/api/datasets/{dataset['id']}")).raise_for_status()
+
+    engine = create_engine(database_url)
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("DELETE FROM users WHERE id = :id"), {"id": me.json()["id"]})
+    finally:
+        engine.dispose()
+
+
+async def run_client(
+    client: httpx.AsyncClient, requests: int, latencies: List[float], errors: List[int]
+) -> None:
+    for _ in range(requests):
+        started = time.perf_counter()
+        response = await client.get("/api/training-runs/")
+        latencies.append((time.perf_counter() - started) * 1000)
+        if response.status_code != 200:
+            errors.append(response.status_code)
+
+
+async def measure(args: argparse.Namespace) -> dict:
+    limits = httpx.Limits(max_connections=args.clients, max_keepalive_connections=args.clients)
+    latencies: List[float] = []
+    errors: List[int] = []
+    async with httpx.AsyncClient(base_url=args.url, timeout=60) as owner:
+        authorization = await seed(owner, args.runs)
+        try:
+            async with httpx.AsyncClient(
+                base_url=args.url,
+                headers={"Authorization": authorization},
+                limits=limits,
+                timeout=120,
+            ) as client:
+                started = time.perf_counter()
+                await asyncio.gather(
+                    *(
+                        run_client(client, args.requests, latencies, errors)
+                        for _ in range(args.clients)
+                    )
+                )
+                elapsed = time.perf_counter() - started
+        finally:
+            await cleanup(owner, args.database_url)
+
+    percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "url": args.url,
+        "clients": args.clients,
+        "requests": len(latencies),
+        "errors": len(errors),
+        "latency_ms_p50": percentiles[49],
+        "latency_ms_p99": percentiles[98],
+        "latency_ms_max": max(latencies),
+        "requests_per_sec": len(latencies) / elapsed,
+    }
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument(
+        "--database-url",
+        required=True,
+        help="database of the API under test; the seeded user is deleted from it",
+    )
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=20, help="requests per client")
+    parser.add_argument("--runs", type=int, default=100, help="runs owned by the user")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    print(json.dumps(asyncio.run(measure(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
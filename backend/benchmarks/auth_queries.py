@@ -0,0 +1,72 @@
+"""Count database statements per request with and without the principal cache.
+
+Runs the app in-process against a scratch schema in the database at
+``DATABASE_URL`` (dropped afterwards), seeds a throwaway user with one run
+over HTTP, then polls the run status and metrics endpoints ``--requests``
+times with the principal cache disabled and enabled. For each mode it prints
+statements per request and mean request time.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.auth_queries --requests 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from typing import Dict, List
+
+import httpx
+
+from app.auth.cache import principal_cache
+from app.config import settings
+from app.core.query_stats import count_queries
+
+from .api_latency import seed
+from .scratch import scratch_api
+
+SCHEMA = "pulseml_bench_auth"
+
+
+async def poll(client: httpx.AsyncClient, run_id: int, requests: int) -> Dict[str, float]:
+    with count_queries() as stats:
+        started = time.perf_counter()
+        for i in range(requests):
+            path = f"/api/training-runs/{run_id}" + ("/metrics" if i % 2 else "")
+            (await client.get(path)).raise_for_status()
+        elapsed = time.perf_counter() - started
+    return {
+        "statements_per_request": stats.count / requests,
+        "request_ms_mean": elapsed / requests * 1000,
+    }
+
+
+async def measure(requests: int) -> Dict[str, Dict[str, float]]:
+    ttl_before = principal_cache.ttl_seconds
+    async with scratch_api(SCHEMA) as client:
+        await seed(client, runs=1)
+        run_id = (await client.get("/api/training-runs/", params={"limit": 1})).json()[0]["id"]
+
+        results = {}
+        for mode, ttl in (("uncached", 0), ("cached", settings.PRINCIPAL_CACHE_TTL_SECONDS)):
+            principal_cache.ttl_seconds = ttl
+            principal_cache.clear()
+            results[mode] = await poll(client, run_id, requests)
+    principal_cache.ttl_seconds = ttl_before
+    return results
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    print(json.dumps(asyncio.run(measure(args.requests)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Measure worker claim latency with a large backlog of queued runs.
+
+Seeds a scratch schema in the database at ``DATABASE_URL`` with ``--rows``
+waiting runs, most of them from a single owner (a large sweep) and the rest
+spread over ``--owners`` other users. It prints the plan of the claim query
+and times ``TrainingWorker._claim_run``, then drops the schema.
+
+Usage (from ``backend/``, against a Postgres you can create schemas in)::
+
+    python -m benchmarks.claim_latency --rows 100000 --claims 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.ml_engine.registry import ResourceEstimate
+from app.ml_engine.scheduler import waiting_runs
+from app.ml_engine.worker import TrainingWorker
+
+from .scratch import analyze, scratch_schema, seed_runs, seed_users
+
+SCHEMA = "pulseml_bench_claim"
+
+
+def _explain(db: Session, sql: str) -> List[str]:
+    plan = [row[0] for row in db.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {sql}"))]
+    db.rollback()
+    return plan
+
+
+def _claim_sql(db: Session) -> str:
+    query = waiting_runs(db, settings.SCHEDULER_WINDOW)
+    return str(
+        query.statement.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--owners", type=int, default=20)
+    parser.add_argument("--sweep-share", type=float, default=0.8)
+    parser.add_argument("--claims", type=int, default=200)
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    with scratch_schema(SCHEMA) as engine, Session(engine) as db:
+        started = time.perf_counter()
+        users = seed_users(db, args.owners + 1)
+        seed_runs(db, users, args.rows, status="queued", sweep_share=args.sweep_share)
+        analyze(db)
+        print(f"Seeded {args.rows} runs in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+
+        plan = _explain(db, _claim_sql(db))
+        print("\n".join(plan), file=sys.stderr)
+
+        worker = TrainingWorker(
+            work_base_dir=Path(tempfile.mkdtemp()),
+            capacity=ResourceEstimate(memory_mb=10**9, threads=10**6),
+        )
+        latencies = []
+        owners: Counter = Counter()
+        for _ in range(args.claims):
+            started = time.perf_counter()
+            claimed = worker._claim_run(db)
+            latencies.append((time.perf_counter() - started) * 1000)
+            if claimed is None:
+                break
+            owners[claimed[0].owner_id] += 1
+
+    latencies.sort()
+    result = {
+        "rows": args.rows,
+        "claims": len(latencies),
+        "index_scan": any("ix_training_runs_claim" in line for line in plan),
+        "claim_ms_p50": statistics.median(latencies),
+        "claim_ms_p95": latencies[int(len(latencies) * 0.95) - 1],
+        "claim_ms_max": latencies[-1],
+        "distinct_owners_claimed": len(owners),
+        "largest_owner_share": max(owners.values()) / max(1, sum(owners.values())),
+    }
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
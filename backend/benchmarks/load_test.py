@@ -0,0 +1,369 @@
+"""Load-test the API in-process against a disposable Postgres.
+
+Starts a throwaway cluster with ``initdb``/``pg_ctl`` (from ``PATH`` or
+``--pg-bin``) on a free local port, or uses ``--database-url``, which must
+point at an empty database. Creates the tables and seeds ``--users`` users
+with ``--datasets`` datasets each and ``--runs`` runs, mostly completed with
+a training log. ``create_application()`` is then served through
+``httpx.ASGITransport`` to ``--clients`` concurrent clients, each logged in as
+a seeded user and sending ``--requests`` requests drawn from ``MIX``:
+
+- ``run_detail``: ``GET /training-runs/{id}``
+- ``run_detail_etag``: the same with the run's last ``ETag`` in ``If-None-Match``
+- ``run_metrics``: ``GET /training-runs/{id}/metrics``
+- ``list_runs`` and ``list_datasets``: first page of each list
+- ``upload``: ``POST /datasets/upload`` of a ``--upload-rows`` row CSV
+
+For each endpoint it reports p50/p95/p99 latency, errors and the database
+statements issued per request (counted by ``app.core.query_stats``), as JSON (``--output`` writes it to a file).
+PostgreSQL refuses to run as root, so run the script as another user or pass
+``--database-url``.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.load_test --users 200 --runs 100000 --clients 64
+    python -m benchmarks.load_test --pg-bin /usr/lib/postgresql/16/bin --output load.json
+    python -m benchmarks.load_test --database-url postgresql+psycopg2://postgres@localhost/loadtest
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import httpx
+
+# Relative weight of each endpoint in the generated traffic
+MIX = {
+    "run_detail": 30,
+    "run_detail_etag": 20,
+    "run_metrics": 20,
+    "list_runs": 15,
+    "list_datasets": 10,
+    "upload": 5,
+}
+# Share of seeded runs still training; the rest are completed
+RUNNING_SHARE = 0.05
+LOG_COLUMNS = (
+    "epoch,train_loss,val_loss,lr,data_wait_s,compute_s,samples_per_sec,val_s,windows_per_sec"
+)
+
+
+def _pg_tool(name: str, pg_bin: Optional[str]) -> str:
+    path = shutil.which(name, path=pg_bin) if pg_bin else shutil.which(name)
+    if path is None:
+        raise SystemExit(f"{name} not found; pass --pg-bin or --database-url")
+    return path
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def disposable_postgres(pg_bin: Optional[str] = None, max_connections: int = 200) -> Iterator[str]:
+    """Run a throwaway local cluster and yield its ``DATABASE_URL``."""
+
+    if hasattr(os, "geteuid") and os.geteuid() == 0:
+        raise SystemExit("PostgreSQL does not run as root; run as another user or pass --database-url")
+    initdb = _pg_tool("initdb", pg_bin)
+    pg_ctl = _pg_tool("pg_ctl", pg_bin)
+    with tempfile.TemporaryDirectory(prefix="pulseml-pg-") as tmp:
+        data_dir = Path(tmp) / "data"
+        subprocess.run(
+            [initdb, "-D", str(data_dir), "-U", "postgres", "--auth=trust", "-E", "UTF8"],
+            check=True,
+            capture_output=True,
+        )
+        port = _free_port()
+        options = (
+            f"-p {port} -k {tmp} -c listen_addresses=127.0.0.1 "
+            f"-c max_connections={max_connections}"
+        )
+        subprocess.run(
+            [pg_ctl, "start", "-w", "-D", str(data_dir), "-l", str(Path(tmp) / "postgres.log"), "-o", options],
+            check=True,
+            capture_output=True,
+        )
+        try:
+            yield f"postgresql+psycopg2://postgres@127.0.0.1:{port}/postgres"
+        finally:
+            subprocess.run(
+                [pg_ctl, "stop", "-D", str(data_dir), "-m", "fast"], check=False, capture_output=True
+            )
+
+
+def training_log(path: Path, epochs: int) -> Path:
+    """Write a training log CSV of ``epochs`` rows in the trainers' format."""
+
+    rows = [LOG_COLUMNS]
+    for epoch in range(1, epochs + 1):
+        loss = 1.0 / epoch
+        rows.append(
+            f"{epoch},{loss:.6f},{loss * 1.1:.6f},0.001,0.05,0.95,52000.0,0.12,51000.0"
+        )
+    path.write_text("\n".join(rows) + "\n")
+    return path
+
+
+def seed(args: argparse.Namespace, log_path: Path) -> Dict[int, List[int]]:
+    """Seed users, datasets and runs; return run ids by owner."""
+
+    from sqlalchemy import update
+
+    from app.db import models
+    from app.db.session import SessionLocal
+
+    from .scratch import analyze, seed_runs, seed_users
+
+    running = int(args.runs * RUNNING_SHARE)
+    with SessionLocal() as db:
+        users = seed_users(db, args.users, datasets_per_user=args.datasets)
+        seed_runs(db, users, args.runs - running, status="completed")
+        seed_runs(db, users, running, status="running")
+        db.execute(
+            update(models.TrainingRun).values(
+                logs_path=str(log_path),
+                current_epoch=args.epochs,
+                total_epochs=args.epochs,
+                best_metric_name="val_loss",
+                best_metric_value=1.1 / args.epochs,
+                metrics_summary={"test_rmse": 0.42, "test_mae": 0.31, "best_val_loss": 0.05},
+            )
+        )
+        db.commit()
+        analyze(db)
+
+        runs_by_owner: Dict[int, List[int]] = defaultdict(list)
+        for owner_id, run_id in db.query(models.TrainingRun.owner_id, models.TrainingRun.id):
+            runs_by_owner[owner_id].append(run_id)
+    return dict(runs_by_owner)
+
+
+class Recorder:
+    """Latencies and statement counts of the requests sent, per endpoint."""
+
+    def __init__(self, count_queries: Callable[[], Any]) -> None:
+        self.count_queries = count_queries
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statements: Dict[str, List[int]] = defaultdict(list)
+        self.errors: Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+
+    async def send(self, endpoint: str, request: Any, expected: tuple) -> httpx.Response:
+        with self.count_queries() as queries:
+            started = time.perf_counter()
+            response = await request
+            self.latencies[endpoint].append((time.perf_counter() - started) * 1000)
+        self.statements[endpoint].append(queries.count)
+        if response.status_code not in expected:
+            self.errors[endpoint][response.status_code] += 1
+        return response
+
+    def report(self) -> Dict[str, Any]:
+        endpoints = {}
+        for endpoint, latencies in sorted(self.latencies.items()):
+            # quantiles needs two points; a lone request is its own percentile
+            cuts = (
+                statistics.quantiles(latencies, n=100, method="inclusive")
+                if len(latencies) > 1
+                else latencies * 99
+            )
+            statements = self.statements[endpoint]
+            endpoints[endpoint] = {
+                "requests": len(latencies),
+                "errors": dict(self.errors[endpoint]),
+                "latency_ms_p50": round(cuts[49], 2),
+                "latency_ms_p95": round(cuts[94], 2),
+                "latency_ms_p99": round(cuts[98], 2),
+                "latency_ms_max": round(max(latencies), 2),
+                "queries_per_request_mean": round(statistics.fmean(statements), 2),
+                "queries_per_request_max": max(statements),
+            }
+        return endpoints
+
+
+async def run_client(
+    app: Any,
+    recorder: Recorder,
+    user_id: int,
+    run_ids: List[int],
+    args: argparse.Namespace,
+    rng: random.Random,
+) -> None:
+    from app.core.security import create_access_token
+
+    csv = "timestamp,feature,target\n" + "".join(
+        f"{i},{i * 0.5},{i % 7}\n" for i in range(args.upload_rows)
+    )
+    etags: Dict[int, str] = {}
+    endpoints = list(MIX)
+    weights = list(MIX.values())
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport,
+        base_url="http://load-test/api",
+        headers={"Authorization": f"Bearer {create_access_token(str(user_id))}"},
+        timeout=120,
+    ) as client:
+        for _ in range(args.requests):
+            endpoint = rng.choices(endpoints, weights)[0]
+            run_id = rng.choice(run_ids)
+            if endpoint == "run_detail":
+                response = await recorder.send(
+                    endpoint, client.get(f"/training-runs/{run_id}"), (200,)
+                )
+                etags[run_id] = response.headers.get("etag", "")
+            elif endpoint == "run_detail_etag":
+                headers = {"If-None-Match": etags[run_id]} if run_id in etags else {}
+                response = await recorder.send(
+                    endpoint, client.get(f"/training-runs/{run_id}", headers=headers), (200, 304)
+                )
+                etags[run_id] = response.headers.get("etag", "")
+            elif endpoint == "run_metrics":
+                await recorder.send(endpoint, client.get(f"/training-runs/{run_id}/metrics"), (200,))
+            elif endpoint == "list_runs":
+                await recorder.send(endpoint, client.get("/training-runs/"), (200,))
+            elif endpoint == "list_datasets":
+                await recorder.send(endpoint, client.get("/datasets/"), (200,))
+            else:
+                await recorder.send(
+                    endpoint,
+                    client.post(
+                        "/datasets/upload",
+                        files={"file": ("load.csv", csv, "text/csv")},
+                        data={"name": "load-test"},
+                    ),
+                    (201,),
+                )
+
+
+async def drive(args: argparse.Namespace, runs_by_owner: Dict[int, List[int]]) -> Dict[str, Any]:
+    from app.config import settings
+    from app.core.query_stats import count_queries, instrument_engine
+    from app.db.session import async_engine
+    from app.main import create_application
+
+    app = create_application()
+    # Counted even when the app runs without QUERY_STATS_ENABLED
+    instrument_engine(async_engine.sync_engine, "api", settings.SLOW_QUERY_MS)
+    recorder = Recorder(count_queries)
+    owners = sorted(runs_by_owner)
+    try:
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(
+                run_client(
+                    app,
+                    recorder,
+                    owners[i % len(owners)],
+                    runs_by_owner[owners[i % len(owners)]],
+                    args,
+                    random.Random(args.seed + i),
+                )
+                for i in range(args.clients)
+            )
+        )
+        elapsed = time.perf_counter() - started
+    finally:
+        await async_engine.dispose()
+
+    requests = sum(len(latencies) for latencies in recorder.latencies.values())
+    return {
+        "requests": requests,
+        "seconds": round(elapsed, 3),
+        "requests_per_sec": round(requests / elapsed, 1),
+        "endpoints": recorder.report(),
+    }
+
+
+def load_test(args: argparse.Namespace, database_url: str) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory(prefix="pulseml-load-") as tmp:
+        # The app reads its settings and creates its engines on import
+        os.environ["DATABASE_URL"] = database_url
+        os.environ["DATA_DIR"] = str(Path(tmp) / "data")
+        os.environ.pop("ASYNC_DATABASE_URL", None)
+        os.environ.setdefault("SECRET_KEY", "load-test")
+
+        from sqlalchemy import inspect
+
+        from app.db import models  # noqa: F401 - registers the tables
+        from app.db.base import Base
+        from app.db.session import engine
+
+        # Tables are dropped afterwards, so never reuse existing ones
+        if set(Base.metadata.tables) & set(inspect(engine).get_table_names()):
+            raise SystemExit(f"{database_url} already has PulseML tables; use an empty database")
+        Base.metadata.create_all(bind=engine)
+        try:
+            Path(tmp, "data").mkdir()
+            log_path = training_log(Path(tmp) / "training_log.csv", args.epochs)
+            started = time.perf_counter()
+            runs_by_owner = seed(args, log_path)
+            seeded = {
+                "users": args.users,
+                "datasets": args.users * args.datasets,
+                "runs": args.runs,
+                "seconds": round(time.perf_counter() - started, 2),
+            }
+            print(f"Seeded {seeded}", file=sys.stderr)
+            results = asyncio.run(drive(args, runs_by_owner))
+        finally:
+            Base.metadata.drop_all(bind=engine)
+            engine.dispose()
+    return {"seed": seeded, **results}
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", help="empty database to use instead of a disposable one")
+    parser.add_argument("--pg-bin", help="directory holding initdb and pg_ctl")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--datasets", type=int, default=5, help="datasets per user")
+    parser.add_argument("--runs", type=int, default=100_000)
+    parser.add_argument("--epochs", type=int, default=50, help="rows of each run's training log")
+    parser.add_argument("--clients", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=100, help="requests per client")
+    parser.add_argument("--upload-rows", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path)
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] | None = None) -> None:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    config = {key: value for key, value in vars(args).items() if key not in ("output", "database_url")}
+    if args.database_url:
+        results = load_test(args, args.database_url)
+    else:
+        with disposable_postgres(args.pg_bin, max_connections=max(200, args.clients + 50)) as url:
+            results = load_test(args, url)
+
+    body = json.dumps(
+        {"timestamp": datetime.now(timezone.utc).isoformat(), "config": config, **results},
+        indent=2,
+    )
+    if args.output:
+        args.output.write_text(body)
+    else:
+        print(body)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Measure API latency for ordinary requests while a login storm is running.
+
+Seeds a throwaway user against a running API at ``--url``. Then ``--clients``
+clients list training runs ``--requests`` times each, once on a quiet server
+and once while ``--logins`` concurrent clients keep logging in. The script
+prints p50/p99 latency of the listing requests for both phases, plus how the
+logins were answered (200, or 429 once the password-hashing queue is full).
+
+Usage (from ``backend/``)::
+
+    uvicorn app.main:app --port 8000 &
+    python -m benchmarks.login_storm --url http://localhost:8000 --logins 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+from collections import Counter
+from typing import Dict, List
+from uuid import uuid4
+
+import httpx
+
+from .api_latency import run_client, seed
+
+
+async def login_loop(
+    client: httpx.AsyncClient, credentials: Dict[str, str], stop: asyncio.Event, outcomes: Counter
+) -> None:
+    while not stop.is_set():
+        response = await client.post("/api/auth/login", json=credentials)
+        outcomes[response.status_code] += 1
+
+
+async def listing_latency(args: argparse.Namespace, authorization: str) -> Dict[str, float]:
+    latencies: List[float] = []
+    errors: List[int] = []
+    async with httpx.AsyncClient(
+        base_url=args.url, headers={"Authorization": authorization}, timeout=120
+    ) as client:
+        await asyncio.gather(
+            *(run_client(client, args.requests, latencies, errors) for _ in range(args.clients))
+        )
+    percentiles = statistics.quantiles(latencies, n=100)
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "latency_ms_p50": percentiles[49],
+        "latency_ms_p99": percentiles[98],
+    }
+
+
+async def measure(args: argparse.Namespace) -> dict:
+    async with httpx.AsyncClient(base_url=args.url, timeout=60) as client:
+        authorization = await seed(client, runs=10)
+        credentials = {"email": f"storm-{uuid4().hex[:12]}@example.com", "password": "storm-password"}
+        (await client.post("/api/auth/register", json=credentials)).raise_for_status()
+
+    quiet = await listing_latency(args, authorization)
+
+    stop = asyncio.Event()
+    outcomes: Counter = Counter()
+    limits = httpx.Limits(max_connections=args.logins)
+    async with httpx.AsyncClient(base_url=args.url, limits=limits, timeout=120) as storm:
+        logins = [
+            asyncio.create_task(login_loop(storm, credentials, stop, outcomes))
+            for _ in range(args.logins)
+        ]
+        await asyncio.sleep(1)
+        during_storm = await listing_latency(args, authorization)
+        stop.set()
+        await asyncio.gather(*logins)
+
+    return {
+        "url": args.url,
+        "login_clients": args.logins,
+        "quiet": quiet,
+        "during_login_storm": during_storm,
+        "login_responses": {str(code): count for code, count in sorted(outcomes.items())},
+    }
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--logins", type=int, default=100, help="concurrent login clients")
+    parser.add_argument("--clients", type=int, default=20, help="concurrent listing clients")
+    parser.add_argument("--requests", type=int, default=20, help="requests per listing client")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    print(json.dumps(asyncio.run(measure(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
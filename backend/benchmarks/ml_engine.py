@@ -0,0 +1,329 @@
+"""Benchmark the ML engine on a synthetic dataset.
+
+Sections (``--sections``, all by default):
+
+- ``load``: ``_load_data`` wall time and peak traced memory (numpy and
+  Python allocations).
+- ``loader``: windows/sec of one pass over ``TimeSeriesDataset`` through a
+  plain ``DataLoader`` and through the trainer's prefetching loader.
+- ``tcn``: TCN forward and forward/backward step time over the
+  ``--levels`` x ``--kernel-sizes`` x ``--batch-sizes`` grid.
+- ``eval``: ``_evaluate_test`` time on the test split, with the first
+  levels/kernel size of the grid.
+- ``run``: end-to-end ``TCNTrainer.run()`` time and its perf summary.
+
+Trainers run without a database: progress updates are skipped. Results are
+printed (or written with ``--output``) as JSON together with the commit and
+host. ``--baseline`` compares timings against an earlier results file.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.ml_engine --rows 200000 --features 16 --output before.json
+    python -m benchmarks.ml_engine --rows 200000 --features 16 --baseline before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import torch
+import torch.nn as nn
+from torch.utils.data import DataLoader
+
+from app.ml_engine.prefetch import PrefetchLoader
+from app.ml_engine.tcn_trainer import TCNTrainer
+from app.ml_engine.timeseries_trainer import TimeSeriesDataset
+
+from .synthetic import generate, write_dataset
+
+SECTIONS = ("load", "loader", "tcn", "eval", "run")
+
+
+class OfflineSession:
+    """Database session stand-in for which the run row does not exist."""
+
+    def query(self, *entities: Any) -> "OfflineSession":
+        return self
+
+    def filter(self, *criteria: Any) -> "OfflineSession":
+        return self
+
+    def first(self) -> None:
+        return None
+
+    def commit(self) -> None:
+        pass
+
+
+def make_trainer(
+    dataset: Dict[str, Any], work_dir: Path, device: str, **hparams: Any
+) -> TCNTrainer:
+    work_dir.mkdir(parents=True, exist_ok=True)
+    return TCNTrainer(
+        dataset=dataset,
+        hparams=hparams,
+        work_dir=work_dir,
+        device=device,
+        run_id=0,
+        db_session=OfflineSession(),
+    )
+
+
+def _sync(device: str) -> None:
+    if device.startswith("cuda"):
+        torch.cuda.synchronize()
+
+
+def best_of(func: Callable[[], Any], repeat: int, device: str = "cpu") -> float:
+    """Return the fastest of ``repeat`` timed calls, in seconds."""
+
+    best = float("inf")
+    for _ in range(repeat):
+        _sync(device)
+        started = time.perf_counter()
+        func()
+        _sync(device)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def bench_load(args: argparse.Namespace, dataset: Dict[str, Any], work: Path) -> Dict[str, Any]:
+    seconds = []
+    peak = 0
+    for attempt in range(args.repeat):
+        # Fresh work directory so stored scalers are fitted every time
+        trainer = make_trainer(dataset, work / f"load-{attempt}", args.device)
+        tracemalloc.start()
+        started = time.perf_counter()
+        trainer._load_data()
+        seconds.append(time.perf_counter() - started)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return {
+        "seconds": min(seconds),
+        "rows_per_sec": args.rows / min(seconds),
+        "peak_traced_mb": peak / 2**20,
+    }
+
+
+def _drain(batches: Iterable[Any]) -> int:
+    windows = 0
+    for _, targets in batches:
+        windows += targets.shape[0]
+    return windows
+
+
+def bench_loader(args: argparse.Namespace, trainer: TCNTrainer, data: tuple) -> Dict[str, Any]:
+    X_train, y_train = data[0], data[1]
+    batch_size = args.batch_sizes[0]
+    dataset = TimeSeriesDataset(X_train, y_train, sequence_length=args.sequence_length)
+    plain = DataLoader(dataset, batch_size=batch_size, shuffle=True)
+    prefetch = trainer._build_train_loader(X_train, y_train, False, batch_size)
+    results = {}
+    for name, loader in (("dataloader", plain), ("prefetch", prefetch)):
+        seconds = best_of(lambda: _drain(loader), args.repeat, args.device)
+        results[name] = {"seconds": seconds, "windows_per_sec": len(dataset) / seconds}
+    results["batch_size"] = batch_size
+    return results
+
+
+def bench_tcn(args: argparse.Namespace, dataset: Dict[str, Any], work: Path) -> List[Dict[str, Any]]:
+    results = []
+    criterion = nn.MSELoss()
+    for levels in args.levels:
+        for kernel_size in args.kernel_sizes:
+            trainer = make_trainer(
+                dataset, work / "tcn", args.device, levels=levels, kernel_size=kernel_size
+            )
+            torch.manual_seed(0)
+            model = trainer._build_model(args.features)
+            optimizer = torch.optim.Adam(model.parameters(), lr=1e-3)
+            for batch_size in args.batch_sizes:
+                x = torch.randn(batch_size, args.features, args.sequence_length, device=args.device)
+                y = torch.randn(batch_size, 1, device=args.device)
+
+                def forward() -> None:
+                    with torch.no_grad():
+                        model(x)
+
+                def steps() -> None:
+                    for _ in range(args.steps):
+                        trainer._train_step(model, x, y, optimizer, criterion)
+
+                model.train()
+                for _ in range(args.warmup):
+                    trainer._train_step(model, x, y, optimizer, criterion)
+                step_seconds = best_of(steps, args.repeat, args.device) / args.steps
+                forward_seconds = best_of(forward, args.repeat * args.steps, args.device)
+                results.append(
+                    {
+                        "levels": levels,
+                        "kernel_size": kernel_size,
+                        "batch_size": batch_size,
+                        "params": sum(p.numel() for p in model.parameters()),
+                        "forward_ms": forward_seconds * 1000,
+                        "step_ms": step_seconds * 1000,
+                        "windows_per_sec": batch_size / step_seconds,
+                    }
+                )
+                print(
+                    f"levels={levels} kernel={kernel_size} batch={batch_size:>4} "
+                    f"step={step_seconds * 1000:8.2f} ms",
+                    file=sys.stderr,
+                )
+    return results
+
+
+def bench_eval(args: argparse.Namespace, trainer: TCNTrainer, data: tuple) -> Dict[str, Any]:
+    X_test, y_test, target_scaler = data[4], data[5], data[7]
+    test_dataset = TimeSeriesDataset(X_test, y_test, sequence_length=args.sequence_length)
+    loader = PrefetchLoader(
+        DataLoader(test_dataset, batch_size=args.batch_sizes[0] * 4, shuffle=False),
+        args.device,
+    )
+    model = trainer._build_model(args.features)
+    seconds = best_of(
+        lambda: trainer._evaluate_test(model, loader, target_scaler), args.repeat, args.device
+    )
+    return {"seconds": seconds, "windows_per_sec": len(test_dataset) / seconds}
+
+
+def bench_run(args: argparse.Namespace, dataset: Dict[str, Any], work: Path) -> Dict[str, Any]:
+    trainer = make_trainer(
+        dataset,
+        work / "run",
+        args.device,
+        levels=args.levels[0],
+        kernel_size=args.kernel_sizes[0],
+        batch_size=args.batch_sizes[0],
+        sequence_length=args.sequence_length,
+        epochs=args.epochs,
+    )
+    started = time.perf_counter()
+    trainer.run()
+    return {
+        "seconds": time.perf_counter() - started,
+        "epochs": args.epochs,
+        "perf_summary": trainer.telemetry.summary(args.device),
+    }
+
+
+def environment() -> Dict[str, Any]:
+    def git(*command: str) -> Optional[str]:
+        try:
+            return subprocess.run(
+                ["git", *command], capture_output=True, text=True, check=True
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    return {
+        "commit": git("rev-parse", "HEAD"),
+        "dirty": bool(git("status", "--porcelain", "--untracked-files=no")),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "host": platform.node(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "torch": torch.__version__,
+        "threads": torch.get_num_threads(),
+    }
+
+
+def compare(baseline: Any, current: Any, path: str = "") -> List[str]:
+    """Return ``path: old -> new (ratio)`` lines for timings in both results."""
+
+    lines: List[str] = []
+    if isinstance(current, dict) and isinstance(baseline, dict):
+        for key, value in current.items():
+            if key in baseline and key != "environment":
+                lines += compare(baseline[key], value, f"{path}.{key}" if path else key)
+    elif isinstance(current, list) and isinstance(baseline, list):
+        for index, (old, new) in enumerate(zip(baseline, current)):
+            lines += compare(old, new, f"{path}[{index}]")
+    elif (
+        isinstance(current, (int, float))
+        and isinstance(baseline, (int, float))
+        and path.endswith(("seconds", "_ms", "_s"))
+        and baseline > 0
+    ):
+        lines.append(f"{path}: {baseline:.4g} -> {current:.4g} ({current / baseline:.2f}x)")
+    return lines
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sections", nargs="+", choices=SECTIONS, default=list(SECTIONS))
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--features", type=int, default=8)
+    parser.add_argument("--noise", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--sequence-length", type=int, default=32)
+    parser.add_argument("--levels", type=int, nargs="+", default=[2, 4, 6])
+    parser.add_argument("--kernel-sizes", type=int, nargs="+", default=[3, 5])
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[64, 256])
+    parser.add_argument("--steps", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--epochs", type=int, default=2)
+    parser.add_argument("--device", default="cuda" if torch.cuda.is_available() else "cpu")
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--baseline", type=Path)
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] | None = None) -> None:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    frame = generate(args.rows, args.features, args.noise, seed=args.seed)
+    results: Dict[str, Any] = {"environment": environment(), "config": vars(args).copy()}
+    results["config"].pop("output")
+    results["config"].pop("baseline")
+
+    with tempfile.TemporaryDirectory(prefix="pulseml-bench-") as tmp:
+        work = Path(tmp)
+        dataset = write_dataset(work / "series.csv", frame)
+        del frame
+        trainer = make_trainer(
+            dataset,
+            work / "shared",
+            args.device,
+            levels=args.levels[0],
+            kernel_size=args.kernel_sizes[0],
+            sequence_length=args.sequence_length,
+        )
+        data = trainer._load_data() if {"loader", "eval"} & set(args.sections) else None
+
+        if "load" in args.sections:
+            results["load"] = bench_load(args, dataset, work)
+        if "loader" in args.sections:
+            results["loader"] = bench_loader(args, trainer, data)
+        if "tcn" in args.sections:
+            results["tcn"] = bench_tcn(args, dataset, work)
+        if "eval" in args.sections:
+            results["eval"] = bench_eval(args, trainer, data)
+        if "run" in args.sections:
+            results["run"] = bench_run(args, dataset, work)
+
+    body = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(body)
+    else:
+        print(body)
+    if args.baseline:
+        for line in compare(json.loads(args.baseline.read_text()), results):
+            print(line, file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
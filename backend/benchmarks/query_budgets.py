@@ -0,0 +1,116 @@
+"""Check the database query budgets of the main API endpoints.
+
+Runs the app in-process against a scratch schema in the database at
+``DATABASE_URL`` (dropped afterwards) with the principal cache disabled, so
+every request pays for its user lookup. Seeds a throwaway user with one
+dataset and ``--runs`` runs over HTTP, then sends each request of ``BUDGETS``
+inside ``assert_max_queries``. Lists return several rows, so a query per row
+pushes them over budget. Prints the statements of every endpoint as JSON and
+exits non-zero when one is over; ``tests/test_query_budgets.py`` applies the
+same budgets in CI.
+
+Lower a budget when an endpoint gets cheaper; raise one only together with
+the change that needs the extra query.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.query_budgets --runs 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from typing import Any, Dict, List, Tuple
+
+from app.auth.cache import principal_cache
+from app.core.query_stats import assert_max_queries
+
+from .api_latency import CSV, seed
+from .scratch import scratch_api
+
+SCHEMA = "pulseml_bench_budgets"
+
+# name -> (method, path, allowed statements); {run_id} and {dataset_id} refer
+# to the seeded user's newest run and dataset
+BUDGETS: Dict[str, Tuple[str, str, int]] = {
+    "me": ("GET", "/api/auth/me", 1),
+    "list_templates": ("GET", "/api/models/templates", 1),
+    "upload_dataset": ("POST", "/api/datasets/upload", 5),
+    "list_datasets": ("GET", "/api/datasets/", 2),
+    "list_datasets_full": ("GET", "/api/datasets/?view=full", 2),
+    "get_dataset": ("GET", "/api/datasets/{dataset_id}", 2),
+    "create_run": ("POST", "/api/training-runs/", 8),
+    "list_runs": ("GET", "/api/training-runs/", 2),
+    "list_runs_full": ("GET", "/api/training-runs/?view=full", 2),
+    "list_performance": ("GET", "/api/training-runs/performance", 2),
+    "get_run": ("GET", "/api/training-runs/{run_id}", 2),
+    "get_run_not_modified": ("GET", "/api/training-runs/{run_id}", 2),
+    "get_run_metrics": ("GET", "/api/training-runs/{run_id}/metrics", 2),
+    "get_run_profile": ("GET", "/api/training-runs/{run_id}/profile", 2),
+}
+
+
+def _request_kwargs(name: str, ids: Dict[str, Any]) -> Dict[str, Any]:
+    if name == "upload_dataset":
+        return {"files": {"file": ("budget.csv", CSV, "text/csv")}, "data": {"name": "budget"}}
+    if name == "create_run":
+        return {"json": ids["create_run"]}
+    if name == "get_run_not_modified":
+        return {"headers": {"If-None-Match": ids["etag"]}}
+    return {}
+
+
+async def check(runs: int) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+    """Send every request of ``BUDGETS``; return the counts and the failures."""
+
+    ttl_before = principal_cache.ttl_seconds
+    principal_cache.ttl_seconds = 0
+    async with scratch_api(SCHEMA) as client:
+        await seed(client, runs=runs)
+        run = (await client.get("/api/training-runs/", params={"view": "full", "limit": 1})).json()[0]
+        detail = await client.get(f"/api/training-runs/{run['id']}")
+        ids = {
+            "run_id": run["id"],
+            "dataset_id": run["dataset_id"],
+            "etag": detail.headers["etag"],
+            "create_run": {
+                "dataset_id": run["dataset_id"],
+                "model_template_id": run["model_template_id"],
+                "hparams": run["hparams"],
+            },
+        }
+
+        results: Dict[str, Dict[str, Any]] = {}
+        failures: List[str] = []
+        for name, (method, path, budget) in BUDGETS.items():
+            url = path.format(**ids)
+            try:
+                with assert_max_queries(budget, f"{name} ({method} {url})") as stats:
+                    response = await client.request(method, url, **_request_kwargs(name, ids))
+            except AssertionError as e:
+                failures.append(str(e))
+            if response.is_error:
+                response.raise_for_status()
+            results[name] = {"queries": stats.count, "budget": budget, "status": response.status_code}
+    principal_cache.ttl_seconds = ttl_before
+    return results, failures
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="runs owned by the user")
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    results, failures = asyncio.run(check(args.runs))
+    print(json.dumps(results, indent=2))
+    for failure in failures:
+        print(failure, file=sys.stderr)
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Check that hot queries stay on index scans over a large seeded history.
+
+Seeds a scratch schema with ``--runs`` finished runs (plus a small queue and a
+few running ones) and ``--datasets`` datasets, runs the async API services
+and the sync worker claim while recording the SQL they issue, and prints the
+plan of every recorded statement. Exits with status 1 if any of them scans
+``training_runs`` or ``datasets`` sequentially; ``tests/test_query_plans.py``
+runs the same check in CI.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.query_plans --runs 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, List, Tuple
+
+from sqlalchemy import Engine, event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.pagination import DEFAULT_PAGE_SIZE
+from app.datasets.service import DatasetService
+from app.db import models
+from app.ml_engine.registry import ResourceEstimate
+from app.ml_engine.worker import TrainingWorker
+from app.training.service import TrainingService
+
+from .scratch import analyze, async_scratch_engine, scratch_schema, seed_runs, seed_users
+
+SCHEMA = "pulseml_bench_plans"
+WATCHED_TABLES = ("training_runs", "datasets")
+
+
+@contextmanager
+def record_statements(engine: Engine) -> Iterator[List[Tuple[str, Any]]]:
+    """Collect the SELECT statements executed on ``engine``."""
+
+    statements: List[Tuple[str, Any]] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def sequential_scans(plan: List[str]) -> List[str]:
+    """Return plan lines that sequentially scan a watched table."""
+
+    return [
+        line.strip()
+        for line in plan
+        if "Seq Scan" in line and any(f" on {table}" in line for table in WATCHED_TABLES)
+    ]
+
+
+def report(name: str, statement: str, plan: List[str]) -> bool:
+    """Print a statement's plan and return whether it scans a watched table."""
+
+    scans = sequential_scans(plan)
+    status = "SEQ SCAN" if scans else "ok"
+    print(f"[{status}] {name}: {' '.join(statement.split())[:160]}")
+    print("\n".join(f"    {line}" for line in plan))
+    return bool(scans)
+
+
+async def check_api_paths(schema: str, user_id: int) -> int:
+    """Explain the statements the async API services issue for one user."""
+
+    engine = async_scratch_engine(schema)
+    user = models.User(id=user_id)
+    failures = 0
+    try:
+        async with AsyncSession(engine) as db:
+            paths = {
+                "list_runs": lambda: TrainingService(db).list_runs(user, DEFAULT_PAGE_SIZE),
+                "list_datasets": lambda: DatasetService(db).list_datasets(
+                    user, DEFAULT_PAGE_SIZE
+                ),
+                "next_queue_seq": lambda: TrainingService(db)._next_queue_seq(user),
+            }
+            for name, call in paths.items():
+                with record_statements(engine.sync_engine) as statements:
+                    await call()
+                conn = await db.connection()
+                for statement, parameters in statements:
+                    result = await conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+                    failures += report(name, statement, [row[0] for row in result])
+                await db.rollback()
+    finally:
+        await engine.dispose()
+    return failures
+
+
+def check(runs: int, datasets: int, users: int) -> int:
+    """Seed the scratch schema, explain every hot path and count seq scans."""
+
+    with scratch_schema(SCHEMA) as engine, Session(engine) as db:
+        owners = seed_users(db, users, datasets_per_user=max(1, datasets // users))
+        seed_runs(db, owners, runs, status="completed")
+        seed_runs(db, owners, max(1, runs // 100), status="queued", sweep_share=0.5)
+        seed_runs(db, owners, users, status="running")
+        analyze(db)
+
+        failures = asyncio.run(check_api_paths(SCHEMA, owners[1].id))
+
+        worker = TrainingWorker(
+            work_base_dir=Path(tempfile.mkdtemp()),
+            capacity=ResourceEstimate(memory_mb=10**9, threads=10**6),
+        )
+        with record_statements(engine) as statements:
+            worker._claim_run(db)
+        for statement, parameters in statements:
+            plan = [
+                row[0]
+                for row in db.connection().exec_driver_sql(f"EXPLAIN {statement}", parameters)
+            ]
+            failures += report("claim_run", statement, plan)
+        db.rollback()
+    return failures
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=200_000)
+    parser.add_argument("--datasets", type=int, default=50_000)
+    parser.add_argument("--users", type=int, default=100)
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    failures = check(args.runs, args.datasets, args.users)
+    print(f"{failures} statement(s) fell back to sequential scans")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+"""Scratch Postgres schemas and seed data for database benchmarks."""
+
+from __future__ import annotations
+
+import tempfile
+from collections import Counter
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, List, Sequence
+
+import httpx
+from sqlalchemy import Engine, create_engine, insert, text
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+
+from app.auth.cache import principal_cache
+from app.config import settings
+from app.core.query_stats import instrument_engine
+from app.db import models
+from app.db.base import Base
+from app.db.session import get_async_database_url
+from app.dependencies import get_db
+from app.main import create_application
+from app.models_registry.registry import seed_default_templates
+
+INSERT_BATCH = 10_000
+
+
+@contextmanager
+def scratch_schema(schema: str, database_url: str | None = None) -> Iterator[Engine]:
+    """Create the app tables in a throwaway schema and drop it afterwards."""
+
+    engine = create_engine(
+        database_url or settings.DATABASE_URL,
+        connect_args={"options": f"-csearch_path={schema}"},
+    )
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+        conn.execute(text(f"CREATE SCHEMA {schema}"))
+        Base.metadata.create_all(conn)
+    try:
+        yield engine
+    finally:
+        with engine.begin() as conn:
+            conn.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+        engine.dispose()
+
+
+def async_scratch_engine(schema: str) -> AsyncEngine:
+    """Return an asyncpg engine whose sessions see ``schema`` first."""
+
+    return create_async_engine(
+        get_async_database_url(),
+        connect_args={"server_settings": {"search_path": schema}},
+    )
+
+
+@asynccontextmanager
+async def scratch_api(schema: str) -> AsyncIterator[httpx.AsyncClient]:
+    """Serve the app in-process from a throwaway schema and data directory.
+
+    Requests get their sessions from ``schema`` instead of the configured
+    tables, uploads land in a temporary ``DATA_DIR``, and both are removed on
+    exit. Statements are counted, so ``count_queries`` sees each request.
+    """
+
+    with scratch_schema(schema) as engine, tempfile.TemporaryDirectory(
+        prefix="pulseml-scratch-"
+    ) as data_dir:
+        with Session(engine) as db:
+            seed_default_templates(db)
+        api_engine = async_scratch_engine(schema)
+        instrument_engine(api_engine.sync_engine, "api", settings.SLOW_QUERY_MS)
+        sessions = async_sessionmaker(bind=api_engine, autoflush=False, expire_on_commit=False)
+
+        async def get_scratch_db():
+            async with sessions() as db:
+                yield db
+
+        app = create_application()
+        app.dependency_overrides[get_db] = get_scratch_db
+        data_dir_before = settings.DATA_DIR
+        settings.DATA_DIR = data_dir
+        # Cached principals may belong to another schema
+        principal_cache.clear()
+        try:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://scratch") as client:
+                yield client
+        finally:
+            settings.DATA_DIR = data_dir_before
+            principal_cache.clear()
+            await api_engine.dispose()
+
+
+def _insert(db: Session, model: type, rows: Sequence[Dict[str, Any]]) -> None:
+    for start in range(0, len(rows), INSERT_BATCH):
+        db.execute(insert(model), rows[start : start + INSERT_BATCH])
+
+
+def seed_users(db: Session, count: int, datasets_per_user: int = 1) -> List[models.User]:
+    """Add ``count`` users with ``datasets_per_user`` datasets each."""
+
+    seed_default_templates(db)
+    users = [models.User(email=f"bench{i}@example.com", password_hash="x") for i in range(count)]
+    db.add_all(users)
+    db.commit()
+    _insert(
+        db,
+        models.Dataset,
+        [
+            {
+                "owner_id": user.id,
+                "name": f"bench-{i}",
+                "file_path": "/dev/null",
+                "meta": {"n_rows": 100_000, "n_columns": 8, "columns": [], "suggested_roles": {}},
+            }
+            for user in users
+            for i in range(datasets_per_user)
+        ],
+    )
+    db.commit()
+    return users
+
+
+def seed_runs(
+    db: Session,
+    users: Sequence[models.User],
+    rows: int,
+    status: str = "queued",
+    sweep_share: float = 0.0,
+) -> None:
+    """Add ``rows`` runs; ``sweep_share`` of them belong to the first user."""
+
+    template = db.query(models.ModelTemplate).filter(models.ModelTemplate.name == "TCN").one()
+    dataset_of = dict(db.query(models.Dataset.owner_id, models.Dataset.id).all())
+    sweep_rows = int(rows * sweep_share)
+    others = max(1, len(users) - 1)
+    queue_seq: Counter = Counter()
+    batch: List[Dict[str, Any]] = []
+    for i in range(rows):
+        owner = users[0] if i < sweep_rows else users[1 + i % others if len(users) > 1 else 0]
+        queue_seq[owner.id] += 1
+        batch.append(
+            {
+                "owner_id": owner.id,
+                "dataset_id": dataset_of[owner.id],
+                "model_template_id": template.id,
+                "status": status,
+                "priority": 0,
+                "queue_seq": queue_seq[owner.id] if status in models.WAITING_STATUSES else 0,
+                "hparams": {"levels": 1 + i % 6, "batch_size": 64, "epochs": 1 + i % 50},
+            }
+        )
+    _insert(db, models.TrainingRun, batch)
+    db.commit()
+
+
+def analyze(db: Session) -> None:
+    """Refresh planner statistics after seeding."""
+
+    db.execute(text("ANALYZE"))
+    db.commit()
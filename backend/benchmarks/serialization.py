@@ -0,0 +1,140 @@
+"""Compare response serialization paths on large run and dataset payloads.
+
+Builds ``--runs`` run rows and a dataset with ``--columns`` columns in memory,
+then times the old path (``model_validate`` per row, ``jsonable_encoder``
+and stdlib ``json``) against ``app.core.responses`` (one ``TypeAdapter``
+call plus orjson). It also reports the gzip and zstd compressed sizes of
+each body. No database is needed.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.serialization --runs 10000 --columns 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List
+
+from fastapi.encoders import jsonable_encoder
+
+from app.core.responses import list_response, model_response
+from app.datasets.schemas import DatasetPreview
+from app.training.schemas import TrainingRunRead, TrainingRunSummary
+
+
+def make_runs(count: int) -> List[SimpleNamespace]:
+    started = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    return [
+        SimpleNamespace(
+            id=i,
+            owner_id=1,
+            dataset_id=1 + i % 20,
+            model_template_id=1 + i % 3,
+            status="completed",
+            priority=0,
+            hparams={"levels": 1 + i % 6, "batch_size": 64, "epochs": 1 + i % 50, "lr": 1e-3},
+            best_metric_name="val_loss",
+            best_metric_value=0.1 + i * 1e-5,
+            model_checkpoint_path=f"/app/data/runs/{i}/best.pt",
+            logs_path=f"/app/data/runs/{i}/metrics.csv",
+            metrics_summary={"rmse": 0.31, "mse": 0.096, "mae": 0.22, "mape": 4.1},
+            device="cuda",
+            current_epoch=50,
+            total_epochs=50,
+            created_at=started + timedelta(minutes=i),
+            started_at=started + timedelta(minutes=i, seconds=5),
+            finished_at=started + timedelta(minutes=i + 3),
+            error_message=None,
+        )
+        for i in range(count)
+    ]
+
+
+def make_preview(columns: int, rows: int = 20) -> Dict[str, Any]:
+    names = [f"sensor_{c}" for c in range(columns)]
+    return {
+        "dataset": {
+            "id": 1,
+            "owner_id": 1,
+            "name": "wide",
+            "description": None,
+            "type": "csv",
+            "created_at": datetime(2025, 1, 1, tzinfo=timezone.utc),
+            "meta": {
+                "n_rows": 1_000_000,
+                "n_columns": columns,
+                "columns": [
+                    {
+                        "name": name,
+                        "dtype": "float64",
+                        "missing_pct": 0.0,
+                        "role": "feature",
+                        "stats": {"mean": 0.5, "std": 0.29, "min": 0.0, "max": 1.0},
+                    }
+                    for name in names
+                ],
+                "suggested_roles": {name: "feature" for name in names},
+            },
+        },
+        "preview": [{name: r * 0.001 + c for c, name in enumerate(names)} for r in range(rows)],
+    }
+
+
+def timed(func: Callable[[], bytes], repeat: int) -> Dict[str, Any]:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = func()
+        best = min(best, time.perf_counter() - started)
+    result = {"ms": round(best * 1000, 1), "bytes": len(body)}
+    result["gzip_bytes"] = len(gzip.compress(body, compresslevel=6))
+    try:
+        import zstandard
+
+        result["zstd_bytes"] = len(zstandard.ZstdCompressor(level=3).compress(body))
+    except ImportError:
+        pass
+    return result
+
+
+def main(argv: List[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10_000)
+    parser.add_argument("--columns", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+
+    runs = make_runs(args.runs)
+    preview = make_preview(args.columns)
+    results: Dict[str, Dict[str, Any]] = {}
+    for schema in (TrainingRunSummary, TrainingRunRead):
+        results[f"{schema.__name__} x{args.runs}"] = {
+            "stdlib": timed(
+                lambda: json.dumps(
+                    jsonable_encoder([schema.model_validate(run) for run in runs])
+                ).encode(),
+                args.repeat,
+            ),
+            "fast": timed(lambda: list_response(schema, runs).body, args.repeat),
+        }
+    results[f"DatasetPreview {args.columns} columns"] = {
+        "stdlib": timed(
+            lambda: json.dumps(jsonable_encoder(DatasetPreview.model_validate(preview))).encode(),
+            args.repeat,
+        ),
+        "fast": timed(
+            lambda: model_response(DatasetPreview.model_validate(preview)).body, args.repeat
+        ),
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Measure Transformer training step time and memory versus sequence length.
+
+Each configuration runs a few forward/backward steps of ``TimeSeriesTransformer``
+on random data. On CUDA peak memory comes from ``torch.cuda.max_memory_allocated``;
+on CPU every configuration runs in its own subprocess and reports its peak RSS.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.transformer_scaling --sequence-lengths 64 256 1024 --patch-sizes 1 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List
+
+
+def _run_config(args: argparse.Namespace, sequence_length: int, patch_size: int) -> Dict[str, Any]:
+    import torch
+    import torch.nn as nn
+
+    from app.ml_engine.transformer_trainer import TimeSeriesTransformer
+
+    device = torch.device(args.device)
+    torch.manual_seed(0)
+    model = TimeSeriesTransformer(
+        input_size=args.features,
+        output_size=1,
+        sequence_length=sequence_length,
+        d_model=args.d_model,
+        num_heads=args.num_heads,
+        num_layers=args.num_layers,
+        dropout=0.0,
+        patch_size=patch_size,
+    ).to(device)
+    optimizer = torch.optim.Adam(model.parameters(), lr=1e-4)
+    criterion = nn.MSELoss()
+    x = torch.randn(args.batch_size, args.features, sequence_length, device=device)
+    y = torch.randn(args.batch_size, 1, device=device)
+
+    def step() -> None:
+        optimizer.zero_grad()
+        loss = criterion(model(x), y)
+        loss.backward()
+        optimizer.step()
+
+    for _ in range(args.warmup):
+        step()
+    if device.type == "cuda":
+        torch.cuda.synchronize(device)
+        torch.cuda.reset_peak_memory_stats(device)
+    started = time.perf_counter()
+    for _ in range(args.steps):
+        step()
+    if device.type == "cuda":
+        torch.cuda.synchronize(device)
+    elapsed = time.perf_counter() - started
+
+    if device.type == "cuda":
+        peak_mb = torch.cuda.max_memory_allocated(device) / 2**20
+    else:
+        # ru_maxrss is reported in KiB on Linux
+        peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return {
+        "sequence_length": sequence_length,
+        "patch_size": patch_size,
+        "tokens": sequence_length // patch_size,
+        "step_ms": elapsed / args.steps * 1000,
+        "samples_per_sec": args.batch_size * args.steps / elapsed,
+        "peak_memory_mb": peak_mb,
+    }
+
+
+def _run_isolated(argv: List[str], sequence_length: int, patch_size: int) -> Dict[str, Any]:
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.transformer_scaling",
+            *argv,
+            "--single",
+            str(sequence_length),
+            str(patch_size),
+        ],
+        check=True,
+        stdout=subprocess.PIPE,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sequence-lengths", type=int, nargs="+", default=[64, 128, 256, 512, 1024])
+    parser.add_argument("--patch-sizes", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--features", type=int, default=8)
+    parser.add_argument("--d-model", type=int, default=128)
+    parser.add_argument("--num-heads", type=int, default=4)
+    parser.add_argument("--num-layers", type=int, default=2)
+    parser.add_argument("--steps", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--device", default="cuda" if _cuda_available() else "cpu")
+    parser.add_argument("--single", type=int, nargs=2, help=argparse.SUPPRESS)
+    return parser.parse_args(argv)
+
+
+def _cuda_available() -> bool:
+    import torch
+
+    return torch.cuda.is_available()
+
+
+def main(argv: List[str] | None = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    args = parse_args(argv)
+    if args.single:
+        print(json.dumps(_run_config(args, *args.single)))
+        return
+
+    results = []
+    for sequence_length in args.sequence_lengths:
+        for patch_size in args.patch_sizes:
+            if patch_size > sequence_length:
+                continue
+            if args.device == "cpu":
+                result = _run_isolated(argv, sequence_length, patch_size)
+            else:
+                result = _run_config(args, sequence_length, patch_size)
+            results.append(result)
+            print(
+                f"seq={sequence_length:>5} patch={patch_size:>3} tokens={result['tokens']:>5} "
+                f"step={result['step_ms']:8.2f} ms peak={result['peak_memory_mb']:8.1f} MB",
+                file=sys.stderr,
+            )
+    print(json.dumps({"device": args.device, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
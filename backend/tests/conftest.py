@@ -0,0 +1,27 @@
+"""Shared pytest setup for the backend tests."""
+
+import os
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+# Settings are read when app modules are imported
+os.environ.setdefault("SECRET_KEY", "pulseml-tests")
+
+
+@pytest.fixture(scope="session")
+def postgres() -> str:
+    """Return ``DATABASE_URL``, skipping the test when Postgres is unreachable."""
+
+    from app.config import settings
+
+    engine = create_engine(settings.DATABASE_URL, connect_args={"connect_timeout": 3})
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    except OperationalError as e:
+        pytest.skip(f"Postgres is unreachable: {e.orig}")
+    finally:
+        engine.dispose()
+    return settings.DATABASE_URL
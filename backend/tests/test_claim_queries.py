@@ -0,0 +1,35 @@
+"""Database query budget of the worker's claim path."""
+
+import tempfile
+from pathlib import Path
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.query_stats import assert_max_queries, instrument_engine
+from app.ml_engine.registry import ResourceEstimate
+from app.ml_engine.worker import TrainingWorker
+from benchmarks.scratch import scratch_schema, seed_runs, seed_users
+
+SCHEMA = "pulseml_test_claim"
+
+# Window, datasets, templates, running counts, the status update and the refresh
+CLAIM_BUDGET = 6
+
+
+def test_claim_run_stays_within_query_budget(postgres: str) -> None:
+    with scratch_schema(SCHEMA) as engine, Session(engine) as db:
+        # Many owners with a dataset each, so a lookup per candidate goes over budget
+        users = seed_users(db, 20)
+        seed_runs(db, users, 2 * settings.SCHEDULER_WINDOW, status="queued")
+        db.expunge_all()
+        instrument_engine(engine, "worker", settings.SLOW_QUERY_MS)
+
+        worker = TrainingWorker(
+            work_base_dir=Path(tempfile.mkdtemp()),
+            capacity=ResourceEstimate(memory_mb=10**9, threads=10**6),
+        )
+        with assert_max_queries(CLAIM_BUDGET, "claim_run"):
+            claimed = worker._claim_run(db)
+
+    assert claimed is not None
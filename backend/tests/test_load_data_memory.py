@@ -0,0 +1,81 @@
+"""Memory profile of the in-memory training data path."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Well above the column-resolution sample and one parser chunk
+ROWS = 1_000_000
+FEATURES = 8
+# Peak RSS growth of _load_data relative to its final float32 arrays; the
+# pandas/float64/scaler copies this path used to make peaked near 9x
+MAX_PEAK_MULTIPLE = 3
+
+# Runs in a fresh interpreter so ru_maxrss only reflects this load; the
+# imports and trainer setup happen before the baseline is taken
+_CHILD = """
+import json, resource, sys
+from pathlib import Path
+import numpy as np
+from app.ml_engine.tcn_trainer import TCNTrainer
+
+dataset = json.loads(sys.argv[1])
+trainer = TCNTrainer(
+    dataset=dataset,
+    hparams={"sequence_length": 16},
+    work_dir=Path(sys.argv[2]),
+    device="cpu",
+    run_id=0,
+    db_session=None,
+)
+before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+X_train, y_train, X_val, y_val, X_test, y_test, _, _ = trainer._load_data()
+after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({
+    "peak_growth": (after - before) * 1024,
+    "rows": len(X_train) + len(X_val) + len(X_test),
+    "float32": X_train.dtype == np.float32 and y_train.dtype == np.float32,
+    "nan": bool(np.isnan(X_train).any()),
+}))
+"""
+
+
+def _write_csv(path: Path) -> dict:
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame(
+        rng.standard_normal((ROWS, FEATURES)),
+        columns=[f"feature_{i}" for i in range(FEATURES)],
+    )
+    frame["target"] = rng.standard_normal(ROWS)
+    frame.iloc[::97, 0] = np.nan
+    frame.to_csv(path, index=False)
+    columns = [
+        {"name": name, "dtype": "float64", "role": "target" if name == "target" else "feature"}
+        for name in frame.columns
+    ]
+    return {"file_path": str(path), "meta": {"columns": columns}}
+
+
+def test_load_data_peak_memory_is_bounded(tmp_path: Path) -> None:
+    dataset = _write_csv(tmp_path / "series.csv")
+
+    output = subprocess.run(
+        [sys.executable, "-c", _CHILD, json.dumps(dataset), str(tmp_path)],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    result = json.loads(output.splitlines()[-1])
+
+    final_bytes = ROWS * (FEATURES + 1) * np.dtype(np.float32).itemsize
+    assert result["float32"]
+    assert result["rows"] == ROWS
+    assert not result["nan"]
+    assert result["peak_growth"] <= MAX_PEAK_MULTIPLE * final_bytes, (
+        f"_load_data grew peak RSS by {result['peak_growth'] / final_bytes:.1f}x its final arrays"
+    )
@@ -0,0 +1,35 @@
+"""Missing-value handling shared by the in-memory and streaming data paths."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.ml_engine.data import fill_missing_inplace, materialize_memmap, read_float32_columns
+
+FEATURES = ["feature_0", "empty"]
+
+
+@pytest.fixture
+def csv_path(tmp_path: Path) -> Path:
+    path = tmp_path / "series.csv"
+    pd.DataFrame(
+        {"feature_0": [np.nan, 1.0, np.nan, 3.0], "empty": np.nan, "target": [1.0, 2.0, 3.0, 4.0]}
+    ).to_csv(path, index=False)
+    return path
+
+
+def test_both_paths_reject_an_all_nan_column(csv_path: Path, tmp_path: Path) -> None:
+    X, _ = read_float32_columns(csv_path, FEATURES, "target")
+    with pytest.raises(ValueError, match="Column 'empty' contains no values"):
+        fill_missing_inplace(X, FEATURES)
+    with pytest.raises(ValueError, match="Column 'empty' contains no values"):
+        materialize_memmap(csv_path, FEATURES, "target", tmp_path)
+
+
+def test_fill_missing_matches_pandas(csv_path: Path) -> None:
+    X, _ = read_float32_columns(csv_path, ["feature_0"], "target")
+    fill_missing_inplace(X, ["feature_0"])
+
+    np.testing.assert_array_equal(X[:, 0], [1.0, 1.0, 1.0, 3.0])
@@ -0,0 +1,13 @@
+"""Database query budgets of the main API endpoints."""
+
+import asyncio
+
+from benchmarks.query_budgets import BUDGETS, check
+
+
+def test_endpoints_stay_within_query_budgets(postgres: str) -> None:
+    # Several runs, so a query per listed row goes over budget
+    results, failures = asyncio.run(check(runs=5))
+
+    assert not failures, "\n\n".join(failures)
+    assert set(results) == set(BUDGETS)
@@ -0,0 +1,13 @@
+"""Query plans of the hot listing and claim paths."""
+
+from benchmarks.query_plans import check
+
+
+def test_hot_queries_avoid_sequential_scans(postgres: str) -> None:
+    # Large enough that the planner prefers the indexes over scanning the tables
+    failures = check(runs=50_000, datasets=5_000, users=50)
+
+    assert failures == 0, (
+        f"{failures} statement(s) ran a Seq Scan on training_runs/datasets; "
+        "see the captured plans"
+    )
@@ -0,0 +1,90 @@
+"""Fair-share rounds assigned to new training runs."""
+
+import asyncio
+from typing import List, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.db import models
+from app.ml_engine.scheduler import waiting_runs
+from app.training.schemas import TrainingRunCreate
+from app.training.service import TrainingService
+from benchmarks.scratch import async_scratch_engine, scratch_schema, seed_runs, seed_users
+
+SCHEMA = "pulseml_test_queue"
+SWEEP_RUNS = 200
+META = {
+    "columns": [
+        {"name": "feature", "role": "feature"},
+        {"name": "target", "role": "target"},
+    ]
+}
+
+
+def _seed_sweep(db: Session) -> Tuple[int, TrainingRunCreate]:
+    """Queue a sweep for one user; return their id and a payload for more runs."""
+
+    users = seed_users(db, 1)
+    seed_runs(db, users, SWEEP_RUNS, status="queued")
+    dataset = db.scalar(select(models.Dataset))
+    dataset.meta = META
+    run = db.scalar(select(models.TrainingRun).limit(1))
+    payload = TrainingRunCreate(
+        dataset_id=dataset.id, model_template_id=run.model_template_id, hparams={}
+    )
+    db.commit()
+    return dataset.owner_id, payload
+
+
+async def _create_runs(payloads: List[TrainingRunCreate], owner_id: int) -> List[int]:
+    """Create one run per payload concurrently, each in its own session."""
+
+    engine = async_scratch_engine(SCHEMA)
+
+    async def create(payload: TrainingRunCreate) -> int:
+        async with AsyncSession(engine, expire_on_commit=False) as db:
+            user = await db.get(models.User, owner_id)
+            return (await TrainingService(db).create_run(user, payload)).id
+
+    try:
+        return list(await asyncio.gather(*(create(payload) for payload in payloads)))
+    finally:
+        await engine.dispose()
+
+
+def _owner_rounds(db: Session, owner_id: int) -> List[int]:
+    return list(
+        db.scalars(
+            select(models.TrainingRun.queue_seq).where(
+                models.TrainingRun.owner_id == owner_id,
+                models.TrainingRun.status.in_(models.WAITING_STATUSES),
+            )
+        )
+    )
+
+
+def test_priority_run_jumps_the_owners_backlog(postgres: str) -> None:
+    with scratch_schema(SCHEMA) as engine, Session(engine) as db:
+        owner_id, payload = _seed_sweep(db)
+
+        [urgent_id] = asyncio.run(
+            _create_runs([payload.model_copy(update={"priority": 10})], owner_id)
+        )
+
+        db.expire_all()
+        assert waiting_runs(db, 1).one().id == urgent_id
+        rounds = _owner_rounds(db, owner_id)
+        # The sweep moved back a round instead of sharing one with the new run
+        assert len(rounds) == len(set(rounds)) == SWEEP_RUNS + 1
+
+
+def test_concurrent_submissions_get_distinct_rounds(postgres: str) -> None:
+    with scratch_schema(SCHEMA) as engine, Session(engine) as db:
+        owner_id, payload = _seed_sweep(db)
+
+        asyncio.run(_create_runs([payload] * 8, owner_id))
+
+        rounds = _owner_rounds(db, owner_id)
+        assert len(rounds) == len(set(rounds)) == SWEEP_RUNS + 8
@@ -1,5 +1,7 @@
 import axios, { AxiosHeaders } from "axios";
 
+import type { Page } from "./types";
+
 const API_BASE_URL =
   import.meta.env.VITE_API_BASE_URL ?? "http://localhost:8000/api";
 
@@ -31,6 +33,26 @@ export const apiClient = axios.create({
   baseURL: API_BASE_URL,
 });
 
+// List endpoints return one page and the cursor of the next in this header
+const NEXT_CURSOR_HEADER = "x-next-cursor";
+
+export const getPage = async <T>(url: string, cursor?: string): Promise<Page<T>> => {
+  const response = await apiClient.get<T[]>(url, { params: cursor ? { cursor } : undefined });
+  const nextCursor = response.headers[NEXT_CURSOR_HEADER];
+  return { items: response.data, nextCursor: typeof nextCursor === "string" ? nextCursor : null };
+};
+
+export const getAllPages = async <T>(url: string): Promise<T[]> => {
+  const items: T[] = [];
+  let cursor: string | undefined;
+  do {
+    const page = await getPage<T>(url, cursor);
+    items.push(...page.items);
+    cursor = page.nextCursor ?? undefined;
+  } while (cursor);
+  return items;
+};
+
 apiClient.interceptors.request.use((config) => {
   const token = getStoredToken();
   if (token) {
@@ -1,14 +1,17 @@
-import { apiClient } from "./client";
+import { apiClient, getAllPages, getPage } from "./client";
 import type {
   ColumnRoleUpdate,
   Dataset,
   DatasetPreview,
+  DatasetSummary,
+  Page,
 } from "./types";
 
-export const getDatasets = async (): Promise<Dataset[]> => {
-  const { data } = await apiClient.get<Dataset[]>("/datasets");
-  return data;
-};
+export const getDatasets = (cursor?: string): Promise<Page<DatasetSummary>> =>
+  getPage<DatasetSummary>("/datasets", cursor);
+
+export const getAllDatasets = (): Promise<DatasetSummary[]> =>
+  getAllPages<DatasetSummary>("/datasets");
 
 export const getDataset = async (id: number): Promise<DatasetPreview> => {
   const { data } = await apiClient.get<DatasetPreview>(`/datasets/${id}`);
@@ -1,16 +1,15 @@
-import { apiClient } from "./client";
-import type { TrainingMetric, TrainingRun } from "./types";
+import { apiClient, getPage } from "./client";
+import type { Page, TrainingMetric, TrainingRun, TrainingRunSummary } from "./types";
 
 export interface TrainingRunCreatePayload {
   dataset_id: number;
   model_template_id: number;
   hparams: Record<string, unknown>;
+  priority?: number;
 }
 
-export const getTrainingRuns = async (): Promise<TrainingRun[]> => {
-  const { data } = await apiClient.get<TrainingRun[]>("/training-runs");
-  return data;
-};
+export const getTrainingRuns = (cursor?: string): Promise<Page<TrainingRunSummary>> =>
+  getPage<TrainingRunSummary>("/training-runs", cursor);
 
 export const getTrainingRun = async (id: number): Promise<TrainingRun> => {
   const { data } = await apiClient.get<TrainingRun>(`/training-runs/${id}`);
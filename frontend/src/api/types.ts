@@ -25,6 +25,23 @@ export interface Dataset {
   created_at: string;
 }
 
+export interface DatasetSummary {
+  id: number;
+  owner_id: number;
+  name: string;
+  description?: string | null;
+  type: string;
+  n_rows?: number | null;
+  n_columns?: number | null;
+  created_at: string;
+}
+
+/** One keyset page of a list endpoint; pass `nextCursor` back as `cursor` for the next. */
+export interface Page<T> {
+  items: T[];
+  nextCursor: string | null;
+}
+
 export interface DatasetPreview {
   dataset: Dataset;
   preview: Record<string, unknown>[];
@@ -41,12 +58,15 @@ export interface TrainingRun {
   dataset_id: number;
   model_template_id: number;
   status: string;
+  priority: number;
   hparams: Record<string, unknown>;
   best_metric_name?: string | null;
   best_metric_value?: number | null;
   model_checkpoint_path?: string | null;
   logs_path?: string | null;
   metrics_summary?: Record<string, unknown> | null;
+  perf_summary?: Record<string, unknown> | null;
+  profile_requested?: boolean;
   device?: string | null;
   current_epoch?: number | null;
   total_epochs?: number | null;
@@ -56,6 +76,16 @@ export interface TrainingRun {
   error_message?: string | null;
 }
 
+export type TrainingRunSummary = Omit<
+  TrainingRun,
+  | "hparams"
+  | "model_checkpoint_path"
+  | "logs_path"
+  | "metrics_summary"
+  | "perf_summary"
+  | "profile_requested"
+>;
+
 export interface TrainingMetric {
   run_id: number;
   metrics: {
@@ -1,13 +1,17 @@
 import { Link } from "react-router-dom";
-import type { Dataset } from "@/api/types";
+import type { DatasetSummary } from "@/api/types";
 import Card from "@/components/ui/Card";
 import Badge from "@/components/ui/Badge";
+import LoadMoreButton from "@/components/domain/LoadMoreButton";
 
 type Props = {
-  datasets: Dataset[];
+  datasets: DatasetSummary[];
+  hasMore?: boolean;
+  loadingMore?: boolean;
+  onLoadMore?: () => void;
 };
 
-const DatasetTable = ({ datasets }: Props) => {
+const DatasetTable = ({ datasets, hasMore, loadingMore, onLoadMore }: Props) => {
   if (!datasets.length) {
     return (
       <Card title="Datasets">
@@ -38,8 +42,8 @@ const DatasetTable = ({ datasets }: Props) => {
               <td>
                 <Badge>{dataset.type}</Badge>
               </td>
-              <td align="right">{dataset.meta.n_rows ?? "—"}</td>
-              <td align="right">{dataset.meta.n_columns ?? "—"}</td>
+              <td align="right">{dataset.n_rows ?? "—"}</td>
+              <td align="right">{dataset.n_columns ?? "—"}</td>
               <td>{new Date(dataset.created_at).toLocaleString()}</td>
               <td>
                 <Link to={`/datasets/${dataset.id}`} style={{ color: "var(--color-primary)" }}>
@@ -50,6 +54,7 @@ const DatasetTable = ({ datasets }: Props) => {
           ))}
         </tbody>
       </table>
+      <LoadMoreButton hasMore={hasMore} loading={loadingMore} onLoadMore={onLoadMore} />
     </Card>
   );
 };
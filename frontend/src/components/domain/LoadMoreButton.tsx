@@ -0,0 +1,23 @@
+import Button from "@/components/ui/Button";
+
+type Props = {
+  hasMore?: boolean;
+  loading?: boolean;
+  onLoadMore?: () => void;
+};
+
+const LoadMoreButton = ({ hasMore, loading, onLoadMore }: Props) => {
+  if (!hasMore || !onLoadMore) {
+    return null;
+  }
+
+  return (
+    <div style={{ display: "flex", justifyContent: "center", marginTop: "1rem" }}>
+      <Button variant="ghost" onClick={onLoadMore} disabled={loading}>
+        {loading ? "Loading…" : "Load more"}
+      </Button>
+    </div>
+  );
+};
+
+export default LoadMoreButton;
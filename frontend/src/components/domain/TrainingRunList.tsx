@@ -1,7 +1,8 @@
 import { Link } from "react-router-dom";
-import type { TrainingRun } from "@/api/types";
+import type { TrainingRunSummary } from "@/api/types";
 import Badge from "@/components/ui/Badge";
 import Card from "@/components/ui/Card";
+import LoadMoreButton from "@/components/domain/LoadMoreButton";
 
 const statusVariant = (status: string) => {
   switch (status) {
@@ -18,10 +19,13 @@ const statusVariant = (status: string) => {
 };
 
 type Props = {
-  runs: TrainingRun[];
+  runs: TrainingRunSummary[];
+  hasMore?: boolean;
+  loadingMore?: boolean;
+  onLoadMore?: () => void;
 };
 
-const TrainingRunList = ({ runs }: Props) => {
+const TrainingRunList = ({ runs, hasMore, loadingMore, onLoadMore }: Props) => {
   if (!runs.length) {
     return (
       <Card title="Training runs">
@@ -69,6 +73,7 @@ const TrainingRunList = ({ runs }: Props) => {
           ))}
         </tbody>
       </table>
+      <LoadMoreButton hasMore={hasMore} loading={loadingMore} onLoadMore={onLoadMore} />
     </Card>
   );
 };
@@ -0,0 +1,24 @@
+import { useInfiniteQuery } from "@tanstack/react-query";
+
+import type { Page } from "@/api/types";
+
+/** Fetch a cursor-paginated list one page at a time, newest first. */
+export const usePagedQuery = <T>(
+  queryKey: readonly unknown[],
+  fetchPage: (cursor?: string) => Promise<Page<T>>,
+) => {
+  const query = useInfiniteQuery({
+    queryKey,
+    queryFn: ({ pageParam }) => fetchPage(pageParam),
+    initialPageParam: undefined as string | undefined,
+    getNextPageParam: (lastPage) => lastPage.nextCursor ?? undefined,
+  });
+
+  return {
+    items: query.data?.pages.flatMap((page) => page.items) ?? [],
+    hasMore: query.hasNextPage,
+    loadingMore: query.isFetchingNextPage,
+    loadMore: () => query.fetchNextPage(),
+    refetch: query.refetch,
+  };
+};
@@ -1,5 +1,5 @@
 import { Link } from "react-router-dom";
-import { useMutation, useQuery } from "@tanstack/react-query";
+import { useMutation } from "@tanstack/react-query";
 
 import Card from "@/components/ui/Card";
 import Button from "@/components/ui/Button";
@@ -8,26 +8,22 @@ import TrainingRunList from "@/components/domain/TrainingRunList";
 import DatasetUploadDialog from "@/components/domain/DatasetUploadDialog";
 import { getDatasets, uploadDataset } from "@/api/datasets";
 import { getTrainingRuns } from "@/api/training";
+import { usePagedQuery } from "@/hooks/usePagedQuery";
 import { useState } from "react";
 
 const DashboardPage = () => {
-  const datasetsQuery = useQuery({
-    queryKey: ["datasets"],
-    queryFn: getDatasets,
-  });
-  const runsQuery = useQuery({
-    queryKey: ["training-runs"],
-    queryFn: getTrainingRuns,
-  });
+  const datasets = usePagedQuery(["datasets"], getDatasets);
+  const runs = usePagedQuery(["training-runs"], getTrainingRuns);
   const [showUpload, setShowUpload] = useState(false);
 
   const uploadMutation = useMutation({
     mutationFn: uploadDataset,
-    onSuccess: () => datasetsQuery.refetch(),
+    onSuccess: () => datasets.refetch(),
   });
 
-  const datasetCount = datasetsQuery.data?.length ?? 0;
-  const runCount = runsQuery.data?.length ?? 0;
+  // Only loaded pages are counted; "+" marks that more exist
+  const datasetCount = `${datasets.items.length}${datasets.hasMore ? "+" : ""}`;
+  const runCount = `${runs.items.length}${runs.hasMore ? "+" : ""}`;
 
   return (
     <div className="grid" style={{ gap: "1.5rem" }}>
@@ -49,8 +45,8 @@ const DashboardPage = () => {
         </Card>
       </section>
 
-      <DatasetTable datasets={(datasetsQuery.data ?? []).slice(0, 3)} />
-      <TrainingRunList runs={(runsQuery.data ?? []).slice(0, 3)} />
+      <DatasetTable datasets={datasets.items.slice(0, 3)} />
+      <TrainingRunList runs={runs.items.slice(0, 3)} />
 
       <DatasetUploadDialog
         open={showUpload}
@@ -1,21 +1,19 @@
 import { useState } from "react";
-import { useMutation, useQuery } from "@tanstack/react-query";
+import { useMutation } from "@tanstack/react-query";
 
 import Button from "@/components/ui/Button";
 import DatasetTable from "@/components/domain/DatasetTable";
 import DatasetUploadDialog from "@/components/domain/DatasetUploadDialog";
 import { getDatasets, uploadDataset } from "@/api/datasets";
+import { usePagedQuery } from "@/hooks/usePagedQuery";
 
 const DatasetsPage = () => {
   const [showUpload, setShowUpload] = useState(false);
-  const datasetsQuery = useQuery({
-    queryKey: ["datasets"],
-    queryFn: getDatasets,
-  });
+  const datasets = usePagedQuery(["datasets"], getDatasets);
 
   const uploadMutation = useMutation({
     mutationFn: uploadDataset,
-    onSuccess: () => datasetsQuery.refetch(),
+    onSuccess: () => datasets.refetch(),
   });
 
   return (
@@ -23,7 +21,12 @@ const DatasetsPage = () => {
       <div style={{ display: "flex", justifyContent: "flex-end" }}>
         <Button onClick={() => setShowUpload(true)}>Upload dataset</Button>
       </div>
-      <DatasetTable datasets={datasetsQuery.data ?? []} />
+      <DatasetTable
+        datasets={datasets.items}
+        hasMore={datasets.hasMore}
+        loadingMore={datasets.loadingMore}
+        onLoadMore={datasets.loadMore}
+      />
       <DatasetUploadDialog
         open={showUpload}
         onClose={() => setShowUpload(false)}
@@ -6,7 +6,7 @@ import Card from "@/components/ui/Card";
 import Select from "@/components/ui/Select";
 import Button from "@/components/ui/Button";
 import HyperparamForm from "@/components/domain/HyperparamForm";
-import { getDatasets } from "@/api/datasets";
+import { getAllDatasets } from "@/api/datasets";
 import { getModelTemplates } from "@/api/templates";
 import { createTrainingRun } from "@/api/training";
 
@@ -15,7 +15,8 @@ const NewTrainingRunPage = () => {
   const [searchParams] = useSearchParams();
   const initialDatasetId = Number(searchParams.get("datasetId")) || undefined;
 
-  const datasetsQuery = useQuery({ queryKey: ["datasets"], queryFn: getDatasets });
+  // The selector lists every dataset, not just the newest page
+  const datasetsQuery = useQuery({ queryKey: ["datasets", "all"], queryFn: getAllDatasets });
   const templatesQuery = useQuery({ queryKey: ["model-templates"], queryFn: getModelTemplates });
 
   const [datasetId, setDatasetId] = useState<number | undefined>(initialDatasetId);
@@ -52,7 +53,7 @@ const NewTrainingRunPage = () => {
             <option value="">Select dataset</option>
             {(datasetsQuery.data ?? []).map((dataset) => (
               <option key={dataset.id} value={dataset.id}>
-                {dataset.name} ({dataset.meta.n_columns ?? "?"} cols)
+                {dataset.name} ({dataset.n_columns ?? "?"} cols)
               </option>
             ))}
           </Select>
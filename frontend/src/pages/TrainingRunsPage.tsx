@@ -1,14 +1,18 @@
-import { useQuery } from "@tanstack/react-query";
 import TrainingRunList from "@/components/domain/TrainingRunList";
 import { getTrainingRuns } from "@/api/training";
+import { usePagedQuery } from "@/hooks/usePagedQuery";
 
 const TrainingRunsPage = () => {
-  const runsQuery = useQuery({
-    queryKey: ["training-runs"],
-    queryFn: getTrainingRuns,
-  });
+  const runs = usePagedQuery(["training-runs"], getTrainingRuns);
 
-  return <TrainingRunList runs={runsQuery.data ?? []} />;
+  return (
+    <TrainingRunList
+      runs={runs.items}
+      hasMore={runs.hasMore}
+      loadingMore={runs.loadingMore}
+      onLoadMore={runs.loadMore}
+    />
+  );
 };
 
 export default TrainingRunsPage;